@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import job as crud_job
+from app.crud import video as crud_video
+from app.models.enums import AnalysisState
+from app.models.job import AnalysisJob
+
+logger = logging.getLogger(__name__)
+
+# video_id -> in-flight request_analysis call of this process, shared by concurrent callers
+_in_flight: Dict[str, asyncio.Future] = {}
+
+
+def job_priority(comment_count: int, incremental: bool = False) -> int:
+    """Small videos and incremental refreshes finish quickly, so they go ahead of large backfills"""
+    if incremental or comment_count < 1_000:
+        return 2
+    if comment_count < 50_000:
+        return 1
+    return 0
+
+
+async def _start_analysis(
+    db: AsyncSession,
+    video_id: str,
+    from_states: Iterable[AnalysisState],
+    incremental: bool,
+    priority: int
+) -> Optional[AnalysisJob]:
+    # Only the caller that moves the video out of `from_states` enqueues; the partial unique
+    # index on analysis_jobs still guarantees a single active job if states were edited by hand.
+    if await crud_video.transition_analysis_state(db, video_id, from_states, AnalysisState.IN_PROGRESS):
+        job = await crud_job.enqueue_job(
+            db, video_id, incremental=incremental, max_attempts=settings.JOB_MAX_ATTEMPTS, priority=priority
+        )
+        logger.info(f"Queued {'incremental ' if incremental else ''}analysis job {job.id} for {video_id}")
+        return job
+
+    await db.commit()  # Nothing changed; commit rather than roll back so loaded objects are not expired
+    return await crud_job.get_active_job(db, video_id)
+
+
+async def request_analysis(
+    db: AsyncSession,
+    video_id: str,
+    from_states: Iterable[AnalysisState],
+    incremental: bool = False,
+    priority: int = 0
+) -> Optional[AnalysisJob]:
+    """
+    Single-flight analysis trigger: exactly one job runs per video no matter how many requests
+    or API processes ask for it. Concurrent callers in this process share one database round
+    trip, callers in other processes lose the state transition, and all of them get back the
+    video's active job so they can follow its progress.
+    """
+    pending = _in_flight.get(video_id)
+    if pending:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[video_id] = future
+    try:
+        job = await _start_analysis(db, video_id, from_states, incremental, priority)
+        future.set_result(job)
+        return job
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark as retrieved when no other caller is waiting
+        raise
+    finally:
+        del _in_flight[video_id]
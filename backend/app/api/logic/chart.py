@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import aggregate as crud_aggregate
+from app.models.aggregate import label_column
+from app.models.enums import ChartGranularity, SentimentLabel
+from app.schemas.comment import ChartBucketSchema, ChartDataResponseSchema
+
+# Upper bound on points per chart when the granularity is picked automatically
+MAX_CHART_BUCKETS = 200
+
+_BUCKET_SECONDS = {
+    ChartGranularity.HOUR: 3600,
+    ChartGranularity.DAY: 86400,
+    ChartGranularity.WEEK: 7 * 86400,
+    ChartGranularity.MONTH: 31 * 86400,
+}
+
+
+def pick_granularity(first: Optional[datetime], last: Optional[datetime]) -> ChartGranularity:
+    """Finest granularity that covers first..last in at most MAX_CHART_BUCKETS buckets"""
+    span = (last - first).total_seconds() if first and last else 0
+    for granularity, seconds in _BUCKET_SECONDS.items():
+        if span / seconds < MAX_CHART_BUCKETS:
+            return granularity
+    return ChartGranularity.MONTH
+
+
+async def get_chart_data(
+    db: AsyncSession,
+    video_id: str,
+    granularity: Optional[ChartGranularity] = None,
+    days: Optional[int] = None
+) -> ChartDataResponseSchema:
+    """
+    Sentiment counts per time bucket, read from the precomputed rollups. The payload grows with
+    the number of buckets, not comments. Without a granularity one is picked from the time span.
+    With `days`, the bucket containing the start of the range is included whole.
+    """
+    since = datetime.utcnow() - timedelta(days=days) if days else None
+
+    if granularity is None:
+        first, last = await crud_aggregate.get_rollup_range(db, video_id, since)
+        granularity = pick_granularity(first, last)
+
+    rollups = await crud_aggregate.get_rollup_buckets(db, video_id, granularity, since)
+    buckets = [
+        ChartBucketSchema(
+            bucket_start=rollup.bucket_start.replace(tzinfo=timezone.utc),
+            average_score=rollup.score_sum / rollup.total if rollup.total else 0.0,
+            **{label.value: getattr(rollup, label_column(label)) for label in SentimentLabel},
+        )
+        for rollup in rollups
+    ]
+    return ChartDataResponseSchema(video_id=video_id, granularity=granularity, buckets=buckets)
@@ -1,71 +1,258 @@
 import logging
 import asyncio
 from collections import Counter
+from contextlib import aclosing
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.crud import aggregate as crud_aggregate
+from app.crud import checkpoint as crud_checkpoint
 from app.crud import comment as crud_comment
 from app.crud import video as crud_video
-from app.core.integrations.youtube.youtube_client import fetch_video_comments
-from app.core.sentiment.sentiment import analyze_text
+from app.core.integrations.youtube.async_youtube_client import youtube_client
+from app.core.sentiment.executor import analyze_batch_async
 from app.models.enums import AnalysisState, SentimentLabel
 
 logger = logging.getLogger(__name__)
 
+_SENTIMENT_LABELS = {
+    "positive": SentimentLabel.POSITIVE,
+    "neutral": SentimentLabel.NEUTRAL,
+    "negative": SentimentLabel.NEGATIVE,
+    "ambiguous": SentimentLabel.AMBIGUOUS,
+}
 
-async def analyze_all_comments(db: AsyncSession, video_id: str):
+
+# Sentinel closing a stage queue
+_END = object()
+
+
+class AnalysisAborted(Exception):
+    """Raised by a pipeline stage when analysis must stop and be marked as failed."""
+
+
+async def _fetch_pages(
+    video_id: str,
+    pages: asyncio.Queue,
+    watermark: Optional[datetime] = None,
+    page_token: Optional[str] = None,
+    max_pages: Optional[int] = None
+) -> bool:
+    """
+    Stage 1: fetches comment pages ahead of inference, blocking when the queue is full.
+    Each page travels with the token of the page after it, so later stages can checkpoint.
+    With a watermark only comments published since then are fetched, newest first.
+
+    Stops after `max_pages` pages and returns True when pages remain for a later slice.
+    """
+    next_page = page_token
+    fetched = 0
+    try:
+        if watermark:
+            async with aclosing(youtube_client.iter_new_comment_pages(video_id, watermark)) as comment_pages:
+                async for comments in comment_pages:
+                    await pages.put((comments, None))
+        else:
+            comment_pages = youtube_client.iter_comment_pages(video_id, page_token=page_token, max_pages=max_pages)
+            async with aclosing(comment_pages):
+                async for comments, next_page in comment_pages:
+                    if not comments:
+                        logger.warning(f"[BG] No comments fetched for {video_id} (page: {next_page})")
+                        raise AnalysisAborted("empty page")
+
+                    await pages.put((comments, next_page))
+                    fetched += 1
+    except AnalysisAborted:
+        raise
+    except Exception as e:
+        logger.exception(f"[BG] Failed to fetch comments for video {video_id} (page: {next_page})")
+        raise AnalysisAborted("fetch failed") from e
+
+    await pages.put(_END)
+    return bool(max_pages and fetched >= max_pages and next_page)
+
+
+async def _score_comments(video_id: str, comments: List[dict]) -> List[Tuple[dict, dict]]:
+    """
+    Scores a page as one batch. When the batch fails, its comments are scored one at a time
+    so only the comments that fail on their own are skipped. Raises AnalysisAborted when no
+    comment of the page can be scored.
+    """
+    try:
+        sentiments = await analyze_batch_async([comment["text"] for comment in comments])
+        return list(zip(comments, sentiments))
+    except Exception:
+        logger.exception(f"[BG] Error analyzing comment page for video {video_id}, retrying one comment at a time")
+
+    scored_comments = []
+    for comment in comments:
+        try:
+            sentiments = await analyze_batch_async([comment["text"]])
+        except Exception:
+            logger.exception(f"[BG] Error analyzing comment: {comment.get('text', '')[:30]}...")
+            continue
+        scored_comments.append((comment, sentiments[0]))
+
+    if not scored_comments:
+        # Nothing on the page could be scored: the executor itself is failing, let the job retry
+        raise AnalysisAborted("inference failed")
+    return scored_comments
+
+
+async def _score_pages(video_id: str, pages: asyncio.Queue, scored: asyncio.Queue):
+    """Stage 2: runs each fetched page through the sentiment executor as one batch."""
+    while (page := await pages.get()) is not _END:
+        comments, next_page = page
+        scored_comments = await _score_comments(video_id, comments)
+
+        for _, sentiment in scored_comments:
+            sentiment["label"] = _SENTIMENT_LABELS.get(sentiment["label"], SentimentLabel.NEUTRAL)
+
+        await scored.put((scored_comments, next_page))
+
+    await scored.put(_END)
+
+
+async def _persist_pages(
+    db: AsyncSession,
+    video_id: str,
+    scored: asyncio.Queue,
+    total_analyzed: int = 0,
+    sentiment_totals: Optional[Dict[str, int]] = None,
+    incremental: bool = False
+) -> int:
+    """
+    Stage 3: buffers scored comments and writes them in bulk, reporting progress after each flush.
+
+    Full runs store the next page token and running totals in the same transaction as every
+    batch, so a restarted run continues from there. The token is the one following the last
+    page in the batch, and a batch that fails to save aborts the run, so the checkpoint never
+    moves past a page that was not persisted. Incremental runs add only newly inserted
+    comments to the running total.
+    """
+    sentiment_totals = Counter(sentiment_totals or {})
+    buffer = []
+    next_page = None
+
+    async def flush():
+        nonlocal total_analyzed
+        batch_totals = Counter(sentiment["label"].value for _, sentiment in buffer)
+        try:
+            if not incremental:
+                await crud_checkpoint.stage_checkpoint(
+                    db,
+                    video_id,
+                    next_page,
+                    total_analyzed + len(buffer),
+                    dict(sentiment_totals + batch_totals)
+                )
+            inserted, updated = await crud_comment.bulk_upsert_comments(db, video_id, buffer)
+        except Exception as e:
+            # Discard the staged checkpoint with the batch, so a resumed run fetches these pages again
+            await db.rollback()
+            logger.exception(f"[BG] Error saving {len(buffer)} comments for video {video_id}")
+            raise AnalysisAborted("save failed") from e
+
+        sentiment_totals.update(batch_totals)
+        total_analyzed += inserted if incremental else len(buffer)
+        buffer.clear()
+
+        # Events carry the video's stored totals, as the progress snapshot does; the run's own
+        # counter starts at zero on a rerun and counts re-analysed comments again
+        aggregate = await crud_aggregate.get_aggregate(db, video_id)
+        await crud_video.update_video_analysis_state(
+            db,
+            video_id,
+            AnalysisState.IN_PROGRESS,
+            total_analyzed=total_analyzed,
+            sentiment_totals=aggregate.sentiment_totals() if aggregate else None
+        )
+        logger.debug(
+            f"[BG] Flushed comments for {video_id} ({inserted} inserted, {updated} updated), "
+            f"total analyzed: {total_analyzed}"
+        )
+
+    while (page := await scored.get()) is not _END:
+        scored_comments, next_page = page
+        buffer.extend(scored_comments)
+        if len(buffer) >= settings.ANALYSIS_FLUSH_SIZE:
+            await flush()
+
+    if buffer:
+        await flush()
+
+    return total_analyzed
+
+
+async def analyze_all_comments(
+    db: AsyncSession,
+    video_id: str,
+    incremental: bool = False,
+    max_pages: Optional[int] = None
+) -> AnalysisState:
+    """
+    Analyzes every comment of a video as a three-stage pipeline (fetch -> infer -> persist)
+    connected by bounded queues, so the YouTube API, the sentiment workers and the database
+    work concurrently and a slow stage applies backpressure to the ones before it.
+
+    A full run resumes from the video's checkpoint when an earlier run was interrupted.
+    In incremental mode the newest stored comment is used as a watermark and only comments
+    published after it are fetched and scored; without stored comments it runs a full analysis.
+
+    `max_pages` bounds a full run to one time slice: it stops after that many pages with the
+    checkpoint in place and returns IN_PROGRESS; otherwise the final analysis state is returned.
+    """
     try:
-        logger.info(f"[BG] Starting analysis for video {video_id}")
+        watermark = await crud_comment.get_latest_comment_date(db, video_id) if incremental else None
+        checkpoint = None if watermark else await crud_checkpoint.get_checkpoint(db, video_id)
+        if checkpoint and not checkpoint.next_page_token:
+            checkpoint = None  # Every page was already written, start over
+
+        total_analyzed, sentiment_totals, page_token = 0, None, None
+        if watermark:
+            video = await crud_video.get_video_by_id(db, video_id)
+            total_analyzed = video.total_analyzed if video else 0
+            logger.info(f"[BG] Starting incremental analysis for video {video_id} (since {watermark})")
+        elif checkpoint:
+            total_analyzed = checkpoint.total_analyzed
+            sentiment_totals = checkpoint.sentiment_totals
+            page_token = checkpoint.next_page_token
+            logger.info(f"[BG] Resuming analysis for video {video_id} at {total_analyzed} comments")
+        else:
+            logger.info(f"[BG] Starting analysis for video {video_id}")
         await crud_video.update_video_analysis_state(db, video_id, AnalysisState.IN_PROGRESS)
 
-        next_page = None
-        total_analyzed = 0
-        sentiment_totals = Counter()
-
-        while True:
-            await asyncio.sleep(1)  # Respect API rate limits
-
-            try:
-                comments, next_page = fetch_video_comments(video_id, page_token=next_page)
-            except Exception:
-                logger.exception(f"[BG] Failed to fetch comments for video {video_id} (page: {next_page})")
-                await crud_video.update_video_analysis_state(db, video_id, AnalysisState.FAILED)
-                return
-
-            if not comments:
-                logger.warning(f"[BG] No comments fetched for {video_id} (page: {next_page})")
-                await crud_video.update_video_analysis_state(db, video_id, AnalysisState.FAILED)
-                return
-
-            for comment in comments:
-                try:
-                    sentiment = analyze_text(comment["text"])
-                    sentiment_label = {
-                        "positive": SentimentLabel.POSITIVE,
-                        "neutral": SentimentLabel.NEUTRAL,
-                        "negative": SentimentLabel.NEGATIVE,
-                        "ambiguous": SentimentLabel.AMBIGUOUS,
-                    }.get(sentiment["label"], SentimentLabel.NEUTRAL)
-
-                    sentiment["label"] = sentiment_label
-                    await crud_comment.save_comment(db, video_id, comment, sentiment)
-
-                    sentiment_totals[sentiment_label] += 1
-                    total_analyzed += 1
-                except Exception:
-                    logger.exception(f"[BG] Error analyzing/saving comment: {comment.get('text', '')[:30]}...")
-
-            await crud_video.update_video_analysis_state(
-                db,
-                video_id,
-                AnalysisState.IN_PROGRESS,
-                total_analyzed=total_analyzed
-            )
-
-            logger.debug(f"[BG] Processed {len(comments)} comments, total analyzed: {total_analyzed}")
-
-            if not next_page:
-                break
+        pages = asyncio.Queue(maxsize=settings.ANALYSIS_QUEUE_SIZE)
+        scored = asyncio.Queue(maxsize=settings.ANALYSIS_QUEUE_SIZE)
+
+        writer = asyncio.create_task(_persist_pages(
+            db, video_id, scored, total_analyzed, sentiment_totals, incremental=watermark is not None
+        ))
+        fetcher = asyncio.create_task(
+            _fetch_pages(video_id, pages, watermark, page_token, None if watermark else max_pages)
+        )
+        stages = [
+            fetcher,
+            asyncio.create_task(_score_pages(video_id, pages, scored)),
+            writer,
+        ]
+        try:
+            done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+            for stage in done:
+                stage.result()  # Re-raise the first stage failure
+        finally:
+            for stage in stages:
+                stage.cancel()
 
+        total_analyzed = writer.result()
+
+        if fetcher.result():
+            logger.info(f"[BG] Slice finished for {video_id} at {total_analyzed} comments, more pages remain")
+            return AnalysisState.IN_PROGRESS
+
+        await crud_checkpoint.clear_checkpoint(db, video_id)
         await crud_video.update_video_analysis_state(
             db,
             video_id,
@@ -74,11 +261,17 @@ async def analyze_all_comments(db: AsyncSession, video_id: str):
         )
 
         logger.info(f"[BG] Completed analysis for {video_id}. Total: {total_analyzed}")
+        return AnalysisState.COMPLETED
+
+    except AnalysisAborted:
+        await crud_video.update_video_analysis_state(db, video_id, AnalysisState.FAILED)
 
     except Exception:
         logger.exception(f"[BG] Fatal error during analysis for video {video_id}")
         await crud_video.update_video_analysis_state(db, video_id, AnalysisState.FAILED)
 
+    return AnalysisState.FAILED
+
 
 async def get_comments_paginated(
     db,
@@ -90,7 +283,8 @@ async def get_comments_paginated(
     min_likes,
     phrase,
     sort_by,
-    sort_order
+    sort_order,
+    cursor=None
 ):
     return await crud_comment.query_comments(
         db=db,
@@ -102,5 +296,6 @@ async def get_comments_paginated(
         min_likes=min_likes,
         phrase=phrase,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor
     )
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Optional
+
+from app.core.progress import progress_broker
+from app.crud import aggregate as crud_aggregate
+from app.crud import video as crud_video
+from app.db.session import AsyncSessionLocal
+from app.models.enums import AnalysisState
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_SECONDS = 15
+_FINAL_STATES = {AnalysisState.COMPLETED.value, AnalysisState.FAILED.value}
+
+
+async def _snapshot(video_id: str) -> Optional[dict]:
+    """Current progress read from the database, sent on connect and after a quiet period"""
+    async with AsyncSessionLocal() as db:
+        video = await crud_video.get_video_by_id(db, video_id)
+        if not video:
+            return None
+        aggregate = await crud_aggregate.get_aggregate(db, video_id)
+
+    sentiment_totals = aggregate.sentiment_totals() if aggregate else video.sentiment_totals
+    return {
+        "video_id": video_id,
+        "state": video.analysis_state.value,
+        "total_analyzed": video.total_analyzed,
+        "comment_count": video.comment_count,
+        "sentiment_totals": sentiment_totals,
+    }
+
+
+def _format_event(event: dict) -> str:
+    return f"event: progress\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+async def stream_progress(video_id: str) -> AsyncIterator[str]:
+    """
+    Server-sent events for one video: a snapshot first, then every progress event published by
+    the analysis. Fields missing from an event are unchanged. The stream ends after a final state.
+    """
+    async with progress_broker.subscribe(video_id) as events:
+        last = await _snapshot(video_id)
+        if last is None:
+            yield _format_event({"video_id": video_id, "state": None, "error": "Video not found"})
+            return
+        yield _format_event(last)
+
+        while last["state"] not in _FINAL_STATES:
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                # Quiet period: make sure the listener is alive and resend anything missed meanwhile
+                await progress_broker.reconnect_if_closed()
+                event = await _snapshot(video_id)
+                if event is None:
+                    return
+                if event == last:
+                    yield ": keepalive\n\n"
+                    continue
+
+            event = {key: value for key, value in event.items() if value is not None}
+            last.update(event)
+            yield _format_event(event)
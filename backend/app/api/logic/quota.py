@@ -0,0 +1,42 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.integrations.youtube.quota import QuotaTracker
+from app.crud import quota as crud_quota
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_quota(tracker: QuotaTracker):
+    """
+    Shares this process's YouTube quota spend through the database and adopts the totals of
+    every process, so key selection and /health/quota see the API and all workers together.
+    """
+    day, spent, exhausted = tracker.take_unsynced()
+    try:
+        async with AsyncSessionLocal() as db:
+            if spent or exhausted:
+                await crud_quota.add_quota_spend(db, day, spent, exhausted, tracker.daily_limit)
+            shared = await crud_quota.get_quota_spend(db, day)
+    except Exception:
+        tracker.restore_unsynced(day, spent, exhausted)
+        raise
+    tracker.merge_shared(day, shared)
+
+
+async def run_quota_sync(tracker: QuotaTracker):
+    """Syncs the tracker every YOUTUBE_QUOTA_SYNC_SECONDS until cancelled, and once more on the way out"""
+    try:
+        while True:
+            await asyncio.sleep(settings.YOUTUBE_QUOTA_SYNC_SECONDS)
+            try:
+                await sync_quota(tracker)
+            except Exception:
+                logger.exception("Failed to sync YouTube quota usage")
+    finally:
+        try:
+            await sync_quota(tracker)
+        except Exception:
+            logger.exception("Failed to sync YouTube quota usage on shutdown")
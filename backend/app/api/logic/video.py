@@ -1,5 +1,5 @@
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import BackgroundTasks
 from datetime import datetime, timedelta
 from app.utils.classify_sentiment_headline import classify_sentiment_headline
 from app.utils.metrics import (
@@ -8,34 +8,72 @@ from app.utils.metrics import (
     default_sentiment_totals,
 )
 from app.schemas.video import VideoResponse, AnalyzedVideoSummary, AnalyzedVideoList
-from app.core.integrations.youtube.youtube_client import fetch_video_data
-from app.core.sentiment.sentiment import analyze_text
+from app.core.config import settings
+from app.core.integrations.youtube.async_youtube_client import youtube_client
 from app.crud import video as crud_video
-from app.crud import comment as crud_comment
-from app.api.logic.comment import analyze_all_comments
+from app.crud import aggregate as crud_aggregate
+from app.crud import job as crud_job
+from app.api.logic.analysis import job_priority, request_analysis
 from app.models.enums import EngagementLevel, AnalysisState, SentimentHeadline
 from app.crud.video import get_analyzed_videos_paginated
-from app.crud.comment import get_sentiment_totals
+from app.models.aggregate import VideoAggregate
 import logging
 
 logger = logging.getLogger(__name__)
 
 YOUTUBE_METADATA_TTL = timedelta(seconds=5)
-SENTIMENT_STATS_TTL = timedelta(seconds=15)
-
-
-async def get_or_create_video(video_id: str, db: AsyncSession, background_tasks: BackgroundTasks) -> VideoResponse:
+ANALYSIS_REFRESH_INTERVAL = timedelta(seconds=settings.ANALYSIS_REFRESH_INTERVAL)
+
+
+def _sentiment_stats(aggregate: VideoAggregate, engagement_rate: float) -> dict:
+    """Video sentiment fields derived from its running totals"""
+    sentiment_totals = aggregate.sentiment_totals()
+    controversiality = compute_controversiality(sentiment_totals)
+    avg_score = round(aggregate.average_score, 3)
+
+    return {
+        "sentiment_totals": sentiment_totals,
+        "controversiality_score": controversiality,
+        "sentiment_headline": classify_sentiment_headline(
+            sentiment_totals=sentiment_totals,
+            avg_score=avg_score,
+            controversiality=controversiality,
+            engagement_rate=engagement_rate
+        ),
+        "average_sentiment_score": avg_score,
+        "average_comment_length": round(aggregate.average_length, 1),
+    }
+
+
+async def get_or_create_video(video_id: str, db: AsyncSession) -> VideoResponse:
     try:
         video = await crud_video.get_video_by_id(db, video_id)
         now = datetime.utcnow()
 
         if video:
+            analysis_job = None
             if video.analysis_state in {AnalysisState.PENDING, AnalysisState.FAILED}:
-                background_tasks.add_task(analyze_all_comments, db, video_id)
+                analysis_job = await request_analysis(
+                    db, video_id,
+                    from_states={AnalysisState.PENDING, AnalysisState.FAILED},
+                    priority=job_priority(video.comment_count)
+                )
+            elif video.analysis_state == AnalysisState.COMPLETED and (
+                video.last_analyzed_at is None or (now - video.last_analyzed_at) > ANALYSIS_REFRESH_INTERVAL
+            ):
+                # Pick up comments posted since the last run
+                analysis_job = await request_analysis(
+                    db, video_id,
+                    from_states={AnalysisState.COMPLETED},
+                    incremental=True,
+                    priority=job_priority(video.comment_count, incremental=True)
+                )
+            elif video.analysis_state == AnalysisState.IN_PROGRESS:
+                analysis_job = await crud_job.get_active_job(db, video_id)
 
             # Refresh YouTube metadata
             if (now - video.meta_last_update) > YOUTUBE_METADATA_TTL:
-                yt_data = fetch_video_data(video_id)
+                yt_data = await youtube_client.fetch_video_data(video_id)
                 stats = yt_data.get("statistics", {})
 
                 view_count = int(stats.get("viewCount", 0))
@@ -52,36 +90,22 @@ async def get_or_create_video(video_id: str, db: AsyncSession, background_tasks:
                     "meta_last_update": now
                 })
 
-            # Refresh sentiment stats
-            if (now - video.sentiment_last_update) > SENTIMENT_STATS_TTL:
-                raw_totals = await get_sentiment_totals(db, video_id)
-                sentiment_totals = {label.value: count for label, count in raw_totals.items()}
-                controversiality = compute_controversiality(sentiment_totals)
-
-                comment_metrics = await crud_comment.get_comment_analysis_metrics(db, video_id)
-                avg_score = round(comment_metrics.get("average_sentiment_score", 0.0), 3)
-                avg_length = round(comment_metrics.get("average_comment_length", 0.0), 1)
-
-                smart_label = classify_sentiment_headline(
-                    sentiment_totals=sentiment_totals,
-                    avg_score=avg_score,
-                    controversiality=controversiality,
-                    engagement_rate=video.engagement_rate
-                )
-
+            # Sentiment stats come from running totals maintained with every comment batch
+            aggregate = await crud_aggregate.get_aggregate(db, video_id)
+            if aggregate is None and video.total_analyzed:
+                aggregate = await crud_aggregate.rebuild_aggregate(db, video_id)  # Analyzed before totals existed
+            if aggregate and aggregate.updated_at > video.sentiment_last_update:
                 await crud_video.update_video(db, video_id, {
-                    "sentiment_totals": sentiment_totals,
-                    "controversiality_score": controversiality,
-                    "sentiment_headline": smart_label,
-                    "average_sentiment_score": avg_score,
-                    "average_comment_length": avg_length,
-                    "sentiment_last_update": now
+                    **_sentiment_stats(aggregate, video.engagement_rate),
+                    "sentiment_last_update": aggregate.updated_at
                 })
-                
-            return VideoResponse.model_validate(video)
+
+            response = VideoResponse.model_validate(video)
+            response.analysis_job_id = analysis_job.id if analysis_job else None
+            return response
 
         # Create new video if not found
-        yt_data = fetch_video_data(video_id)
+        yt_data = await youtube_client.fetch_video_data(video_id)
         snippet = yt_data.get("snippet", {})
         stats = yt_data.get("statistics", {})
 
@@ -120,7 +144,7 @@ async def get_or_create_video(video_id: str, db: AsyncSession, background_tasks:
             "engagement_level": EngagementLevel.MEDIUM,
             "trend": "New",
             "trend_explanation": "First analysis",
-            "analysis_state": AnalysisState.IN_PROGRESS,
+            "analysis_state": AnalysisState.PENDING,
             "total_analyzed": 0,
             "sentiment_totals": initial_totals,
             "controversiality_score": controversiality,
@@ -129,18 +153,26 @@ async def get_or_create_video(video_id: str, db: AsyncSession, background_tasks:
             "last_update": now
         }
 
-        await crud_video.create_video(db, video_data)
-        background_tasks.add_task(analyze_all_comments, db, video_id)
+        # Concurrent first requests all insert; one row wins and every caller then goes through the
+        # single-flight trigger, so they share the one job started for the video
+        await crud_video.insert_video_if_absent(db, video_data)
+        analysis_job = await request_analysis(
+            db, video_id, from_states={AnalysisState.PENDING}, priority=job_priority(comment_count)
+        )
 
-        return VideoResponse.model_validate(await crud_video.get_video_by_id(db, video_id))
+        response = VideoResponse.model_validate(await crud_video.get_video_by_id(db, video_id))
+        response.analysis_job_id = analysis_job.id if analysis_job else None
+        return response
 
     except Exception:
         logger.exception(f"Error processing video_id={video_id}")
         raise
 
 
-async def get_paginated_video_list(db: AsyncSession, offset: int, limit: int) -> AnalyzedVideoList:
-    videos, total = await get_analyzed_videos_paginated(db, offset, limit)
+async def get_paginated_video_list(
+    db: AsyncSession, offset: int, limit: int, cursor: Optional[str] = None
+) -> AnalyzedVideoList:
+    videos, total, next_cursor = await get_analyzed_videos_paginated(db, offset, limit, cursor)
 
     return AnalyzedVideoList(
         videos=[
@@ -161,5 +193,6 @@ async def get_paginated_video_list(db: AsyncSession, offset: int, limit: int) ->
         offset=offset,
         limit=limit,
         total=total,
-        has_more=(offset + len(videos)) < total
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor
     )
@@ -1,16 +1,21 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.logic.chart import get_chart_data
 from app.db.session import get_db
+from app.models.enums import ChartGranularity
 from app.utils.text_utils import extract_video_id
-from app.crud.comment import get_chart_comments
-from app.schemas.comment import ChartCommentsResponseSchema, ChartCommentSchema
+from app.schemas.comment import ChartDataResponseSchema
 
 router = APIRouter()
 
-@router.get("/chart-data", response_model=ChartCommentsResponseSchema)
+@router.get("/chart-data", response_model=ChartDataResponseSchema)
 async def fetch_chart_data_by_url(
     url: str = Query(..., description="YouTube video URL"),
+    bucket: Optional[ChartGranularity] = Query(None, description="hour, day, week or month; picked from the time span when omitted"),
+    days: Optional[int] = Query(None, ge=1, description="Only comments published in the last N days"),
     db: AsyncSession = Depends(get_db)
 ):
     try:
@@ -18,18 +23,9 @@ async def fetch_chart_data_by_url(
         if not video_id:
             raise HTTPException(status_code=400, detail="Invalid YouTube video URL")
 
-        rows = await get_chart_comments(db, video_id)
-
-        chart_comments = [
-            ChartCommentSchema(
-                id=row[0],
-                published_at=row[1].isoformat(),
-                sentiment_label=row[2]
-            )
-            for row in rows
-        ]
-
-        return ChartCommentsResponseSchema(video_id=video_id, comments=chart_comments)
+        return await get_chart_data(db, video_id, granularity=bucket, days=days)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch chart data: {str(e)}")
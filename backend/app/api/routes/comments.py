@@ -1,15 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from collections import Counter
 
 from app.api.logic.comment import get_comments_paginated
 from app.schemas.comment import CommentsResponseSchema, CommentSchema
 from app.db.session import get_db
-from app.models.enums import SentimentLabel
-from app.models.comment import CommentModel
 from app.utils.text_utils import extract_video_id
-from sqlalchemy import select
+from app.utils.cursor import InvalidCursor
 
 router = APIRouter()
 
@@ -22,9 +19,10 @@ async def fetch_comments_by_url(
     sentiment: Optional[str] = Query(None),
     author: Optional[str] = Query(None),
     min_likes: Optional[int] = Query(None, ge=0),
-    phrase: Optional[str] = Query(None, description="Filter by phrase in comment"),
-    sort_by: str = Query("published_at"),
+    phrase: Optional[str] = Query(None, description="Search comment text: whole words with quotes, OR and -word, or the phrase as a plain substring"),
+    sort_by: str = Query("published_at", description="published_at, like_count, sentiment, or relevance (with phrase)"),
     sort_order: str = Query("desc"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (replaces offset)"),
     db: AsyncSession = Depends(get_db)
 ):
     try:
@@ -32,7 +30,7 @@ async def fetch_comments_by_url(
         if not video_id:
             raise HTTPException(status_code=400, detail="Invalid YouTube video URL")
 
-        # Fetch main paginated response
+        # Page, filtered totals and per-label counts come back from a single query
         response = await get_comments_paginated(
             db=db,
             video_id=video_id,
@@ -43,32 +41,15 @@ async def fetch_comments_by_url(
             min_likes=min_likes,
             sort_by=sort_by,
             sort_order=sort_order,
-            phrase=phrase
+            phrase=phrase,
+            cursor=cursor
         )
 
-        # Fetch sentiment totals for the filtered result set (no pagination)
-        base_query = select(CommentModel.sentiment_label).where(CommentModel.video_id == video_id)
-
-        if sentiment:
-            base_query = base_query.where(CommentModel.sentiment_label == SentimentLabel(sentiment))
-        if author:
-            base_query = base_query.where(CommentModel.author.ilike(f"%{author}%"))
-        if min_likes is not None:
-            base_query = base_query.where(CommentModel.like_count >= min_likes)
-        if phrase:
-            base_query = base_query.where(CommentModel.text.ilike(f"%{phrase}%"))
-
-        result = await db.execute(base_query)
-        sentiment_counts = Counter(row[0] for row in result.all())
-
-        sentiment_totals = {
-            label: sentiment_counts.get(label, 0)
-            for label in SentimentLabel
-        }
-
-        response.sentiment_totals = sentiment_totals
-
         return response
 
+    except HTTPException:
+        raise
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,56 @@
+import logging
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.logic.quota import sync_quota
+from app.core.config import settings
+from app.core.integrations.youtube.async_youtube_client import youtube_client
+from app.core.sentiment.executor import is_ready as sentiment_ready, warmup_error
+from app.db.session import get_db
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/health/live")
+async def liveness():
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+async def readiness(db: AsyncSession = Depends(get_db)):
+    """
+    Reports whether this process can serve traffic: the database must answer,
+    and when SENTIMENT_WARMUP is enabled the sentiment workers must have loaded the model.
+    A failed model load is reported as "failed" rather than "starting".
+    """
+    checks = {"database": True, "sentiment_model": sentiment_ready() or not settings.SENTIMENT_WARMUP}
+
+    try:
+        await db.execute(text("SELECT 1"))
+    except Exception:
+        checks["database"] = False
+
+    ready = all(checks.values())
+    content = {"status": "ready" if ready else "starting", "checks": checks}
+    if warmup_error() and settings.SENTIMENT_WARMUP:
+        content.update(status="failed", error=warmup_error())
+    return JSONResponse(status_code=200 if ready else 503, content=content)
+
+
+@router.get("/health/quota")
+async def youtube_quota():
+    """
+    Remaining YouTube Data API budget per key for the current quota day, counting the spend
+    of every API and worker process. Falls back to this process's own view if the database
+    cannot be reached.
+    """
+    try:
+        await sync_quota(youtube_client.quota)
+    except Exception:
+        logger.exception("Failed to sync YouTube quota usage")
+    return youtube_client.quota.report()
@@ -0,0 +1,36 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.job import list_jobs
+from app.db.session import get_db
+from app.models.enums import JobStatus
+from app.schemas.job import JobListResponse, JobSchema
+
+router = APIRouter()
+
+
+@router.get("/jobs", response_model=JobListResponse)
+async def get_jobs(
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Lists queued and running analysis jobs in scheduling order, followed by recently finished ones,
+    with their queue wait time and current analysis rate.
+    """
+    now = datetime.utcnow()
+    jobs = []
+    for job in await list_jobs(db, limit):
+        schema = JobSchema.model_validate(job)
+        if job.status == JobStatus.QUEUED and job.run_after < now:
+            schema.wait_seconds += (now - job.run_after).total_seconds()
+        schema.wait_seconds = round(schema.wait_seconds, 1)
+        schema.active_seconds = round(schema.active_seconds, 1)
+        jobs.append(schema)
+
+    return JobListResponse(
+        jobs=jobs,
+        queued=sum(job.status == JobStatus.QUEUED for job in jobs),
+        running=sum(job.status == JobStatus.RUNNING for job in jobs),
+    )
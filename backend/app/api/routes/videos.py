@@ -1,10 +1,13 @@
 from typing import Optional, Union
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from urllib.parse import unquote
 
 from app.utils.text_utils import extract_video_id
+from app.utils.cursor import InvalidCursor
 from app.api.logic.video import get_or_create_video, get_paginated_video_list
+from app.api.logic.progress import stream_progress
 from app.schemas.video import VideoResponse, AnalyzedVideoList
 from app.db.session import get_db
 
@@ -15,7 +18,7 @@ async def get_videos(
     url: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (replaces offset)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -24,10 +27,10 @@ async def get_videos(
     If a 'url' query parameter is provided:
     - Extracts the YouTube video ID.
     - Fetches or creates the video entry in the database.
-    - Triggers background analysis if the video is new or requires re-analysis.
+    - Queues an analysis job for the workers if the video is new or requires re-analysis.
     
     If no 'url' is provided:
-    - Returns a paginated list of previously analyzed videos.
+    - Returns a paginated list of previously analyzed videos, by offset or by keyset cursor.
     """
     if url:
         # Decode the URL to ensure 'extract_video_id' receives a clean, unencoded string.
@@ -42,6 +45,21 @@ async def get_videos(
                 detail=f"Invalid YouTube video URL or could not extract ID from: {decoded_url}"
             )
         
-        return await get_or_create_video(video_id, db, background_tasks)
+        return await get_or_create_video(video_id, db)
     
-    return await get_paginated_video_list(db, offset, limit)
\ No newline at end of file
+    try:
+        return await get_paginated_video_list(db, offset, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/videos/{video_id}/progress")
+async def get_video_progress(video_id: str):
+    """
+    Server-sent event stream of a video's analysis progress (analyzed count, running sentiment
+    totals and state changes), pushed as the analysis job writes them. Replaces polling /videos.
+    """
+    return StreamingResponse(
+        stream_progress(video_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -5,10 +5,53 @@ load_dotenv()
 
 class Settings:
     YOUTUBE_API_KEY: str = os.getenv("YOUTUBE_API_KEY")
+    # Extra keys (comma separated) share the load once the main key's quota runs low
+    YOUTUBE_API_KEYS: list = [
+        key.strip()
+        for key in [os.getenv("YOUTUBE_API_KEY", ""), *os.getenv("YOUTUBE_EXTRA_API_KEYS", "").split(",")]
+        if key.strip()
+    ]
+    YOUTUBE_DAILY_QUOTA: int = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+    # Seconds between exchanges of quota spend with the other API and worker processes
+    YOUTUBE_QUOTA_SYNC_SECONDS: float = float(os.getenv("YOUTUBE_QUOTA_SYNC_SECONDS", "30"))
+    YOUTUBE_REQUESTS_PER_SECOND: float = float(os.getenv("YOUTUBE_REQUESTS_PER_SECOND", "5"))
+    YOUTUBE_REQUEST_BURST: int = int(os.getenv("YOUTUBE_REQUEST_BURST", "10"))
+    YOUTUBE_API_BASE_URL: str = os.getenv("YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3")
+    YOUTUBE_MAX_CONCURRENT_VIDEOS: int = int(os.getenv("YOUTUBE_MAX_CONCURRENT_VIDEOS", "4"))
+    YOUTUBE_PAGE_PREFETCH: int = int(os.getenv("YOUTUBE_PAGE_PREFETCH", "2"))
+    YOUTUBE_HTTP2: bool = os.getenv("YOUTUBE_HTTP2", "true").lower() == "true"
     HOST: str = os.getenv("HOST", "0.0.0.0")
     FRONTEND_PORT: str = os.getenv("FRONTEND_PORT", "3000")
     BACKEND_PORT: int = int(os.getenv("BACKEND_PORT", "8000"))
     MODEL_NAME: str = "cardiffnlp/twitter-xlm-roberta-base-sentiment"
+    SENTIMENT_MAX_BATCH_SIZE: int = int(os.getenv("SENTIMENT_MAX_BATCH_SIZE", "32"))
+    SENTIMENT_MAX_BATCH_TOKENS: int = int(os.getenv("SENTIMENT_MAX_BATCH_TOKENS", "8192"))
+    SENTIMENT_BACKEND: str = os.getenv("SENTIMENT_BACKEND", "torch")  # torch | torch-int8 | onnx
+    SENTIMENT_ONNX_PATH: str = os.getenv("SENTIMENT_ONNX_PATH", "models/sentiment-onnx")
+    SENTIMENT_ONNX_FILE: str = os.getenv("SENTIMENT_ONNX_FILE", "model.onnx")
+    SENTIMENT_FAST_TOKENIZER: bool = os.getenv("SENTIMENT_FAST_TOKENIZER", "true").lower() == "true"
+    SENTIMENT_WARMUP: bool = os.getenv("SENTIMENT_WARMUP", "false").lower() == "true"
+    SENTIMENT_WORKERS: int = int(os.getenv("SENTIMENT_WORKERS", "1"))
+    SENTIMENT_TORCH_THREADS: int = int(os.getenv("SENTIMENT_TORCH_THREADS", "0"))
+    SENTIMENT_LONG_TEXT_MODE: str = os.getenv("SENTIMENT_LONG_TEXT_MODE", "truncate")  # truncate | chunk
+    SENTIMENT_CACHE_SIZE: int = int(os.getenv("SENTIMENT_CACHE_SIZE", "100000"))
+    SENTIMENT_CACHE_PATH: str = os.getenv("SENTIMENT_CACHE_PATH", "")
+    ANALYSIS_QUEUE_SIZE: int = int(os.getenv("ANALYSIS_QUEUE_SIZE", "4"))
+    ANALYSIS_FLUSH_SIZE: int = int(os.getenv("ANALYSIS_FLUSH_SIZE", "200"))
+    # Seconds before a completed video is refreshed with newly posted comments
+    ANALYSIS_REFRESH_INTERVAL: int = int(os.getenv("ANALYSIS_REFRESH_INTERVAL", "3600"))
+    JOB_LEASE_SECONDS: int = int(os.getenv("JOB_LEASE_SECONDS", "60"))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    JOB_RETRY_BACKOFF: int = int(os.getenv("JOB_RETRY_BACKOFF", "30"))
+    # Pages a full analysis runs before yielding its worker slot to other queued jobs (0 = no slicing)
+    ANALYSIS_SLICE_PAGES: int = int(os.getenv("ANALYSIS_SLICE_PAGES", "20"))
+    # Seconds since enqueueing worth one priority level, so low-priority jobs are never starved
+    JOB_PRIORITY_AGING_SECONDS: int = int(os.getenv("JOB_PRIORITY_AGING_SECONDS", "300"))
+    # Most priority levels a job can gain by waiting, so aged backfills never pass fresh small videos
+    JOB_PRIORITY_AGING_MAX_LEVELS: float = float(os.getenv("JOB_PRIORITY_AGING_MAX_LEVELS", "1.5"))
+    WORKER_CONCURRENCY: int = int(os.getenv("WORKER_CONCURRENCY", "2"))
+    WORKER_POLL_INTERVAL: float = float(os.getenv("WORKER_POLL_INTERVAL", "2"))
+    RUN_EMBEDDED_WORKER: bool = os.getenv("RUN_EMBEDDED_WORKER", "false").lower() == "true"
 settings = Settings()
 
 if not settings.YOUTUBE_API_KEY:
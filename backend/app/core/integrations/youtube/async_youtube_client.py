@@ -0,0 +1,220 @@
+import asyncio
+import logging
+from contextlib import aclosing
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.integrations.youtube.quota import QUOTA_COSTS, QuotaTracker, TokenBucket
+from app.utils.text_utils import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+
+# Largest page size commentThreads.list accepts
+MAX_PAGE_SIZE = 100
+
+_QUOTA_ERROR_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+
+class YouTubeAPIError(Exception):
+    def __init__(self, status_code: int, message: str, reason: Optional[str] = None):
+        super().__init__(f"YouTube API error {status_code}: {message}")
+        self.status_code = status_code
+        self.reason = reason
+
+
+def parse_comment_thread(item: dict) -> dict:
+    """Flattens a commentThreads item into the dict shape used across the app"""
+    top_comment = item["snippet"]["topLevelComment"]
+    snippet = top_comment["snippet"]
+
+    published_at_raw = snippet.get("publishedAt")
+    published_at = parse_datetime(published_at_raw) if published_at_raw else None
+
+    return {
+        "id": top_comment["id"],
+        "text": snippet.get("textDisplay", ""),
+        "author": snippet.get("authorDisplayName", ""),
+        "likeCount": snippet.get("likeCount", 0),
+        "publishedAt": published_at,
+        "authorChannelId": snippet.get("authorChannelId", {}).get("value", None),
+        "viewerRating": snippet.get("viewerRating", None),
+        "updatedAt": parse_datetime(snippet["updatedAt"]) if "updatedAt" in snippet else published_at
+    }
+
+
+class AsyncYouTubeClient:
+    """
+    Non-blocking client for the videos.list and commentThreads.list endpoints.
+
+    All requests share one pooled keep-alive connection set (HTTP/2 when enabled).
+    At most `max_concurrent_videos` videos page through comments at the same time,
+    and each one keeps up to `page_prefetch` pages fetched ahead of its consumer.
+    Every call passes a token-bucket rate limiter and is charged against the daily
+    quota of the API key with the most budget left.
+    """
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        base_url: str,
+        max_concurrent_videos: int,
+        page_prefetch: int,
+        http2: bool = False,
+        requests_per_second: float = 5.0,
+        burst: int = 10,
+        daily_quota: int = 10000,
+    ):
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+        self.quota = QuotaTracker(api_keys, daily_quota)
+        self.base_url = base_url.rstrip("/")
+        self.page_prefetch = page_prefetch
+        self.http2 = http2
+        self._video_slots = asyncio.Semaphore(max_concurrent_videos)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(self, path: str, params: Dict) -> dict:
+        await self.rate_limiter.acquire()
+        api_key = self.quota.reserve(QUOTA_COSTS.get(path, 1))
+
+        response = await self.client.get(path, params={**params, "key": api_key})
+        if response.status_code != 200:
+            reason = None
+            try:
+                error = response.json()["error"]
+                message = error["message"]
+                reason = (error.get("errors") or [{}])[0].get("reason")
+            except Exception:
+                message = response.text
+
+            if reason in _QUOTA_ERROR_REASONS:
+                logger.warning(f"YouTube quota exhausted for key ...{api_key[-4:]}")
+                self.quota.exhaust(api_key)
+            raise YouTubeAPIError(response.status_code, message, reason)
+        return response.json()
+
+    async def fetch_video_data(self, video_id: str) -> dict:
+        response = await self._get("/videos", {"part": "snippet,statistics", "id": video_id})
+        if not response.get("items"):
+            raise ValueError("Video not found")
+        return response["items"][0]
+
+    async def fetch_video_comments(
+        self,
+        video_id: str,
+        max_results: int = MAX_PAGE_SIZE,
+        page_token: Optional[str] = None,
+        order: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        params = {
+            "part": "snippet",
+            "videoId": video_id,
+            "maxResults": max_results,
+            "textFormat": "plainText"
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        if order:
+            params["order"] = order
+
+        response = await self._get("/commentThreads", params)
+        comments = [parse_comment_thread(item) for item in response.get("items", [])]
+        return comments, response.get("nextPageToken")
+
+    async def iter_comment_pages(
+        self,
+        video_id: str,
+        max_results: int = MAX_PAGE_SIZE,
+        page_token: Optional[str] = None,
+        order: Optional[str] = None,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[Tuple[List[dict], Optional[str]]]:
+        """
+        Yields (comments, next_page_token) for every page of a video, or for the first
+        `max_pages` of them. A background task keeps fetching while the caller processes
+        earlier pages, but never past `max_pages`, so no quota is spent on pages that would be
+        discarded; errors are re-raised here.
+        """
+        pages: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.page_prefetch))
+
+        def last_page(token: Optional[str], count: int) -> bool:
+            return not token or bool(max_pages and count >= max_pages)
+
+        async def produce():
+            token = page_token
+            fetched = 0
+            try:
+                async with self._video_slots:
+                    while True:
+                        comments, token = await self.fetch_video_comments(video_id, max_results, token, order)
+                        fetched += 1
+                        await pages.put((comments, token))
+                        if last_page(token, fetched):
+                            return
+            except Exception as e:
+                await pages.put(e)
+
+        producer = asyncio.create_task(produce())
+        yielded = 0
+        try:
+            while True:
+                page = await pages.get()
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+                yielded += 1
+                if last_page(page[1], yielded):
+                    return
+        finally:
+            producer.cancel()
+
+    async def iter_new_comment_pages(
+        self,
+        video_id: str,
+        watermark: datetime,
+        max_results: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Yields pages of comments published at or after `watermark`, newest first, and stops
+        at the first older (already analyzed) comment instead of walking the whole thread list.
+        Comments without a publish date cannot be placed against the watermark and are skipped.
+        """
+        async with aclosing(self.iter_comment_pages(video_id, max_results, order="time")) as pages:
+            async for comments, _ in pages:
+                dated = [comment for comment in comments if comment["publishedAt"] is not None]
+                fresh = [comment for comment in dated if comment["publishedAt"] >= watermark]
+                if fresh:
+                    yield fresh
+                if len(fresh) < len(dated):
+                    return
+
+
+youtube_client = AsyncYouTubeClient(
+    api_keys=settings.YOUTUBE_API_KEYS,
+    base_url=settings.YOUTUBE_API_BASE_URL,
+    max_concurrent_videos=settings.YOUTUBE_MAX_CONCURRENT_VIDEOS,
+    page_prefetch=settings.YOUTUBE_PAGE_PREFETCH,
+    http2=settings.YOUTUBE_HTTP2,
+    requests_per_second=settings.YOUTUBE_REQUESTS_PER_SECOND,
+    burst=settings.YOUTUBE_REQUEST_BURST,
+    daily_quota=settings.YOUTUBE_DAILY_QUOTA,
+)
@@ -0,0 +1,142 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+from zoneinfo import ZoneInfo
+
+# YouTube Data API quotas reset at midnight Pacific time
+_QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# Quota units charged per call (https://developers.google.com/youtube/v3/determine_quota_cost)
+QUOTA_COSTS = {
+    "/videos": 1,
+    "/commentThreads": 1,
+}
+
+
+class QuotaExceeded(Exception):
+    """Raised when no API key has enough daily quota left for a request."""
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter: `rate` tokens per second, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int = 1):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class QuotaTracker:
+    """
+    Tracks quota units spent per API key for the current quota day and picks the key with the
+    most budget left for each request.
+
+    Every process that calls the API keeps its own tracker, so spend is also shared through the
+    database: take_unsynced() hands over what this process spent since the last exchange, and
+    merge_shared() adopts the totals of all processes (see app.api.logic.quota).
+    """
+
+    def __init__(self, api_keys: List[str], daily_limit: int):
+        self.api_keys = api_keys
+        self.daily_limit = daily_limit
+        self._day = self._today()
+        self._spent: Dict[str, int] = {key: 0 for key in api_keys}
+        self._unsynced: Dict[str, int] = {key: 0 for key in api_keys}
+        self._exhausted: Set[str] = set()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(_QUOTA_TIMEZONE).date().isoformat()
+
+    @staticmethod
+    def key_id(api_key: str) -> str:
+        """Identifies a key in shared storage without storing the key itself"""
+        return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+    def _roll_over(self):
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._spent = {key: 0 for key in self.api_keys}
+            self._unsynced = {key: 0 for key in self.api_keys}
+            self._exhausted = set()
+
+    def remaining(self, api_key: str) -> int:
+        self._roll_over()
+        return max(0, self.daily_limit - self._spent[api_key])
+
+    def reserve(self, units: int) -> str:
+        """Charges `units` to the key with the most remaining budget and returns that key."""
+        self._roll_over()
+        api_key = max(self.api_keys, key=self.remaining)
+        if self.remaining(api_key) < units:
+            raise QuotaExceeded(f"Daily YouTube quota of {self.daily_limit} units exhausted for all API keys")
+        self._spent[api_key] += units
+        self._unsynced[api_key] += units
+        return api_key
+
+    def exhaust(self, api_key: str):
+        """Marks a key as spent for the rest of the day, e.g. after YouTube answered quotaExceeded."""
+        self._roll_over()
+        self._spent[api_key] = self.daily_limit
+        self._exhausted.add(api_key)
+
+    def take_unsynced(self) -> Tuple[str, Dict[str, int], Set[str]]:
+        """Quota day, units spent and keys exhausted since the last call, by key id"""
+        self._roll_over()
+        spent = {self.key_id(key): units for key, units in self._unsynced.items() if units}
+        exhausted = {self.key_id(key) for key in self._exhausted}
+        self._unsynced = {key: 0 for key in self.api_keys}
+        self._exhausted = set()
+        return self._day, spent, exhausted
+
+    def restore_unsynced(self, day: str, spent: Dict[str, int], exhausted: Set[str]):
+        """Puts back what take_unsynced() returned when it could not be shared"""
+        if day != self._day:
+            return
+        for key in self.api_keys:
+            self._unsynced[key] += spent.get(self.key_id(key), 0)
+            if self.key_id(key) in exhausted:
+                self._exhausted.add(key)
+
+    def merge_shared(self, day: str, spent: Dict[str, int]):
+        """Adopts the spend of every process for `day`, keeping what this one spent meanwhile"""
+        if day != self._day:
+            return
+        for key in self.api_keys:
+            shared = spent.get(self.key_id(key), 0) + self._unsynced[key]
+            self._spent[key] = max(self._spent[key] if key in self._exhausted else 0, shared)
+
+    def report(self) -> Dict:
+        self._roll_over()
+        return {
+            "quota_day": self._day,
+            "daily_limit": self.daily_limit,
+            "keys": [
+                {
+                    "key": f"...{api_key[-4:]}",
+                    "spent": self._spent[api_key],
+                    "remaining": self.remaining(api_key),
+                }
+                for api_key in self.api_keys
+            ],
+            "remaining": sum(self.remaining(api_key) for api_key in self.api_keys),
+        }
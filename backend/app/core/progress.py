@@ -0,0 +1,89 @@
+"""
+Live analysis progress over Postgres LISTEN/NOTIFY.
+
+Workers publish an event whenever a video's analysis state or running totals change, in the
+same transaction as the change itself. Each API process holds a single listening connection
+and fans events out to the progress streams of the videos being watched, so any number of
+viewers of a video cost one notification per flush instead of one poll per viewer.
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "analysis_progress"
+SUBSCRIBER_QUEUE_SIZE = 16
+
+
+async def notify_progress(db: AsyncSession, video_id: str, **fields: Any):
+    """Stage a progress event (no commit); Postgres delivers it when the transaction commits"""
+    payload = json.dumps({"video_id": video_id, **fields}, default=str)
+    await db.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+class ProgressBroker:
+    """Listens on the progress channel and routes events to per-video subscriber queues."""
+
+    def __init__(self, dsn: Optional[str] = None):
+        self._dsn = dsn
+        self._connection: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    async def _ensure_listening(self):
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            self._connection = await asyncpg.connect(self._dsn or _asyncpg_dsn())
+            await self._connection.add_listener(CHANNEL, self._on_notify)
+            logger.info("Listening for analysis progress events")
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed progress event: {payload[:200]}")
+            return
+
+        for queue in self._subscribers.get(event.get("video_id"), ()):
+            if queue.full():
+                queue.get_nowait()  # Events carry running totals, so a slow reader only needs the latest
+            queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self, video_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Yields a queue receiving the progress events of `video_id` until the context exits"""
+        await self._ensure_listening()
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[video_id].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[video_id].discard(queue)
+            if not self._subscribers[video_id]:
+                del self._subscribers[video_id]
+
+    async def reconnect_if_closed(self):
+        """Re-establishes the listening connection after it dropped (events in between are lost)"""
+        await self._ensure_listening()
+
+    async def close(self):
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+
+def _asyncpg_dsn() -> str:
+    from app.db.session import engine
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+progress_broker = ProgressBroker()
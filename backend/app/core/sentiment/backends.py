@@ -0,0 +1,51 @@
+import logging
+
+from transformers import pipeline, AutoModelForSequenceClassification
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("torch", "torch-int8", "onnx")
+
+
+def build_pipeline(
+    backend: str,
+    model_name: str,
+    tokenizer,
+    onnx_path: str,
+    onnx_file: str,
+    max_length: int
+):
+    """
+    Builds the text-classification pipeline for the configured backend.
+
+    - torch:      fp32 PyTorch model straight from the hub
+    - torch-int8: the same model with Linear layers dynamically quantized to int8
+    - onnx:       an ONNX Runtime export produced by `python -m app.core.sentiment.export_onnx`
+    """
+    if backend == "torch":
+        model = model_name
+    elif backend == "torch-int8":
+        import torch
+
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    elif backend == "onnx":
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError as e:
+            raise RuntimeError(
+                "The onnx sentiment backend requires optimum: pip install 'optimum[onnxruntime]'"
+            ) from e
+
+        model = ORTModelForSequenceClassification.from_pretrained(onnx_path, file_name=onnx_file)
+    else:
+        raise ValueError(f"Unknown sentiment backend '{backend}', expected one of {BACKENDS}")
+
+    logger.info(f"Loading sentiment pipeline ({backend}) for {model_name}")
+    return pipeline(
+        "sentiment-analysis",
+        model=model,
+        tokenizer=tokenizer,
+        truncation=True,
+        max_length=max_length
+    )
@@ -0,0 +1,74 @@
+"""
+Throughput benchmark for the long-comment modes of the sentiment module.
+
+    python -m app.core.sentiment.bench [--samples FILE] [--long-ratio 0.1] [--rounds 3]
+
+Builds a corpus from the parity samples plus synthetic long comments (several
+samples glued together until they exceed the model's 512-token window), then
+runs the batched inference path in "truncate" and "chunk" mode and reports
+comments/second, segments per comment and the relative cost of chunking.
+The result cache is bypassed so every round measures model time.
+"""
+import argparse
+import logging
+import random
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from app.core.sentiment import sentiment
+from app.core.sentiment.parity import DEFAULT_SAMPLES, load_samples
+
+
+def build_corpus(samples: List[str], size: int, long_ratio: float, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    tokenizer = sentiment.get_tokenizer()
+    corpus = []
+
+    for _ in range(size):
+        if rng.random() < long_ratio:
+            text = ""
+            while len(tokenizer(text)["input_ids"]) <= 2 * sentiment.MAX_SEQUENCE_LENGTH:
+                text = f"{text} {rng.choice(samples)}".strip()
+            corpus.append(text)
+        else:
+            corpus.append(rng.choice(samples))
+
+    return corpus
+
+
+def run(corpus: List[str], mode: str, rounds: int) -> Dict[str, float]:
+    sentiment._infer_batch(corpus[:4], long_text_mode=mode)  # warm-up
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        sentiment._infer_batch(corpus, long_text_mode=mode)
+    elapsed = time.perf_counter() - start
+
+    segments, _ = sentiment._segment(corpus, mode)
+    return {
+        "comments_per_second": len(corpus) * rounds / elapsed,
+        "segments_per_comment": len(segments) / len(corpus),
+    }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=Path, default=DEFAULT_SAMPLES)
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--long-ratio", type=float, default=0.1)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = build_corpus(load_samples(args.samples), args.size, args.long_ratio)
+    truncate = run(corpus, "truncate", args.rounds)
+    chunk = run(corpus, "chunk", args.rounds)
+
+    for mode, report in (("truncate", truncate), ("chunk", chunk)):
+        print(
+            f"{mode:>8}: {report['comments_per_second']:.1f} comments/s, "
+            f"{report['segments_per_comment']:.2f} segments/comment"
+        )
+    cost = 1 - chunk["comments_per_second"] / truncate["comments_per_second"]
+    print(f"chunking throughput cost: {cost:.1%}")
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_ready = False
+_warmup_error: Optional[str] = None
+# Latest counters reported by each worker process, keyed by pid
+_worker_stats: Dict[int, Dict] = {}
+
+
+def _init_worker(torch_threads: int):
+    """Runs once in every worker process: pins torch threads and loads the model."""
+    if torch_threads > 0:
+        import torch
+        torch.set_num_threads(torch_threads)
+
+    from app.core.sentiment.sentiment import warm_up
+    warm_up()
+
+
+def _ping() -> bool:
+    return True
+
+
+def _analyze_in_worker(texts: List[str]) -> Tuple[List[Dict], Dict]:
+    """
+    Returns the results with the worker's counters, which are otherwise invisible outside
+    the child process. Errors travel back to the parent pickled; an exception that cannot be
+    unpickled breaks the whole pool, so every failure is re-raised as a plain RuntimeError.
+    """
+    from app.core.sentiment.sentiment import analyze_batch, worker_stats
+    try:
+        return analyze_batch(texts), worker_stats()
+    except Exception as e:
+        raise RuntimeError(f"Sentiment Analysis Error: {type(e).__name__}: {e}") from e
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        logger.info(f"Starting sentiment executor with {settings.SENTIMENT_WORKERS} worker process(es)")
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.SENTIMENT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(settings.SENTIMENT_TORCH_THREADS,),
+        )
+    return _executor
+
+
+async def analyze_batch_async(texts: List[str]) -> List[Dict]:
+    """
+    Runs analyze_batch in the sentiment worker pool so inference never blocks
+    the event loop. A crashed pool is discarded and rebuilt on the next call.
+    """
+    global _executor, _ready, _warmup_error
+    if not texts:
+        return []
+
+    loop = asyncio.get_running_loop()
+    try:
+        results, stats = await loop.run_in_executor(get_executor(), _analyze_in_worker, texts)
+    except BrokenProcessPool:
+        logger.exception("Sentiment worker pool crashed, it will be restarted on the next batch")
+        _executor = None
+        _ready = False
+        _worker_stats.clear()
+        raise
+
+    # A worker that scored a batch has loaded the model, whatever an earlier warm-up reported
+    _ready, _warmup_error = True, None
+    _worker_stats[stats["pid"]] = stats
+    cache = stats["cache"]
+    logger.info(
+        f"Scored {len(texts)} texts in sentiment worker {stats['pid']}: cache hit rate "
+        f"{cache['hit_rate']:.1%} ({cache['hits']} hits, {cache['misses']} misses, {cache['entries']} entries), "
+        f"padding efficiency {stats['padding_efficiency']:.1%}"
+    )
+    return results
+
+
+async def warm_up_executor():
+    """
+    Starts every worker process (each loads the model in its initializer)
+    and marks the executor ready once all of them answer.
+    """
+    global _ready, _warmup_error
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    await asyncio.gather(*(
+        loop.run_in_executor(executor, _ping) for _ in range(settings.SENTIMENT_WORKERS)
+    ))
+    _ready, _warmup_error = True, None
+    logger.info("Sentiment executor warmed up")
+
+
+def on_warmup_done(task: asyncio.Task):
+    """Done-callback for the warm_up_executor task: logs a failed model load and records it for readiness"""
+    global _warmup_error
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error("Sentiment executor warm-up failed", exc_info=error)
+        _warmup_error = repr(error)
+
+
+def is_ready() -> bool:
+    return _ready
+
+
+def warmup_error() -> Optional[str]:
+    """Why the warm-up failed, if it did"""
+    return _warmup_error
+
+
+def worker_stats() -> Dict[int, Dict]:
+    """Latest cumulative counters of each sentiment worker process, keyed by pid"""
+    return dict(_worker_stats)
+
+
+def shutdown_executor():
+    global _executor, _ready
+    _ready = False
+    _worker_stats.clear()
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
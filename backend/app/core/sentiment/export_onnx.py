@@ -0,0 +1,46 @@
+"""
+One-off export of the sentiment model for the `onnx` backend.
+
+    python -m app.core.sentiment.export_onnx [--output DIR] [--quantize]
+
+Writes an ONNX Runtime model plus tokenizer to SENTIMENT_ONNX_PATH (or --output).
+With --quantize an int8 dynamically quantized copy is written next to it as
+model_quantized.onnx; select it with SENTIMENT_ONNX_FILE=model_quantized.onnx.
+"""
+import argparse
+import logging
+
+from transformers import AutoTokenizer
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def export(output: str, quantize: bool = False):
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+
+    model = ORTModelForSequenceClassification.from_pretrained(settings.MODEL_NAME, export=True)
+    model.save_pretrained(output)
+    AutoTokenizer.from_pretrained(settings.MODEL_NAME).save_pretrained(output)
+
+    if quantize:
+        from optimum.onnxruntime import ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=output,
+            quantization_config=AutoQuantizationConfig.avx2(is_static=False, per_channel=False),
+        )
+
+    logger.info(f"Exported {settings.MODEL_NAME} to {output} (quantized: {quantize})")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=settings.SENTIMENT_ONNX_PATH)
+    parser.add_argument("--quantize", action="store_true")
+    args = parser.parse_args()
+    export(args.output, args.quantize)
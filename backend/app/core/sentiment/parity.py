@@ -0,0 +1,135 @@
+"""
+Accuracy-parity and speed check of a sentiment backend against the fp32 torch pipeline.
+
+    python -m app.core.sentiment.parity --backend onnx [--samples FILE] [--min-agreement 0.95]
+
+Both pipelines classify the same fixed sample set. The report lists label
+agreement, the largest score difference and comments/second for each backend.
+Exits with status 1 when agreement drops below --min-agreement.
+
+    python -m app.core.sentiment.parity --tokenizer [--from-db 5000]
+
+Checks that the fast tokenizer produces the same token IDs as the slow
+SentencePiece one, on the sample file or on real comments from the database.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from transformers import AutoTokenizer
+
+from app.core.config import settings
+from app.core.sentiment.backends import BACKENDS, build_pipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLES = Path(__file__).parent / "data" / "parity_samples.txt"
+
+
+def load_samples(path: Path) -> List[str]:
+    return [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def _timed_predictions(backend: str, tokenizer, texts: List[str], rounds: int):
+    classifier = build_pipeline(
+        backend,
+        settings.MODEL_NAME,
+        tokenizer,
+        settings.SENTIMENT_ONNX_PATH,
+        settings.SENTIMENT_ONNX_FILE,
+        512
+    )
+    classifier(texts[:1])  # warm-up
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        predictions = classifier(texts, batch_size=settings.SENTIMENT_MAX_BATCH_SIZE)
+    elapsed = time.perf_counter() - start
+
+    return predictions, len(texts) * rounds / elapsed
+
+
+def compare(backend: str, texts: List[str], rounds: int = 3) -> Dict[str, float]:
+    tokenizer = AutoTokenizer.from_pretrained(settings.MODEL_NAME, use_fast=False)
+
+    reference, reference_rate = _timed_predictions("torch", tokenizer, texts, rounds)
+    candidate, candidate_rate = _timed_predictions(backend, tokenizer, texts, rounds)
+
+    agreeing = sum(r["label"] == c["label"] for r, c in zip(reference, candidate))
+    for text, r, c in zip(texts, reference, candidate):
+        if r["label"] != c["label"]:
+            logger.info(f"Label drift: {r['label']} -> {c['label']} for {text[:60]!r}")
+
+    return {
+        "samples": len(texts),
+        "agreement": agreeing / len(texts),
+        "max_score_delta": max(abs(r["score"] - c["score"]) for r, c in zip(reference, candidate)),
+        "reference_per_second": reference_rate,
+        "candidate_per_second": candidate_rate,
+        "speedup": candidate_rate / reference_rate,
+    }
+
+
+def compare_tokenizers(texts: List[str]) -> Dict[str, float]:
+    slow = AutoTokenizer.from_pretrained(settings.MODEL_NAME, use_fast=False)
+    fast = AutoTokenizer.from_pretrained(settings.MODEL_NAME, use_fast=True)
+
+    start = time.perf_counter()
+    slow_ids = slow(texts, truncation=True, max_length=512)["input_ids"]
+    slow_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast_ids = fast(texts, truncation=True, max_length=512)["input_ids"]
+    fast_elapsed = time.perf_counter() - start
+
+    matching = 0
+    for text, expected, actual in zip(texts, slow_ids, fast_ids):
+        if expected == actual:
+            matching += 1
+        else:
+            logger.info(f"Token mismatch for {text[:60]!r}")
+
+    return {
+        "samples": len(texts),
+        "agreement": matching / len(texts),
+        "slow_per_second": len(texts) / slow_elapsed,
+        "fast_per_second": len(texts) / fast_elapsed,
+        "speedup": slow_elapsed / fast_elapsed,
+    }
+
+
+async def load_db_samples(limit: int) -> List[str]:
+    from sqlalchemy import select
+
+    from app.db.session import AsyncSessionLocal
+    from app.models.comment import CommentModel
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(CommentModel.text).limit(limit))
+        return [row[0] for row in result.all()]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=BACKENDS, default=settings.SENTIMENT_BACKEND)
+    parser.add_argument("--samples", type=Path, default=DEFAULT_SAMPLES)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    parser.add_argument("--tokenizer", action="store_true", help="compare fast and slow tokenizers instead")
+    parser.add_argument("--from-db", type=int, default=0, help="use this many stored comments as samples")
+    args = parser.parse_args()
+
+    samples = asyncio.run(load_db_samples(args.from_db)) if args.from_db else load_samples(args.samples)
+    if args.tokenizer:
+        report = compare_tokenizers(samples)
+    else:
+        report = compare(args.backend, samples, args.rounds)
+    for key, value in report.items():
+        print(f"{key:>22}: {value:.4f}" if isinstance(value, float) else f"{key:>22}: {value}")
+
+    sys.exit(0 if report["agreement"] >= args.min_agreement else 1)
@@ -1,9 +1,33 @@
-from transformers import pipeline, AutoTokenizer
+import logging
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
 from app.core.config import settings
-from fastapi import HTTPException
+from app.core.sentiment.cache import SentimentCache
+from app.utils.text_utils import chunk_tokens
 
-tokenizer = AutoTokenizer.from_pretrained(settings.MODEL_NAME,use_fast=False)
-sentiment_pipeline = pipeline("sentiment-analysis",model=settings.MODEL_NAME,tokenizer=tokenizer,truncation=True,max_length=512)
+MAX_SEQUENCE_LENGTH = 512
+AMBIGUOUS_THRESHOLD = 0.6
+
+logger = logging.getLogger(__name__)
+
+# The tokenizer and pipeline are loaded on first use (or by warm_up) so that
+# importing this module stays cheap for processes that never run inference.
+_tokenizer = None
+_pipeline = None
+_load_lock = threading.Lock()
+
+# Cumulative token counters used to report padding efficiency
+_padding_stats = {"real_tokens": 0, "padded_tokens": 0}
+
+# Backends, ONNX exports (e.g. fp32 vs quantized) and long-text modes give slightly
+# different scores, so each combination gets its own cache namespace
+sentiment_cache = SentimentCache(
+    f"{settings.MODEL_NAME}:{settings.SENTIMENT_BACKEND}:{settings.SENTIMENT_ONNX_FILE}:"
+    f"{settings.SENTIMENT_LONG_TEXT_MODE}",
+    max_entries=settings.SENTIMENT_CACHE_SIZE,
+    path=settings.SENTIMENT_CACHE_PATH or None
+)
 
 _LABEL_MAP = {
     "LABEL_0": "negative",
@@ -11,15 +35,226 @@ _LABEL_MAP = {
     "LABEL_2": "positive"
 }
 
+
+def _load():
+    global _tokenizer, _pipeline
+    with _load_lock:
+        if _pipeline is None:
+            from transformers import AutoTokenizer
+            from app.core.sentiment.backends import build_pipeline
+
+            _tokenizer = AutoTokenizer.from_pretrained(
+                settings.MODEL_NAME, use_fast=settings.SENTIMENT_FAST_TOKENIZER
+            )
+            _pipeline = build_pipeline(
+                settings.SENTIMENT_BACKEND,
+                settings.MODEL_NAME,
+                _tokenizer,
+                settings.SENTIMENT_ONNX_PATH,
+                settings.SENTIMENT_ONNX_FILE,
+                MAX_SEQUENCE_LENGTH
+            )
+
+
+def get_tokenizer():
+    if _tokenizer is None:
+        _load()
+    return _tokenizer
+
+
+def get_pipeline():
+    if _pipeline is None:
+        _load()
+    return _pipeline
+
+
+def is_loaded() -> bool:
+    return _pipeline is not None
+
+
+def warm_up():
+    """Loads the model and runs one forward pass so the first real batch is not slowed down."""
+    get_pipeline()(["warm-up"])
+
+
+def _to_result(prediction: Dict) -> Dict:
+    label = prediction["label"]
+    score = prediction["score"]
+    if score < AMBIGUOUS_THRESHOLD:
+        label = "ambiguous"
+    return {"label": _LABEL_MAP.get(label, label), "score": score}
+
+
+def pretokenize(texts: List[str]) -> List[List[int]]:
+    """
+    Tokenizes a whole page of texts in one call (Rust-backed when the fast
+    tokenizer is enabled), truncated exactly as the pipeline would truncate them.
+    The token IDs drive length bucketing and are fed to the model unchanged.
+    """
+    encoded = get_tokenizer()(texts, truncation=True, max_length=MAX_SEQUENCE_LENGTH)
+    return encoded["input_ids"]
+
+
+def _segment(texts: List[str], long_text_mode: str) -> Tuple[List[List[int]], List[int]]:
+    """
+    Returns model-ready token ID segments and, for each segment, the index of
+    the text it came from. In "truncate" mode every text is one segment cut at
+    MAX_SEQUENCE_LENGTH; in "chunk" mode long texts are split into several
+    full-length segments so their whole content is classified.
+    """
+    if long_text_mode != "chunk":
+        return pretokenize(texts), list(range(len(texts)))
+
+    tokenizer = get_tokenizer()
+    window = MAX_SEQUENCE_LENGTH - tokenizer.num_special_tokens_to_add()
+    segments: List[List[int]] = []
+    owners: List[int] = []
+
+    for index, ids in enumerate(tokenizer(texts, add_special_tokens=False)["input_ids"]):
+        for chunk in chunk_tokens(ids, window) or [ids]:
+            segments.append(tokenizer.build_inputs_with_special_tokens(chunk))
+            owners.append(index)
+
+    return segments, owners
+
+
+def _forward(input_ids: List[List[int]]) -> List[List[float]]:
+    """Runs one padded batch of pre-tokenized texts through the model and returns class probabilities."""
+    import torch
+
+    inputs = get_tokenizer().pad({"input_ids": input_ids}, return_tensors="pt")
+
+    with torch.inference_mode():
+        logits = get_pipeline().model(**inputs).logits
+
+    return torch.as_tensor(logits).softmax(dim=-1).tolist()
+
+
+def _combine(weighted_probs: List[Tuple[int, List[float]]], id2label: Dict[int, str]) -> Dict:
+    """Merges per-segment class probabilities, weighted by segment length, into one prediction."""
+    if len(weighted_probs) == 1:
+        probs = weighted_probs[0][1]
+    else:
+        total_weight = sum(weight for weight, _ in weighted_probs)
+        probs = [
+            sum(weight * segment_probs[i] for weight, segment_probs in weighted_probs) / total_weight
+            for i in range(len(weighted_probs[0][1]))
+        ]
+
+    label_id = max(range(len(probs)), key=probs.__getitem__)
+    return {"label": id2label[label_id], "score": probs[label_id]}
+
+
+def _pack_batches(
+    lengths: List[int],
+    max_batch_size: int,
+    max_batch_tokens: int
+) -> Iterator[List[int]]:
+    """
+    Groups text indices into batches bounded by both the number of texts and
+    the padded token count (batch size * longest sequence in the batch).
+
+    Indices are visited in order of token length so every batch holds texts of
+    similar length and short comments are not padded up to a long neighbour.
+    A single text longer than the token budget still gets a batch of its own.
+    """
+    batch: List[int] = []
+    longest = 0
+
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        length = lengths[index]
+        candidate_longest = max(longest, length)
+        if batch and (
+            len(batch) >= max_batch_size
+            or candidate_longest * (len(batch) + 1) > max_batch_tokens
+        ):
+            yield batch
+            batch, candidate_longest = [], length
+
+        batch.append(index)
+        longest = candidate_longest
+
+    if batch:
+        yield batch
+
+
+def _record_padding(lengths: List[int], batches: List[List[int]]) -> float:
+    real_tokens = sum(lengths)
+    padded_tokens = sum(len(batch) * max(lengths[i] for i in batch) for batch in batches)
+
+    _padding_stats["real_tokens"] += real_tokens
+    _padding_stats["padded_tokens"] += padded_tokens
+
+    return real_tokens / padded_tokens if padded_tokens else 1.0
+
+
+def padding_efficiency() -> float:
+    """Real tokens / padded tokens over every batch analyzed by this process."""
+    padded_tokens = _padding_stats["padded_tokens"]
+    return _padding_stats["real_tokens"] / padded_tokens if padded_tokens else 1.0
+
+
+def _infer_batch(texts: List[str], long_text_mode: Optional[str] = None) -> List[Dict]:
+    segments, owners = _segment(texts, long_text_mode or settings.SENTIMENT_LONG_TEXT_MODE)
+    lengths = [len(ids) for ids in segments]
+    batches = list(_pack_batches(
+        lengths,
+        settings.SENTIMENT_MAX_BATCH_SIZE,
+        settings.SENTIMENT_MAX_BATCH_TOKENS
+    ))
+
+    efficiency = _record_padding(lengths, batches)
+    logger.debug(
+        f"Analyzing {len(texts)} texts ({len(segments)} segments) in {len(batches)} batches "
+        f"(padding efficiency {efficiency:.2%}, cumulative {padding_efficiency():.2%})"
+    )
+
+    weighted_probs: List[List[Tuple[int, List[float]]]] = [[] for _ in texts]
+    for batch in batches:
+        for segment_index, probs in zip(batch, _forward([segments[i] for i in batch])):
+            weighted_probs[owners[segment_index]].append((lengths[segment_index], probs))
+
+    id2label = get_pipeline().model.config.id2label
+    return [_to_result(_combine(text_probs, id2label)) for text_probs in weighted_probs]
+
+
+def worker_stats() -> Dict:
+    """This process's cumulative cache and padding counters, sent back to the parent with every batch"""
+    return {"pid": os.getpid(), "cache": sentiment_cache.stats(), "padding_efficiency": padding_efficiency()}
+
+
 def analyze_text(text: str):
-    try:
-        result = sentiment_pipeline(text)
-        label = result[0]["label"]
-        score = result[0]["score"]
-        if score < 0.6:
-            label = "ambiguous"
-        return {"label": _LABEL_MAP.get(label, label), "score": score}
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Sentiment Analysis Error: {str(e)}"
-        )
\ No newline at end of file
+    return analyze_batch([text])[0]
+
+
+def analyze_batch(texts: List[str]) -> List[Dict]:
+    """
+    Analyzes many texts with as few forward passes as possible.
+
+    Texts already in the sentiment cache (and repeats within the call) skip the
+    model. The rest are bucketed by token length and packed into dynamically
+    sized batches limited by SENTIMENT_MAX_BATCH_SIZE and SENTIMENT_MAX_BATCH_TOKENS.
+    Results are returned in input order.
+    """
+    if not texts:
+        return []
+
+    keys = [sentiment_cache.key(text) for text in texts]
+    results: Dict[str, Dict] = {}
+    pending: Dict[str, str] = {}
+
+    for key, text in zip(keys, texts):
+        if key in results or key in pending:
+            continue
+        cached = sentiment_cache.get(key)
+        if cached is None:
+            pending[key] = text
+        else:
+            results[key] = cached
+
+    if pending:
+        fresh = dict(zip(pending, _infer_batch(list(pending.values()))))
+        sentiment_cache.put_many(fresh)
+        results.update(fresh)
+
+    return [dict(results[key]) for key in keys]
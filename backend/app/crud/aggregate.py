@@ -0,0 +1,171 @@
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.aggregate import SentimentRollup, VideoAggregate, label_column
+from app.models.comment import CommentModel
+from app.models.enums import ChartGranularity, SentimentLabel
+
+_COUNTERS = [label_column(label) for label in SentimentLabel] + ["score_sum", "length_sum", "total"]
+_ROLLUP_COUNTERS = [label_column(label) for label in SentimentLabel] + ["score_sum", "total"]
+
+# Rows per rollup INSERT, keeps bind parameters well under the asyncpg limit
+_ROLLUP_CHUNK_SIZE = 1000
+
+
+async def get_aggregate(db: AsyncSession, video_id: str) -> Optional[VideoAggregate]:
+    result = await db.execute(
+        select(VideoAggregate).where(VideoAggregate.video_id == video_id).execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
+
+async def stage_aggregate_delta(
+    db: AsyncSession,
+    video_id: str,
+    label_counts: Dict[SentimentLabel, int],
+    score_sum: float,
+    length_sum: int,
+    total: int
+):
+    """Adds a delta to the video's running totals without committing, so it lands in the caller's transaction"""
+    values = {
+        "video_id": video_id,
+        **{label_column(label): label_counts.get(label, 0) for label in SentimentLabel},
+        "score_sum": score_sum,
+        "length_sum": length_sum,
+        "total": total,
+        "updated_at": datetime.utcnow(),
+    }
+    table = VideoAggregate.__table__
+    statement = pg_insert(table).values(values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.video_id],
+        set_={
+            **{key: table.c[key] + statement.excluded[key] for key in _COUNTERS},
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    await db.execute(statement)
+
+
+async def rebuild_aggregate(db: AsyncSession, video_id: str) -> VideoAggregate:
+    """
+    Recomputes the running totals from the comments in one scan and commits. Only needed for
+    videos whose comments were stored before the totals were maintained.
+    """
+    result = await db.execute(
+        select(
+            CommentModel.sentiment_label,
+            func.count(),
+            func.coalesce(func.sum(CommentModel.sentiment_score), 0.0),
+            func.coalesce(func.sum(func.length(CommentModel.text)), 0),
+        )
+        .where(CommentModel.video_id == video_id)
+        .group_by(CommentModel.sentiment_label)
+    )
+    values = {"video_id": video_id, "updated_at": datetime.utcnow(), **{key: 0 for key in _COUNTERS}}
+    for label, count, score_sum, length_sum in result.all():
+        values[label_column(label)] = count
+        values["score_sum"] += score_sum
+        values["length_sum"] += length_sum
+        values["total"] += count
+
+    table = VideoAggregate.__table__
+    statement = pg_insert(table).values(values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.video_id],
+        set_={key: statement.excluded[key] for key in values if key != "video_id"},
+    )
+    await db.execute(statement)
+    await db.commit()
+    return await get_aggregate(db, video_id)
+
+
+def bucket_start(value: datetime, granularity: ChartGranularity) -> datetime:
+    """Python counterpart of Postgres date_trunc(granularity, value); weeks start on Monday"""
+    value = value.replace(minute=0, second=0, microsecond=0)
+    if granularity == ChartGranularity.HOUR:
+        return value
+    value = value.replace(hour=0)
+    if granularity == ChartGranularity.DAY:
+        return value
+    if granularity == ChartGranularity.WEEK:
+        return value - timedelta(days=value.weekday())
+    return value.replace(day=1)
+
+
+async def stage_rollup_delta(
+    db: AsyncSession,
+    video_id: str,
+    changes: Iterable[Tuple[datetime, SentimentLabel, float, int]]
+):
+    """
+    Applies comment changes to the video's rollups of every granularity without committing.
+    Each change is (published_at, label, score, sign), with sign 1 to count a comment in and
+    -1 to take it out.
+    """
+    deltas: Dict[Tuple[ChartGranularity, datetime], Counter] = defaultdict(Counter)
+    for published_at, label, score, sign in changes:
+        for granularity in ChartGranularity:
+            delta = deltas[granularity, bucket_start(published_at, granularity)]
+            delta[label_column(label)] += sign
+            delta["score_sum"] += sign * score
+            delta["total"] += sign
+
+    # Sorted, so concurrent writers lock rollup rows in the same order
+    rows = [
+        {
+            "video_id": video_id,
+            "granularity": granularity,
+            "bucket_start": start,
+            **{key: delta[key] for key in _ROLLUP_COUNTERS},
+        }
+        for (granularity, start), delta in sorted(deltas.items())
+    ]
+
+    table = SentimentRollup.__table__
+    for offset in range(0, len(rows), _ROLLUP_CHUNK_SIZE):
+        statement = pg_insert(table).values(rows[offset:offset + _ROLLUP_CHUNK_SIZE])
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.video_id, table.c.granularity, table.c.bucket_start],
+            set_={key: table.c[key] + statement.excluded[key] for key in _ROLLUP_COUNTERS},
+        )
+        await db.execute(statement)
+
+
+async def get_rollup_range(
+    db: AsyncSession,
+    video_id: str,
+    since: Optional[datetime] = None
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """First and last hour with comments, read from the ends of the hourly rollup range"""
+    query = select(func.min(SentimentRollup.bucket_start), func.max(SentimentRollup.bucket_start)).where(
+        SentimentRollup.video_id == video_id,
+        SentimentRollup.granularity == ChartGranularity.HOUR,
+    )
+    if since:
+        query = query.where(SentimentRollup.bucket_start >= bucket_start(since, ChartGranularity.HOUR))
+    result = await db.execute(query)
+    return tuple(result.one())
+
+
+async def get_rollup_buckets(
+    db: AsyncSession,
+    video_id: str,
+    granularity: ChartGranularity,
+    since: Optional[datetime] = None
+) -> List[SentimentRollup]:
+    """A video's rollups at one granularity, oldest first; with `since`, from the bucket containing it"""
+    query = select(SentimentRollup).where(
+        SentimentRollup.video_id == video_id,
+        SentimentRollup.granularity == granularity,
+    )
+    if since:
+        query = query.where(SentimentRollup.bucket_start >= bucket_start(since, granularity))
+    result = await db.execute(query.order_by(SentimentRollup.bucket_start))
+    return list(result.scalars().all())
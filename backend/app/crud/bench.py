@@ -0,0 +1,150 @@
+"""
+Round-trip and latency benchmark for the /comments query path.
+
+    python -m app.crud.bench --database-url postgresql+asyncpg://... [--comments 20000] [--rounds 20]
+
+Seeds a synthetic video into a migrated scratch database, then serves the same requests
+two ways: the previous path (a COUNT subquery, the label totals, the page, the video
+lookup, and the route's recount of every matching label in Python) and the single-pass
+query_comments. It reports statements per request and median latency for each, and
+deletes the synthetic rows when it is done.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import delete, desc, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud.comment import _apply_filters, bulk_upsert_comments, get_sentiment_totals, query_comments
+from app.crud.video import create_video, get_video_by_id
+from app.models.aggregate import SentimentRollup, VideoAggregate
+from app.models.comment import CommentModel
+from app.models.enums import AnalysisState, SentimentLabel
+from app.models.video import Video
+
+VIDEO_ID = "bench_comments_video"
+LABELS = [label.value for label in SentimentLabel]
+
+SCENARIOS = {
+    "first page": {"offset": 0},
+    "page 50 (offset)": {"offset": 50 * 20},
+    "filtered": {"offset": 0, "sentiment": "negative", "min_likes": 10},
+    "phrase search": {"offset": 0, "phrase": "great video"},
+}
+
+
+async def seed(db: AsyncSession, size: int):
+    now = datetime.utcnow()
+    await create_video(db, {
+        "id": VIDEO_ID, "title": "Benchmark", "channel_id": "bench", "channel_name": "Bench",
+        "thumbnail_url": "https://example.com/thumb.jpg", "view_count": size * 100, "like_count": size,
+        "comment_count": size, "published_at": now, "analysis_state": AnalysisState.COMPLETED, "fetched_at": now,
+    })
+    words = ["great video", "not sure", "terrible audio", "loved it", "first"]
+    rows = [
+        (
+            {
+                "id": f"{VIDEO_ID}_{i}",
+                "text": f"{words[i % len(words)]} #{i}",
+                "author": f"author{i % 97}",
+                "likeCount": i % 200,
+                "publishedAt": now - timedelta(seconds=i),
+            },
+            {"label": LABELS[i % len(LABELS)], "score": (i % 100) / 100},
+        )
+        for i in range(size)
+    ]
+    await bulk_upsert_comments(db, VIDEO_ID, rows)
+
+
+async def cleanup(db: AsyncSession):
+    await db.execute(delete(CommentModel).where(CommentModel.video_id == VIDEO_ID))
+    await db.execute(delete(VideoAggregate).where(VideoAggregate.video_id == VIDEO_ID))
+    await db.execute(delete(SentimentRollup).where(SentimentRollup.video_id == VIDEO_ID))
+    await db.execute(delete(Video).where(Video.id == VIDEO_ID))
+    await db.commit()
+
+
+async def previous_path(db: AsyncSession, offset: int, limit: int, sentiment=None, min_likes=None, phrase=None):
+    """The multi-query path /comments used before the single-pass query"""
+    label = SentimentLabel(sentiment) if sentiment else None
+    base = _apply_filters(select(CommentModel).where(CommentModel.video_id == VIDEO_ID), label, None, min_likes, phrase)
+
+    await db.scalar(select(func.count()).select_from(base.subquery()))
+    await get_sentiment_totals(db, VIDEO_ID, label, None, min_likes, phrase)
+    page = await db.execute(
+        base.order_by(desc(CommentModel.published_at), desc(CommentModel.id)).offset(offset).limit(limit + 1)
+    )
+    page.all()
+    await get_video_by_id(db, VIDEO_ID)
+
+    labels = await db.execute(
+        _apply_filters(
+            select(CommentModel.sentiment_label).where(CommentModel.video_id == VIDEO_ID),
+            label, None, min_likes, phrase
+        )
+    )
+    Counter(labels.scalars().all())
+
+
+async def single_pass(db: AsyncSession, offset: int, limit: int, sentiment=None, min_likes=None, phrase=None):
+    await query_comments(db, VIDEO_ID, offset, limit, sentiment, None, min_likes, "published_at", "desc", phrase)
+
+
+async def measure(engine, path, rounds: int, **options) -> Dict[str, float]:
+    statements = []
+    listener = lambda *args: statements.append(1)  # noqa: E731
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+
+    timings: List[float] = []
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await path(db, limit=20, **options)  # warm-up
+            statements.clear()
+            for _ in range(rounds):
+                start = time.perf_counter()
+                await path(db, limit=20, **options)
+                timings.append(time.perf_counter() - start)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+
+    return {
+        "round_trips": len(statements) / rounds,
+        "median_ms": statistics.median(timings) * 1000,
+    }
+
+
+async def main(database_url: str, size: int, rounds: int):
+    engine = create_async_engine(database_url)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await cleanup(db)
+            await seed(db, size)
+
+        for name, options in SCENARIOS.items():
+            before = await measure(engine, previous_path, rounds, **options)
+            after = await measure(engine, single_pass, rounds, **options)
+            print(
+                f"{name:>18}: previous {before['round_trips']:.0f} round trips, {before['median_ms']:.1f} ms | "
+                f"single-pass {after['round_trips']:.0f} round trip(s), {after['median_ms']:.1f} ms | "
+                f"{before['median_ms'] / after['median_ms']:.1f}x"
+            )
+    finally:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await cleanup(db)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--comments", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.database_url, args.comments, args.rounds))
@@ -0,0 +1,43 @@
+from typing import Dict, Optional
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.checkpoint import AnalysisCheckpoint
+
+
+async def get_checkpoint(db: AsyncSession, video_id: str) -> Optional[AnalysisCheckpoint]:
+    result = await db.execute(
+        select(AnalysisCheckpoint).where(AnalysisCheckpoint.video_id == video_id)
+    )
+    return result.scalars().first()
+
+
+async def stage_checkpoint(
+    db: AsyncSession,
+    video_id: str,
+    next_page_token: Optional[str],
+    total_analyzed: int,
+    sentiment_totals: Dict[str, int]
+):
+    """Upserts the checkpoint without committing, so it lands in the caller's transaction"""
+    values = {
+        "video_id": video_id,
+        "next_page_token": next_page_token,
+        "total_analyzed": total_analyzed,
+        "sentiment_totals": sentiment_totals,
+        "updated_at": datetime.utcnow(),
+    }
+    statement = pg_insert(AnalysisCheckpoint.__table__).values(values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[AnalysisCheckpoint.__table__.c.video_id],
+        set_={key: statement.excluded[key] for key in values if key != "video_id"},
+    )
+    await db.execute(statement)
+
+
+async def clear_checkpoint(db: AsyncSession, video_id: str):
+    await db.execute(delete(AnalysisCheckpoint).where(AnalysisCheckpoint.video_id == video_id))
+    await db.commit()
@@ -1,25 +1,56 @@
-from typing import Dict, List, Optional
+import json
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
 from datetime import datetime
 
-from sqlalchemy import select, asc, desc, func
+from sqlalchemy import Float, select, asc, desc, func, literal_column, null, or_, true, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.models.comment import CommentModel
+from app.models.comment import SEARCH_CONFIG, CommentModel
 from app.models.enums import SentimentLabel
+from app.models.video import Video
 from app.schemas.comment import CommentSchema, CommentsResponseSchema
-from app.crud.video import get_video_by_id
+from app.crud.aggregate import stage_aggregate_delta, stage_rollup_delta
+from app.utils.cursor import decode_cursor, encode_cursor
 
+# Rows per INSERT statement, keeps bind parameters well under the asyncpg limit
+_UPSERT_CHUNK_SIZE = 1000
 
-async def get_sentiment_totals(
-    db: AsyncSession,
-    video_id: str,
+# Matches are wrapped in <mark> tags; the whole comment is returned so nothing is cut off
+_HIGHLIGHT_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+
+_SORT_COLUMNS = {
+    "published_at": CommentModel.published_at,
+    "like_count": CommentModel.like_count,
+    "sentiment": CommentModel.sentiment_score,
+}
+
+
+def _label_counts() -> list:
+    """One COUNT(*) FILTER column per sentiment label, labelled with the label's value"""
+    return [func.count().filter(CommentModel.sentiment_label == label).label(label.value) for label in SentimentLabel]
+
+
+def _search_query(phrase: str):
+    """Web-search style query (quoted phrases, OR, -word) over the comment search vector"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, phrase)
+
+
+def _apply_filters(
+    query,
     sentiment: Optional[SentimentLabel] = None,
     author: Optional[str] = None,
     min_likes: Optional[int] = None,
     phrase: Optional[str] = None
-) -> Dict[SentimentLabel, int]:
-    query = select(CommentModel.sentiment_label, func.count()).where(CommentModel.video_id == video_id)
-
+):
+    """
+    Comment filters shared by the listing and the totals. The phrase goes through the full-text
+    index, and author substrings through the trigram index (ILIKE is served by gin_trgm_ops).
+    The phrase also matches as a plain substring of the text, which covers partial words and
+    languages written without spaces that the word-based search cannot split.
+    """
     if sentiment:
         query = query.where(CommentModel.sentiment_label == sentiment)
     if author:
@@ -27,7 +58,23 @@ async def get_sentiment_totals(
     if min_likes is not None:
         query = query.where(CommentModel.like_count >= min_likes)
     if phrase:
-        query = query.where(CommentModel.text.ilike(f"%{phrase}%"))
+        query = query.where(or_(
+            CommentModel.__table__.c.search_vector.op("@@")(_search_query(phrase)),
+            CommentModel.text.ilike(f"%{phrase}%"),
+        ))
+    return query
+
+
+async def get_sentiment_totals(
+    db: AsyncSession,
+    video_id: str,
+    sentiment: Optional[SentimentLabel] = None,
+    author: Optional[str] = None,
+    min_likes: Optional[int] = None,
+    phrase: Optional[str] = None
+) -> Dict[SentimentLabel, int]:
+    query = select(CommentModel.sentiment_label, func.count()).where(CommentModel.video_id == video_id)
+    query = _apply_filters(query, sentiment, author, min_likes, phrase)
 
     query = query.group_by(CommentModel.sentiment_label)
     result = await db.execute(query)
@@ -54,50 +101,106 @@ async def get_latest_comment_date(db: AsyncSession, video_id: str) -> Optional[d
     return comment.published_at if comment else None
 
 
-async def get_chart_comments(db: AsyncSession, video_id: str) -> List[tuple]:
-    result = await db.execute(
-        select(CommentModel.id, CommentModel.published_at, CommentModel.sentiment_label)
-        .where(CommentModel.video_id == video_id)
-        .order_by(CommentModel.published_at.asc())
-    )
-    return result.all()
+async def save_comment(db: AsyncSession, video_id: str, comment: dict, sentiment: dict):
+    """Single-comment write, kept for callers outside the analysis pipeline (keeps aggregates in sync)"""
+    await bulk_upsert_comments(db, video_id, [(comment, sentiment)])
 
 
-async def save_comment(db: AsyncSession, video_id: str, comment: dict, sentiment: dict):
+async def bulk_upsert_comments(
+    db: AsyncSession,
+    video_id: str,
+    rows: List[Tuple[dict, dict]]
+) -> Tuple[int, int]:
+    """
+    Writes a batch of (comment, sentiment) pairs with INSERT ... ON CONFLICT in one transaction.
+    Existing comments are updated only when their text or like count changed.
+    The video's running aggregates and time-bucket rollups are adjusted by the inserted rows,
+    and by the difference between old and new values of the updated ones, in the same transaction.
+    Returns (inserted, updated).
+    """
+    values = {}
+    for comment, sentiment in rows:
+        values[comment["id"]] = {
+            "id": comment["id"],
+            "video_id": video_id,
+            "text": comment["text"],
+            "author": comment["author"],
+            "like_count": comment.get("likeCount", 0),
+            "published_at": comment["publishedAt"],
+            "sentiment_label": SentimentLabel(sentiment["label"]),
+            "sentiment_score": sentiment["score"],
+        }
+
+    if not values:
+        return 0, 0
+
+    table = CommentModel.__table__
+    inserted = updated = 0
+    label_counts = Counter()
+    score_sum, length_sum = 0.0, 0
+    rollup_changes = []
+
     try:
-        if await get_comment_by_id(db, comment["id"]):
-            return
-
-        db_comment = CommentModel(
-            id=comment["id"],
-            video_id=video_id,
-            text=comment["text"],
-            author=comment["author"],
-            like_count=comment.get("likeCount", 0),
-            published_at=comment["publishedAt"],
-            sentiment_label=SentimentLabel(sentiment["label"]),
-            sentiment_score=sentiment["score"],
-        )
-        db.add(db_comment)
+        batch = list(values.values())
+        for start in range(0, len(batch), _UPSERT_CHUNK_SIZE):
+            chunk = batch[start:start + _UPSERT_CHUNK_SIZE]
+
+            # Lock the rows that may be updated and keep their old values to take out of the totals
+            existing = await db.execute(
+                select(table.c.id, table.c.sentiment_label, table.c.sentiment_score, func.length(table.c.text))
+                .where(table.c.id.in_([row["id"] for row in chunk]))
+                .with_for_update()
+            )
+            previous = {row[0]: row[1:] for row in existing.all()}
+
+            statement = pg_insert(table).values(chunk)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={
+                    "text": statement.excluded.text,
+                    "like_count": statement.excluded.like_count,
+                    "sentiment_label": statement.excluded.sentiment_label,
+                    "sentiment_score": statement.excluded.sentiment_score,
+                },
+                where=(table.c.text != statement.excluded.text)
+                | (table.c.like_count != statement.excluded.like_count),
+            ).returning(
+                table.c.id,
+                literal_column("xmax = 0"),
+                table.c.sentiment_label,
+                table.c.sentiment_score,
+                func.length(table.c.text),
+                table.c.published_at,
+            )
+
+            result = await db.execute(statement)
+            for comment_id, was_inserted, label, score, length, published_at in result.all():
+                if was_inserted:
+                    inserted += 1
+                    rollup_changes.append((published_at, label, score, 1))
+                else:
+                    updated += 1
+                    old_label, old_score, old_length = previous[comment_id]
+                    label_counts[old_label] -= 1
+                    score_sum -= old_score
+                    length_sum -= old_length
+                    if (old_label, old_score) != (label, score):
+                        rollup_changes.append((published_at, old_label, old_score, -1))
+                        rollup_changes.append((published_at, label, score, 1))
+                label_counts[label] += 1
+                score_sum += score
+                length_sum += length
+
+        if inserted or updated:
+            await stage_aggregate_delta(db, video_id, label_counts, score_sum, length_sum, inserted)
+        if rollup_changes:
+            await stage_rollup_delta(db, video_id, rollup_changes)
         await db.commit()
     except Exception:
         await db.rollback()
         raise
 
-async def get_comment_analysis_metrics(db: AsyncSession, video_id: str):
-    avg_score_query = select(func.avg(CommentModel.sentiment_score)).where(CommentModel.video_id == video_id)
-    avg_length_query = select(func.avg(func.length(CommentModel.text))).where(CommentModel.video_id == video_id)
-
-    avg_score_result = await db.execute(avg_score_query)
-    avg_length_result = await db.execute(avg_length_query)
-
-    avg_score = avg_score_result.scalar() or 0.0
-    avg_length = avg_length_result.scalar() or 0.0
-
-    return {
-        "average_sentiment_score": avg_score,
-        "average_comment_length": avg_length,
-    }
+    return inserted, updated
 
 
 async def query_comments(
@@ -111,52 +214,105 @@ async def query_comments(
     sort_by: str,
     sort_order: str,
     phrase: Optional[str],
+    cursor: Optional[str] = None,
 ) -> CommentsResponseSchema:
-    base_query = select(CommentModel).where(CommentModel.video_id == video_id)
+    """
+    One page of a video's filtered comments. With `cursor` (the `next_cursor` of the previous
+    page) the page starts after that row's (sort key, id) instead of skipping `offset` rows,
+    so every page costs the same as the first. Raises InvalidCursor for a foreign cursor.
 
+    The page, the filtered total, the per-label totals and the video's state come back from
+    one statement, so a request costs a single round trip.
+    """
     sentiment_enum = None
     if sentiment:
         try:
             sentiment_enum = SentimentLabel(sentiment)
-            base_query = base_query.where(CommentModel.sentiment_label == sentiment_enum)
         except ValueError:
             sentiment_enum = SentimentLabel.NEUTRAL
-            base_query = base_query.where(CommentModel.sentiment_label == sentiment_enum)
 
-    if author:
-        base_query = base_query.where(CommentModel.author.ilike(f"%{author}%"))
-    if min_likes is not None:
-        base_query = base_query.where(CommentModel.like_count >= min_likes)
+    def filtered(query):
+        return _apply_filters(query.where(CommentModel.video_id == video_id), sentiment_enum, author, min_likes, phrase)
+
+    # Total and per-label counts of the filtered set, in one scan
+    totals = filtered(select(
+        func.count().label("total_available"),
+        *_label_counts(),
+    )).cte("totals")
+
     if phrase:
-        base_query = base_query.where(CommentModel.text.ilike(f"%{phrase}%"))
+        search = _search_query(phrase)
+        # ts_headline is costly, Postgres evaluates it only for the rows left after LIMIT
+        highlight = func.ts_headline(SEARCH_CONFIG, CommentModel.text, search, _HIGHLIGHT_OPTIONS)
+    else:
+        highlight = null()
 
-    total_available = await db.scalar(
-        select(func.count()).select_from(base_query.subquery())
+    if sort_by == "relevance" and phrase:
+        sort_column = func.ts_rank(CommentModel.__table__.c.search_vector, search, type_=Float)
+        descending = True
+        ordering = "relevance:desc"
+    else:
+        sort_column = _SORT_COLUMNS.get(sort_by, CommentModel.published_at)
+        descending = sort_order != "asc"
+        ordering = f"{sort_column.key}:{'desc' if descending else 'asc'}"
+    # A cursor is only valid for the filtered set it came from, so its tag covers the filters too
+    cursor_scope = json.dumps(
+        [ordering, sentiment_enum.value if sentiment_enum else None, author, min_likes, phrase],
+        separators=(",", ":"),
     )
 
-    # Call helper to get sentiment totals
-    sentiment_totals = await get_sentiment_totals(
-        db=db,
-        video_id=video_id,
-        sentiment=sentiment_enum,
-        author=author,
-        min_likes=min_likes,
-        phrase=phrase
+    # Keyset pagination on (sort key, id); the id makes the order total so no row is skipped or repeated
+    page_query = filtered(select(CommentModel, sort_column.label("sort_key"), highlight.label("highlight")))
+    if cursor:
+        last_key, last_id = decode_cursor(cursor, cursor_scope)
+        row_key = tuple_(sort_column, CommentModel.id)
+        page_query = page_query.where(row_key < (last_key, last_id) if descending else row_key > (last_key, last_id))
+    else:
+        page_query = page_query.offset(offset)
+
+    direction = desc if descending else asc
+    page = page_query.order_by(direction(sort_column), direction(CommentModel.id)).limit(limit + 1).cte("page")
+    page_comment = aliased(CommentModel, page)
+
+    # Page, counts and video state in a single round trip: the totals row always exists and the
+    # page is left-joined onto it, so an empty page still yields one row carrying the counts
+    statement = (
+        select(
+            page_comment,
+            page.c.sort_key,
+            page.c.highlight,
+            totals,
+            Video.comment_count,
+            Video.analysis_state,
+        )
+        .select_from(totals)
+        .outerjoin(Video, Video.id == video_id)
+        .outerjoin(page, true())
+        .order_by(direction(page.c.sort_key), direction(page.c.id))
     )
 
-    sort_column = getattr(CommentModel, sort_by, CommentModel.published_at)
-    order = asc(sort_column) if sort_order == "asc" else desc(sort_column)
-    base_query = base_query.order_by(order).offset(offset).limit(limit)
+    result = await db.execute(statement)
+    rows = result.all()
+    summary = rows[0]
+
+    comment_rows = [row for row in rows if row[0] is not None]
+    has_more = len(comment_rows) > limit
+    comment_rows = comment_rows[:limit]
 
-    result = await db.execute(base_query)
-    comment_rows = result.scalars().all()
+    next_cursor = None
+    if has_more:
+        last = comment_rows[-1]
+        next_cursor = encode_cursor(cursor_scope, [last.sort_key, last[0].id])
 
-    video = await get_video_by_id(db, video_id)
-    total_expected = video.comment_count if video else total_available
-    analysis_state = video.analysis_state if video else "unknown"
+    sentiment_totals = {label: summary._mapping[totals.c[label.value]] for label in SentimentLabel}
+    total_available = summary.total_available
+    video_found = summary.analysis_state is not None
+    total_expected = summary.comment_count if video_found else total_available
+    analysis_state = summary.analysis_state if video_found else "unknown"
 
     comments = [
-        CommentSchema.model_validate(c).model_dump(exclude={"sentiment_totals"}) for c in comment_rows
+        CommentSchema.model_validate(row[0]).model_copy(update={"highlight": row.highlight})
+        for row in comment_rows
     ]
 
     return CommentsResponseSchema(
@@ -166,7 +322,8 @@ async def query_comments(
         total_expected=total_expected,
         offset=offset,
         limit=limit,
-        has_more=(offset + len(comments)) < total_expected,
+        has_more=has_more,
+        next_cursor=next_cursor,
         analysis_state=analysis_state,
         sentiment_totals=sentiment_totals,
     )
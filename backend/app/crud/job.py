@@ -0,0 +1,202 @@
+from typing import List, Optional
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import JobStatus
+from app.models.job import ACTIVE_JOB_STATUSES, AnalysisJob
+
+
+async def get_active_job(db: AsyncSession, video_id: str) -> Optional[AnalysisJob]:
+    result = await db.execute(
+        select(AnalysisJob).where(
+            AnalysisJob.video_id == video_id,
+            AnalysisJob.status.in_(ACTIVE_JOB_STATUSES),
+        )
+    )
+    return result.scalars().first()
+
+
+async def enqueue_job(
+    db: AsyncSession,
+    video_id: str,
+    incremental: bool = False,
+    max_attempts: int = 3,
+    priority: int = 0
+) -> Optional[AnalysisJob]:
+    """
+    Add an analysis job to the queue and commit, unless the video already has a queued or
+    running job (enforced by a partial unique index), in which case that job is returned.
+    """
+    now = datetime.utcnow()
+    table = AnalysisJob.__table__
+    statement = (
+        pg_insert(table)
+        .values(
+            video_id=video_id,
+            incremental=incremental,
+            priority=priority,
+            status=JobStatus.QUEUED,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=now,
+            created_at=now,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[table.c.video_id],
+            index_where=table.c.status.in_(ACTIVE_JOB_STATUSES),
+        )
+    )
+    await db.execute(statement)
+    await db.commit()
+    return await get_active_job(db, video_id)
+
+
+async def list_jobs(db: AsyncSession, limit: int = 50) -> List[AnalysisJob]:
+    """Active jobs first (highest priority, then oldest), followed by the most recently finished"""
+    result = await db.execute(
+        select(AnalysisJob)
+        .order_by(
+            AnalysisJob.status.in_(ACTIVE_JOB_STATUSES).desc(),
+            AnalysisJob.priority.desc(),
+            func.coalesce(AnalysisJob.finished_at, AnalysisJob.created_at).desc(),
+            AnalysisJob.id.desc(),
+        )
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def claim_job(
+    db: AsyncSession,
+    worker_id: str,
+    lease_seconds: int,
+    aging_seconds: int = 300,
+    max_aging_levels: float = 1.5
+) -> Optional[AnalysisJob]:
+    """
+    Lock the most urgent runnable job (queued and due, or running with an expired lease)
+    with FOR UPDATE SKIP LOCKED so concurrent workers never claim the same row,
+    then lease it to `worker_id`.
+
+    Urgency is the job priority plus one level per `aging_seconds` since the job was last
+    enqueued, capped at `max_aging_levels`, so small and incremental jobs jump ahead without
+    starving large ones. A sliced job is re-enqueued after every slice and starts aging again,
+    and the cap keeps a long-waiting large job from outranking fresh high-priority work.
+    """
+    now = datetime.utcnow()
+    waited = func.extract("epoch", literal(now) - AnalysisJob.run_after)
+    aging = func.least(waited / aging_seconds, max_aging_levels)
+    result = await db.execute(
+        select(AnalysisJob)
+        .where(or_(
+            and_(AnalysisJob.status == JobStatus.QUEUED, AnalysisJob.run_after <= now),
+            and_(AnalysisJob.status == JobStatus.RUNNING, AnalysisJob.lease_expires_at < now),
+        ))
+        .order_by((AnalysisJob.priority + aging).desc(), AnalysisJob.run_after, AnalysisJob.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    job = result.scalars().first()
+    if not job:
+        await db.rollback()
+        return None
+
+    if job.status == JobStatus.QUEUED:
+        job.wait_seconds += (now - job.run_after).total_seconds()
+    job.status = JobStatus.RUNNING
+    job.attempts += 1
+    job.lease_owner = worker_id
+    job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+    job.heartbeat_at = now
+    job.started_at = job.started_at or now
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def heartbeat(db: AsyncSession, job_id: int, worker_id: str, lease_seconds: int) -> bool:
+    """Extend the lease; returns False when the job is no longer leased to this worker"""
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(AnalysisJob)
+        .where(
+            AnalysisJob.id == job_id,
+            AnalysisJob.lease_owner == worker_id,
+            AnalysisJob.status == JobStatus.RUNNING,
+        )
+        .values(heartbeat_at=now, lease_expires_at=now + timedelta(seconds=lease_seconds))
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def record_slice(db: AsyncSession, job_id: int, comments: int, seconds: float):
+    """Add one run slice to the job's totals and store its throughput as the current rate"""
+    await db.execute(
+        update(AnalysisJob)
+        .where(AnalysisJob.id == job_id)
+        .values(
+            slices=AnalysisJob.slices + 1,
+            active_seconds=AnalysisJob.active_seconds + seconds,
+            comments_analyzed=AnalysisJob.comments_analyzed + comments,
+            current_rate=round(comments / seconds, 2) if seconds > 0 else 0.0,
+        )
+    )
+    await db.commit()
+
+
+async def yield_job(db: AsyncSession, job_id: int, worker_id: str):
+    """
+    Put a job that finished its time slice back in the queue behind other due jobs. The slice
+    is not a failed attempt, so the attempt counter is restored.
+    """
+    await db.execute(
+        update(AnalysisJob)
+        .where(AnalysisJob.id == job_id, AnalysisJob.lease_owner == worker_id)
+        .values(
+            status=JobStatus.QUEUED,
+            attempts=AnalysisJob.attempts - 1,
+            run_after=datetime.utcnow(),
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+    )
+    await db.commit()
+
+
+async def complete_job(db: AsyncSession, job_id: int, worker_id: str):
+    await db.execute(
+        update(AnalysisJob)
+        .where(AnalysisJob.id == job_id, AnalysisJob.lease_owner == worker_id)
+        .values(
+            status=JobStatus.SUCCEEDED,
+            lease_owner=None,
+            lease_expires_at=None,
+            finished_at=datetime.utcnow(),
+        )
+    )
+    await db.commit()
+
+
+async def fail_job(db: AsyncSession, job: AnalysisJob, worker_id: str, error: str, retry_backoff: int):
+    """Requeue the job with exponential backoff, or mark it failed once attempts are used up"""
+    now = datetime.utcnow()
+    values = {"lease_owner": None, "lease_expires_at": None, "last_error": error[:2000]}
+
+    if job.attempts < job.max_attempts:
+        values.update(
+            status=JobStatus.QUEUED,
+            run_after=now + timedelta(seconds=retry_backoff * 2 ** (job.attempts - 1)),
+        )
+    else:
+        values.update(status=JobStatus.FAILED, finished_at=now)
+
+    await db.execute(
+        update(AnalysisJob)
+        .where(AnalysisJob.id == job.id, AnalysisJob.lease_owner == worker_id)
+        .values(**values)
+    )
+    await db.commit()
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Dict, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.quota import QuotaUsage
+
+
+async def add_quota_spend(
+    db: AsyncSession,
+    quota_day: str,
+    spent: Dict[str, int],
+    exhausted: Set[str],
+    daily_limit: int
+):
+    """Adds units spent per key id and raises exhausted keys to the daily limit, then commits"""
+    table = QuotaUsage.__table__
+    for key_id in set(spent) | exhausted:
+        floor = daily_limit if key_id in exhausted else 0
+        statement = pg_insert(table).values(
+            key_id=key_id,
+            quota_day=quota_day,
+            spent=max(spent.get(key_id, 0), floor),
+            updated_at=datetime.utcnow(),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.key_id, table.c.quota_day],
+            set_={
+                "spent": func.greatest(table.c.spent + spent.get(key_id, 0), floor),
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        await db.execute(statement)
+    await db.commit()
+
+
+async def get_quota_spend(db: AsyncSession, quota_day: str) -> Dict[str, int]:
+    result = await db.execute(
+        select(QuotaUsage.key_id, QuotaUsage.spent).where(QuotaUsage.quota_day == quota_day)
+    )
+    return dict(result.all())
@@ -1,29 +1,50 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from datetime import datetime
 
-from sqlalchemy import select, desc, func
+from sqlalchemy import select, desc, func, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.progress import notify_progress
 from app.models.video import Video
 from app.models.enums import AnalysisState
+from app.utils.cursor import decode_cursor, encode_cursor
+
+_VIDEO_ORDERING = "fetched_at:desc"
 
 
 async def get_analyzed_videos_paginated(
-    db: AsyncSession, offset: int, limit: int
-):
+    db: AsyncSession, offset: int, limit: int, cursor: Optional[str] = None
+) -> Tuple[List[Video], int, Optional[str]]:
+    """
+    Most recently fetched videos first. With `cursor` the page continues after the
+    (fetched_at, id) it encodes instead of skipping `offset` rows.
+    Returns (videos, total, next_cursor).
+    """
     query = select(Video)\
-        .where(Video.analysis_state.in_([AnalysisState.IN_PROGRESS, AnalysisState.COMPLETED]))\
-        .order_by(desc(Video.fetched_at))\
-        .offset(offset).limit(limit)
+        .where(Video.analysis_state.in_([AnalysisState.IN_PROGRESS, AnalysisState.COMPLETED]))
+
+    if cursor:
+        last_fetched_at, last_id = decode_cursor(cursor, _VIDEO_ORDERING)
+        query = query.where(tuple_(Video.fetched_at, Video.id) < (last_fetched_at, last_id))
+    else:
+        query = query.offset(offset)
+
+    query = query.order_by(desc(Video.fetched_at), desc(Video.id)).limit(limit + 1)
 
     result = await db.execute(query)
-    videos = result.scalars().all()
+    videos = list(result.scalars().all())
+
+    next_cursor = None
+    if len(videos) > limit:
+        videos = videos[:limit]
+        next_cursor = encode_cursor(_VIDEO_ORDERING, [videos[-1].fetched_at, videos[-1].id])
 
     total = await db.scalar(
         select(func.count()).select_from(Video).where(Video.analysis_state == AnalysisState.COMPLETED)
     )
 
-    return videos, total
+    return videos, total, next_cursor
 
 
 async def get_video_by_id(db: AsyncSession, video_id: str) -> Optional[Video]:
@@ -34,6 +55,11 @@ async def get_video_by_id(db: AsyncSession, video_id: str) -> Optional[Video]:
     return result.scalars().first()
 
 
+async def get_total_analyzed(db: AsyncSession, video_id: str) -> int:
+    """Current analyzed comment count, read straight from the row rather than the session cache"""
+    return await db.scalar(select(Video.total_analyzed).where(Video.id == video_id)) or 0
+
+
 async def get_full_video_metadata(db: AsyncSession, video_id: str) -> Optional[Video]:
     """Get video by ID (relationship removed)"""
     return await get_video_by_id(db, video_id)
@@ -48,6 +74,20 @@ async def create_video(db: AsyncSession, video_data: Dict[str, Any]) -> Video:
     return db_video
 
 
+async def insert_video_if_absent(db: AsyncSession, video_data: Dict[str, Any]) -> bool:
+    """
+    Insert a new video with ON CONFLICT DO NOTHING and commit. Returns False when a concurrent
+    request inserted it first, so racing first requests never fail on the primary key.
+    """
+    video = Video(**video_data)  # Applies the model defaults
+    values = {column.name: getattr(video, column.name) for column in Video.__table__.columns}
+    result = await db.execute(
+        pg_insert(Video.__table__).values(values).on_conflict_do_nothing(index_elements=[Video.__table__.c.id])
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
 async def update_video(db: AsyncSession, video_id: str, video_data: Dict[str, Any]) -> Optional[Video]:
     """Update video metadata and analysis results"""
     db_video = await get_video_by_id(db, video_id)
@@ -70,14 +110,46 @@ async def update_video_analysis_state(
     db: AsyncSession, 
     video_id: str, 
     state: AnalysisState, 
-    total_analyzed: Optional[int] = None
+    total_analyzed: Optional[int] = None,
+    sentiment_totals: Optional[Dict[str, int]] = None
 ) -> Optional[Video]:
-    """Update the analysis state of a video"""
+    """
+    Update the analysis state of a video and publish a progress event in the same transaction.
+    `sentiment_totals` are the running totals of the analysis and only go into the event.
+    """
     update_data = {
         "analysis_state": state,
         "meta_last_update": datetime.utcnow()  # Consider whether this should be meta or sentiment
     }
     if total_analyzed is not None:
         update_data["total_analyzed"] = total_analyzed
+    if state == AnalysisState.COMPLETED:
+        update_data["last_analyzed_at"] = update_data["meta_last_update"]
 
+    await notify_progress(
+        db, video_id, state=state.value, total_analyzed=total_analyzed, sentiment_totals=sentiment_totals
+    )
     return await update_video(db, video_id, update_data)
+
+
+
+async def transition_analysis_state(
+    db: AsyncSession,
+    video_id: str,
+    from_states: Iterable[AnalysisState],
+    to_state: AnalysisState
+) -> bool:
+    """
+    Atomically move a video between analysis states (no commit). Returns False when another
+    caller got there first, so only one of any number of concurrent callers wins.
+    """
+    result = await db.execute(
+        update(Video)
+        .where(Video.id == video_id, Video.analysis_state.in_(list(from_states)))
+        .values(analysis_state=to_state)
+    )
+    if result.rowcount != 1:
+        return False
+
+    await notify_progress(db, video_id, state=to_state.value)
+    return True
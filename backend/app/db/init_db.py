@@ -1,8 +1,32 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
 from app.db.session import engine
-from app.models.video import Video
-from app.models.comment import CommentModel
-from sqlmodel import SQLModel
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+BASELINE_REVISION = "0001"
+
+
+def _upgrade(connection: Connection):
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+
+    inspector = inspect(connection)
+    untracked = inspector.has_table("videos") and not inspector.has_table("alembic_version")
+    connection.commit()  # Leave no transaction open; migrations manage their own
+
+    if untracked:
+        # Schema was created by create_all before migrations existed. 0001 is exactly the original
+        # videos and comments tables; later revisions tolerate objects create_all already added
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
 
 async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+    """Brings the schema up to date with the Alembic migrations in backend/migrations"""
+    async with engine.connect() as conn:
+        await conn.run_sync(_upgrade)
@@ -1,6 +1,7 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import comments, videos, chart_data
+from app.api.routes import comments, videos, chart_data, health, jobs
 from app.core.config import settings
 
 app = FastAPI(
@@ -29,6 +30,8 @@ app.add_middleware(
 app.include_router(videos.router)
 app.include_router(comments.router)
 app.include_router(chart_data.router)
+app.include_router(health.router)
+app.include_router(jobs.router)
 
 @app.on_event("startup")
 async def on_startup():
@@ -39,3 +42,34 @@ async def on_startup():
     await init_db()
     logger.info("✅ DB initialized.")
 
+    # Share quota spend with the workers, which call the YouTube API from their own processes
+    from app.api.logic.quota import run_quota_sync
+    from app.core.integrations.youtube.async_youtube_client import youtube_client
+    app.state.quota_sync = asyncio.create_task(run_quota_sync(youtube_client.quota))
+
+    if settings.RUN_EMBEDDED_WORKER:
+        from app.worker import run_worker
+        app.state.embedded_worker = asyncio.create_task(run_worker(settings.WORKER_CONCURRENCY))
+
+    # Load the model in the background so startup is not held up by it
+    if settings.SENTIMENT_WARMUP:
+        from app.core.sentiment.executor import on_warmup_done, warm_up_executor
+        app.state.sentiment_warmup = asyncio.create_task(warm_up_executor())
+        app.state.sentiment_warmup.add_done_callback(on_warmup_done)
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    from app.core.sentiment.executor import shutdown_executor
+    from app.core.integrations.youtube.async_youtube_client import youtube_client
+    from app.core.progress import progress_broker
+    embedded_worker = getattr(app.state, "embedded_worker", None)
+    if embedded_worker:
+        embedded_worker.cancel()
+    quota_sync = getattr(app.state, "quota_sync", None)
+    if quota_sync:
+        quota_sync.cancel()
+        await asyncio.gather(quota_sync, return_exceptions=True)  # Lets the last sync finish
+    shutdown_executor()
+    await youtube_client.close()
+    await progress_broker.close()
@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Dict
+from sqlmodel import SQLModel, Field
+
+from app.models.enums import ChartGranularity, SentimentLabel
+
+
+class VideoAggregate(SQLModel, table=True):
+    """
+    Running sentiment totals of a video's stored comments, adjusted in the same transaction
+    as every comment batch so stats are read in O(1) instead of scanning the comments.
+    """
+    __tablename__ = "video_aggregates"
+
+    video_id: str = Field(primary_key=True, foreign_key="videos.id")
+    positive_count: int = 0
+    neutral_count: int = 0
+    negative_count: int = 0
+    ambiguous_count: int = 0
+    score_sum: float = 0.0                              # Sum of sentiment scores
+    length_sum: int = 0                                 # Sum of comment lengths in characters
+    total: int = 0                                      # Number of comments
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    def sentiment_totals(self) -> Dict[str, int]:
+        return {label.value: getattr(self, label_column(label)) for label in SentimentLabel}
+
+    @property
+    def average_score(self) -> float:
+        return self.score_sum / self.total if self.total else 0.0
+
+    @property
+    def average_length(self) -> float:
+        return self.length_sum / self.total if self.total else 0.0
+
+
+class SentimentRollup(SQLModel, table=True):
+    """
+    Sentiment counts of a video's comments per time bucket, for every chart granularity.
+    Maintained alongside VideoAggregate, so a chart is a range scan of the primary key.
+    """
+    __tablename__ = "sentiment_rollups"
+
+    video_id: str = Field(primary_key=True, foreign_key="videos.id")
+    granularity: ChartGranularity = Field(primary_key=True)
+    bucket_start: datetime = Field(primary_key=True)   # date_trunc(granularity, published_at)
+    positive_count: int = 0
+    neutral_count: int = 0
+    negative_count: int = 0
+    ambiguous_count: int = 0
+    score_sum: float = 0.0                              # Sum of sentiment scores
+    total: int = 0                                      # Number of comments
+
+
+def label_column(label: SentimentLabel) -> str:
+    return f"{label.value}_count"
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import Column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import SQLModel, Field
+
+
+class AnalysisCheckpoint(SQLModel, table=True):
+    """Progress of an unfinished full analysis, written in the same transaction as each comment batch"""
+    __tablename__ = "analysis_checkpoints"
+
+    video_id: str = Field(primary_key=True, foreign_key="videos.id")
+    next_page_token: Optional[str] = None               # First page not yet committed
+    total_analyzed: int = 0
+    sentiment_totals: Dict[str, int] = Field(
+        default_factory=dict, sa_column=Column(JSONB, nullable=False)
+    )
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -1,9 +1,37 @@
+from typing import Optional
+from sqlalchemy import Column, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import SQLModel, Field
 from datetime import datetime
 from app.models.enums import SentimentLabel
 
+# Text search configuration for comments: 'simple' lowercases and splits words without
+# language-specific stemming or stop words, so it works for comments in any language
+SEARCH_CONFIG = "simple"
+
 class CommentModel(SQLModel, table=True):
     __tablename__ = "comments"
+    __table_args__ = (
+        # Every comment query filters by video, then groups by label or sorts by a key; sort
+        # indexes end in id for keyset pagination (migrations 0003 and 0005)
+        Index("ix_comments_video_id_sentiment_label", "video_id", "sentiment_label"),
+        Index("ix_comments_video_id_published_at_id", "video_id", "published_at", "id"),
+        Index("ix_comments_video_id_like_count_id", "video_id", "like_count", "id"),
+        Index("ix_comments_video_id_sentiment_score_id", "video_id", "sentiment_score", "id"),
+        # Per-video phrase and author search, GIN over btree_gin + tsvector / pg_trgm (migration 0004)
+        Index("ix_comments_video_id_search", "video_id", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_comments_video_id_author_trgm", "video_id", "author",
+            postgresql_using="gin", postgresql_ops={"author": "gin_trgm_ops"},
+        ),
+        # Substring phrase matches the word-based search misses (migration 0007)
+        Index(
+            "ix_comments_video_id_text_trgm", "video_id", "text",
+            postgresql_using="gin", postgresql_ops={"text": "gin_trgm_ops"},
+        ),
+    )
+    # The search vector is generated by Postgres and only used in queries, never loaded
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
     
     id: str = Field(primary_key=True)
     video_id: str = Field(foreign_key="videos.id")
@@ -14,3 +42,8 @@ class CommentModel(SQLModel, table=True):
     
     sentiment_label: SentimentLabel = Field(default=SentimentLabel.NEUTRAL)
     sentiment_score: float = 0.0
+
+    search_vector: Optional[str] = Field(
+        default=None,
+        sa_column=Column(TSVECTOR, Computed(f"to_tsvector('{SEARCH_CONFIG}', text)", persisted=True)),
+    )
@@ -24,3 +24,15 @@ class SentimentHeadline(str, Enum):
     CONTROVERSIAL = "controversial"
     VIRAL = "viral"
     BORING = "boring"
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class ChartGranularity(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
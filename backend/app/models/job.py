@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field
+
+from app.models.enums import JobStatus
+
+ACTIVE_JOB_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class AnalysisJob(SQLModel, table=True):
+    """
+    A unit of analysis work, claimed by workers with SELECT ... FOR UPDATE SKIP LOCKED.
+    Long full analyses run in time slices and go back to the queue between them,
+    so one huge video cannot hold a worker slot while small ones wait.
+    """
+    __tablename__ = "analysis_jobs"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    video_id: str = Field(foreign_key="videos.id", index=True)
+    incremental: bool = False                           # Only fetch comments newer than the last run
+
+    status: JobStatus = Field(default=JobStatus.QUEUED, index=True)
+    priority: int = 0                                   # Higher runs first; queue wait raises it (capped)
+    attempts: int = 0
+    max_attempts: int = 3
+    run_after: datetime = Field(default_factory=datetime.utcnow)   # Not claimable before (retry backoff)
+    last_error: Optional[str] = None
+
+    # Lease held by the worker running the job, extended by heartbeats
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+
+    # Scheduling stats: time spent queued and running, and throughput of the last slice
+    wait_seconds: float = 0.0
+    active_seconds: float = 0.0
+    slices: int = 0
+    comments_analyzed: int = 0
+    current_rate: float = 0.0                           # Comments per second
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+# At most one queued or running job per video, whichever process tries to enqueue it
+Index(
+    "uq_analysis_jobs_active_video",
+    AnalysisJob.video_id,
+    unique=True,
+    postgresql_where=AnalysisJob.status.in_(ACTIVE_JOB_STATUSES),
+)
@@ -0,0 +1,12 @@
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+
+
+class QuotaUsage(SQLModel, table=True):
+    """YouTube quota units spent per API key and quota day, summed over every process calling the API"""
+    __tablename__ = "youtube_quota_usage"
+
+    key_id: str = Field(primary_key=True)               # QuotaTracker.key_id, never the key itself
+    quota_day: str = Field(primary_key=True)            # ISO date in the quota's (Pacific) timezone
+    spent: int = 0
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
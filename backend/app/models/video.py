@@ -1,6 +1,6 @@
 from datetime import datetime
-from typing import Dict
-from sqlalchemy import Column
+from typing import Dict, Optional
+from sqlalchemy import Column, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import SQLModel, Field
 
@@ -9,6 +9,9 @@ from app.models.enums import AnalysisState, EngagementLevel, SentimentHeadline
 
 class Video(SQLModel, table=True):
     __tablename__ = "videos"
+    __table_args__ = (
+        Index("ix_videos_fetched_at_id", "fetched_at", "id"),     # Keyset pagination of the video list
+    )
 
     id: str = Field(primary_key=True)
     title: str
@@ -48,3 +51,4 @@ class Video(SQLModel, table=True):
     fetched_at: datetime = Field(default_factory=datetime.utcnow)
     meta_last_update: datetime = Field(default_factory=datetime.utcnow)
     sentiment_last_update: datetime = Field(default_factory=datetime.utcnow)
+    last_analyzed_at: Optional[datetime] = None         # When the last full or incremental analysis completed
@@ -2,7 +2,7 @@ from pydantic import BaseModel
 from typing import Dict, Optional, List
 from datetime import datetime
 
-from app.models.enums import SentimentLabel
+from app.models.enums import ChartGranularity, SentimentLabel
 
 class CommentSchema(BaseModel):
     id: str
@@ -12,6 +12,7 @@ class CommentSchema(BaseModel):
     sentiment_score: float
     like_count: int
     published_at: datetime
+    highlight: Optional[str] = None     # Text with phrase matches wrapped in <mark>, when searching
 
     model_config = {
         "from_attributes": True  # Enables ORM conversion
@@ -27,15 +28,20 @@ class CommentsResponseSchema(BaseModel):
     offset: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None   # Pass as `cursor` to fetch the next page by keyset
     analysis_state: str
 
 
-class ChartCommentSchema(BaseModel):
-    id: str
-    published_at: str
-    sentiment_label: Optional[str]
+class ChartBucketSchema(BaseModel):
+    bucket_start: datetime              # UTC start of the bucket
+    positive: int
+    neutral: int
+    negative: int
+    ambiguous: int
+    average_score: float                # Mean sentiment score of the bucket's comments
 
 
-class ChartCommentsResponseSchema(BaseModel):
+class ChartDataResponseSchema(BaseModel):
     video_id: str
-    comments: List[ChartCommentSchema]
+    granularity: ChartGranularity
+    buckets: List[ChartBucketSchema]
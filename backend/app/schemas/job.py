@@ -0,0 +1,36 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from datetime import datetime
+
+from app.models.enums import JobStatus
+
+
+class JobSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    video_id: str
+    incremental: bool
+    status: JobStatus
+    priority: int
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    lease_owner: Optional[str] = None
+    last_error: Optional[str] = None
+
+    wait_seconds: float                 # Total time spent queued, including the current wait
+    active_seconds: float               # Total time spent running
+    slices: int                         # Run slices so far
+    comments_analyzed: int
+    current_rate: float                 # Comments per second in the last slice
+
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class JobListResponse(BaseModel):
+    jobs: List[JobSchema]
+    queued: int
+    running: int
@@ -33,6 +33,7 @@ class VideoResponse(BaseModel):
     
     # Analysis state
     analysis_state: str                                             # Current state of analysis (e.g., PENDING, COMPLETED, FAILED)
+    analysis_job_id: Optional[int] = None                           # Queued or running analysis job shared by all callers
     fetched_at: datetime                                            # When the video was fetched
     meta_last_update: datetime                                      # Last metadata update timestamp
     sentiment_last_update: datetime                                 # Last sentiment data update timestamp
@@ -55,4 +56,5 @@ class AnalyzedVideoList(BaseModel):
     offset: int
     limit: int
     total: int
-    has_more: bool
\ No newline at end of file
+    has_more: bool
+    next_cursor: Optional[str] = None   # Pass as `cursor` to fetch the next page by keyset
\ No newline at end of file
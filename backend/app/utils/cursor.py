@@ -0,0 +1,43 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+
+
+class InvalidCursor(ValueError):
+    """Raised for cursors that are malformed or were issued for a different ordering or filter set"""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(ordering: str, key: List[Any]) -> str:
+    """
+    Opaque keyset cursor: the sort key of the last row of a page (sort value(s) plus id),
+    tagged with the ordering (and filters) it belongs to so it cannot be replayed against another one.
+    """
+    payload = json.dumps({"o": ordering, "k": [_encode_value(value) for value in key]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, ordering: str) -> List[Any]:
+    """Returns the sort key stored in `token`, which must have been issued for `ordering`"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = [_decode_value(value) for value in payload["k"]]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor("Malformed cursor") from e
+
+    if payload.get("o") != ordering:
+        raise InvalidCursor("Cursor was issued for a different sort order or filter")
+    return key
@@ -59,6 +59,10 @@ def chunk_text(text: str, max_length: int = 512) -> List[str]:
         words = words[max_length:]
     return chunks
 
+def chunk_tokens(tokens: List[int], max_length: int = 510) -> List[List[int]]:
+    """Token-aware counterpart of chunk_text: splits token IDs into windows of at most max_length."""
+    return [tokens[i:i + max_length] for i in range(0, len(tokens), max_length)]
+
 def parse_datetime(dt_str: str) -> datetime:
     # Converts string like "2025-05-11T22:33:20Z" to naive UTC datetime
     return datetime.fromisoformat(dt_str.replace("Z", "+00:00")).replace(tzinfo=None)
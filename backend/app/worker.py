@@ -0,0 +1,142 @@
+"""
+Standalone analysis worker.
+
+    python -m app.worker [--concurrency N]
+
+Claims jobs from the analysis_jobs table and runs them. Any number of copies
+can run on any number of nodes: jobs are claimed with FOR UPDATE SKIP LOCKED,
+held through a heartbeated lease, retried with backoff on failure, and picked
+up by another worker when a lease expires (crashed or partitioned worker).
+
+Jobs are claimed by priority (aged since enqueueing), and full analyses run in
+slices of ANALYSIS_SLICE_PAGES pages: after each slice the job is requeued and
+resumes from its checkpoint, so queued videos take turns on the worker slots.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Optional
+
+from app.api.logic.comment import analyze_all_comments
+from app.api.logic.quota import run_quota_sync
+from app.core.integrations.youtube.async_youtube_client import youtube_client
+from app.core.config import settings
+from app.crud import job as crud_job
+from app.crud import video as crud_video
+from app.db.session import AsyncSessionLocal
+from app.models.enums import AnalysisState
+from app.models.job import AnalysisJob
+
+logger = logging.getLogger(__name__)
+
+
+async def _keep_lease(job: AnalysisJob, worker_id: str, analysis: asyncio.Task):
+    """Heartbeats the job lease; cancels the analysis if another worker has taken the job over."""
+    while True:
+        await asyncio.sleep(settings.JOB_LEASE_SECONDS / 3)
+        try:
+            async with AsyncSessionLocal() as db:
+                still_owner = await crud_job.heartbeat(db, job.id, worker_id, settings.JOB_LEASE_SECONDS)
+        except Exception:
+            logger.exception(f"[Worker] Heartbeat failed for job {job.id}")
+            continue
+
+        if not still_owner:
+            logger.warning(f"[Worker] Lost lease on job {job.id}, stopping it")
+            analysis.cancel()
+            return
+
+
+async def run_job(job: AnalysisJob, worker_id: str):
+    async with AsyncSessionLocal() as db:
+        analyzed_before = await crud_video.get_total_analyzed(db, job.video_id)
+        started = time.monotonic()
+
+        # Incremental jobs are short and would lose their full-run fallback if requeued, so only full runs are sliced
+        max_pages = None if job.incremental else settings.ANALYSIS_SLICE_PAGES or None
+        analysis = asyncio.create_task(analyze_all_comments(
+            db, job.video_id, incremental=job.incremental, max_pages=max_pages
+        ))
+        lease = asyncio.create_task(_keep_lease(job, worker_id, analysis))
+
+        error: Optional[str] = None
+        try:
+            state = await analysis
+            if state not in {AnalysisState.COMPLETED, AnalysisState.IN_PROGRESS}:
+                error = f"analysis ended in state {state}"
+        except asyncio.CancelledError:
+            # _keep_lease only returns after cancelling the analysis for a lost lease; any other
+            # cancellation (shutdown, SIGTERM) is aimed at this worker and must stop it
+            if asyncio.current_task().cancelling() or not lease.done():
+                raise
+            return  # Lease lost, the new owner is responsible for the job
+        except Exception as e:
+            logger.exception(f"[Worker] Job {job.id} crashed")
+            error = repr(e)
+        finally:
+            lease.cancel()
+
+        analyzed = max(0, await crud_video.get_total_analyzed(db, job.video_id) - analyzed_before)
+        await crud_job.record_slice(db, job.id, analyzed, time.monotonic() - started)
+
+        if error:
+            await crud_job.fail_job(db, job, worker_id, error, settings.JOB_RETRY_BACKOFF)
+            logger.warning(f"[Worker] Job {job.id} for {job.video_id} failed (attempt {job.attempts}): {error}")
+        elif state == AnalysisState.IN_PROGRESS:
+            await crud_job.yield_job(db, job.id, worker_id)
+            logger.info(f"[Worker] Job {job.id} for {job.video_id} yielded after {analyzed} comments")
+        else:
+            await crud_job.complete_job(db, job.id, worker_id)
+            logger.info(f"[Worker] Job {job.id} for {job.video_id} completed")
+
+
+async def _worker_slot(slot: int):
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{slot}"
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                job = await crud_job.claim_job(
+                    db, worker_id, settings.JOB_LEASE_SECONDS,
+                    settings.JOB_PRIORITY_AGING_SECONDS, settings.JOB_PRIORITY_AGING_MAX_LEVELS
+                )
+        except Exception:
+            logger.exception("[Worker] Failed to claim a job")
+            job = None
+
+        if job is None:
+            await asyncio.sleep(settings.WORKER_POLL_INTERVAL)
+            continue
+
+        logger.info(f"[Worker] {worker_id} claimed job {job.id} for video {job.video_id} (attempt {job.attempts})")
+        await run_job(job, worker_id)
+
+
+async def run_worker(concurrency: int):
+    """Runs `concurrency` job slots in this process until cancelled."""
+    logger.info(f"[Worker] Starting {concurrency} job slot(s)")
+    await asyncio.gather(*(_worker_slot(slot) for slot in range(concurrency)))
+
+
+async def _main(concurrency: int):
+    """Standalone worker: the job slots plus sharing this process's YouTube quota spend"""
+    quota_sync = asyncio.create_task(run_quota_sync(youtube_client.quota))
+    try:
+        await run_worker(concurrency)
+    finally:
+        quota_sync.cancel()
+        await asyncio.gather(quota_sync, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_main(args.concurrency))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,70 @@
+"""
+Alembic environment. Runs against DATABASE_URL with the async engine, or on the connection
+handed over in `config.attributes["connection"]` when migrations run on API startup (init_db).
+"""
+import asyncio
+import os
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+# Register every table on the metadata used by --autogenerate
+from app.models.video import Video  # noqa: F401
+from app.models.comment import CommentModel  # noqa: F401
+from app.models.checkpoint import AnalysisCheckpoint  # noqa: F401
+from app.models.job import AnalysisJob  # noqa: F401
+from app.models.aggregate import SentimentRollup, VideoAggregate  # noqa: F401
+from app.models.quota import QuotaUsage  # noqa: F401
+
+config = context.config
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = SQLModel.metadata
+
+
+def _database_url() -> str:
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise ValueError("DATABASE_URL not set in environment variables")
+    return url
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL instead of running it (alembic upgrade head --sql)"""
+    context.configure(
+        url=_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    # One transaction per migration, so CREATE INDEX CONCURRENTLY can run in an autocommit block
+    context.configure(connection=connection, target_metadata=target_metadata, transaction_per_migration=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(_database_url(), poolclass=pool.NullPool)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+elif "connection" in config.attributes:
+    do_run_migrations(config.attributes["connection"])
+else:
+    asyncio.run(run_async_migrations())
@@ -0,0 +1,78 @@
+"""Baseline schema: videos and comments, as created by SQLModel before migrations existed
+
+Databases created with SQLModel.metadata.create_all before migrations existed are stamped
+with this revision on startup (see app.db.init_db) instead of running it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLModel stores str enums by member name
+engagement_level = sa.Enum("HIGH", "MEDIUM", "LOW", name="engagementlevel")
+sentiment_headline = sa.Enum(
+    "POSITIVE", "NEUTRAL", "NEGATIVE", "CONTROVERSIAL", "VIRAL", "BORING", name="sentimentheadline"
+)
+analysis_state = sa.Enum("PENDING", "IN_PROGRESS", "COMPLETED", "FAILED", name="analysisstate")
+sentiment_label = sa.Enum("POSITIVE", "NEUTRAL", "NEGATIVE", "AMBIGUOUS", name="sentimentlabel")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "videos",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("channel_id", sa.String(), nullable=False),
+        sa.Column("channel_name", sa.String(), nullable=False),
+        sa.Column("thumbnail_url", sa.String(), nullable=False),
+        sa.Column("view_count", sa.Integer(), nullable=False),
+        sa.Column("like_count", sa.Integer(), nullable=False),
+        sa.Column("comment_count", sa.Integer(), nullable=False),
+        sa.Column("published_at", sa.DateTime(), nullable=False),
+        sa.Column("like_rate", sa.Float(), nullable=False),
+        sa.Column("comment_rate", sa.Float(), nullable=False),
+        sa.Column("engagement_rate", sa.Float(), nullable=False),
+        sa.Column("engagement_level", engagement_level, nullable=False),
+        sa.Column("engagement_label", sa.String(), nullable=False),
+        sa.Column("sentiment_headline", sentiment_headline, nullable=False),
+        sa.Column("average_sentiment_score", sa.Float(), nullable=False),
+        sa.Column("controversiality_score", sa.Float(), nullable=False),
+        sa.Column("sentiment_totals", postgresql.JSONB(), nullable=True),
+        sa.Column("total_analyzed", sa.Integer(), nullable=False),
+        sa.Column("average_comment_length", sa.Float(), nullable=False),
+        sa.Column("trend", sa.String(), nullable=False),
+        sa.Column("trend_explanation", sa.String(), nullable=False),
+        sa.Column("analysis_state", analysis_state, nullable=False),
+        sa.Column("fetched_at", sa.DateTime(), nullable=False),
+        sa.Column("meta_last_update", sa.DateTime(), nullable=False),
+        sa.Column("sentiment_last_update", sa.DateTime(), nullable=False),
+    )
+
+    op.create_table(
+        "comments",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("video_id", sa.String(), sa.ForeignKey("videos.id"), nullable=False),
+        sa.Column("author", sa.String(), nullable=False),
+        sa.Column("text", sa.String(), nullable=False),
+        sa.Column("like_count", sa.Integer(), nullable=False),
+        sa.Column("published_at", sa.DateTime(), nullable=False),
+        sa.Column("sentiment_label", sentiment_label, nullable=False),
+        sa.Column("sentiment_score", sa.Float(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("comments")
+    op.drop_table("videos")
+    for enum in (sentiment_label, analysis_state, sentiment_headline, engagement_level):
+        enum.drop(op.get_bind(), checkfirst=True)
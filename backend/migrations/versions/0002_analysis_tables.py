@@ -0,0 +1,109 @@
+"""Analysis bookkeeping: last_analyzed_at, checkpoints, the job queue and video aggregates
+
+Everything the analysis pipeline added on top of the baseline videos and comments tables.
+Databases built by create_all while these models already existed are stamped at 0001 like
+any untracked database, so every statement here tolerates objects that already exist.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLModel stores str enums by member name; the type is created explicitly (checkfirst)
+job_status = postgresql.ENUM("QUEUED", "RUNNING", "SUCCEEDED", "FAILED", name="jobstatus", create_type=False)
+
+
+def upgrade() -> None:
+    op.add_column("videos", sa.Column("last_analyzed_at", sa.DateTime(), nullable=True), if_not_exists=True)
+
+    op.create_table(
+        "analysis_checkpoints",
+        sa.Column("video_id", sa.String(), sa.ForeignKey("videos.id"), primary_key=True),
+        sa.Column("next_page_token", sa.String(), nullable=True),
+        sa.Column("total_analyzed", sa.Integer(), nullable=False),
+        sa.Column("sentiment_totals", postgresql.JSONB(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+
+    job_status.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "analysis_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("video_id", sa.String(), sa.ForeignKey("videos.id"), nullable=False),
+        sa.Column("incremental", sa.Boolean(), nullable=False),
+        sa.Column("status", job_status, nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_after", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("lease_owner", sa.String(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("wait_seconds", sa.Float(), nullable=False),
+        sa.Column("active_seconds", sa.Float(), nullable=False),
+        sa.Column("slices", sa.Integer(), nullable=False),
+        sa.Column("comments_analyzed", sa.Integer(), nullable=False),
+        sa.Column("current_rate", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+    # Job tables created before the scheduling stats existed lack these columns
+    for name, column_type in (
+        ("priority", sa.Integer()),
+        ("wait_seconds", sa.Float()),
+        ("active_seconds", sa.Float()),
+        ("slices", sa.Integer()),
+        ("comments_analyzed", sa.Integer()),
+        ("current_rate", sa.Float()),
+    ):
+        op.add_column(
+            "analysis_jobs",
+            sa.Column(name, column_type, nullable=False, server_default="0"),
+            if_not_exists=True,
+        )
+    op.create_index("ix_analysis_jobs_video_id", "analysis_jobs", ["video_id"], if_not_exists=True)
+    op.create_index("ix_analysis_jobs_status", "analysis_jobs", ["status"], if_not_exists=True)
+    op.create_index(
+        "uq_analysis_jobs_active_video",
+        "analysis_jobs",
+        ["video_id"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('QUEUED', 'RUNNING')"),
+        if_not_exists=True,
+    )
+
+    op.create_table(
+        "video_aggregates",
+        sa.Column("video_id", sa.String(), sa.ForeignKey("videos.id"), primary_key=True),
+        sa.Column("positive_count", sa.Integer(), nullable=False),
+        sa.Column("neutral_count", sa.Integer(), nullable=False),
+        sa.Column("negative_count", sa.Integer(), nullable=False),
+        sa.Column("ambiguous_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("length_sum", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("video_aggregates")
+    op.drop_table("analysis_jobs")
+    op.drop_table("analysis_checkpoints")
+    op.drop_column("videos", "last_analyzed_at")
+    job_status.drop(op.get_bind(), checkfirst=True)
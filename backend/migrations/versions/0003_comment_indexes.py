@@ -0,0 +1,36 @@
+"""Composite indexes for the per-video comment queries
+
+Every comment query filters on video_id and then sorts by published_at or like_count, or
+groups by sentiment_label; without these each one scanned all videos' comments. Built
+CONCURRENTLY so writers are not blocked on a large table.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_comments_video_id_published_at": ["video_id", "published_at"],
+    "ix_comments_video_id_sentiment_label": ["video_id", "sentiment_label"],
+    "ix_comments_video_id_like_count": ["video_id", "like_count"],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(name, "comments", columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(name, table_name="comments", postgresql_concurrently=True, if_exists=True)
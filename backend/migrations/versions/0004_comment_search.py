@@ -0,0 +1,62 @@
+"""Full-text and trigram search on comments
+
+Adds a generated tsvector column over the comment text ('simple' configuration, which suits
+the multilingual comments the XLM-R model scores) and GIN indexes scoped by video: one on the
+tsvector for phrase search and a pg_trgm one on author for substring matches. btree_gin lets
+video_id lead both GIN indexes.
+
+Adding the stored column rewrites the comments table once.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.add_column(
+        "comments",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('simple', text)", persisted=True),
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comments_video_id_search",
+            "comments",
+            ["video_id", "search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_comments_video_id_author_trgm",
+            "comments",
+            ["video_id", "author"],
+            postgresql_using="gin",
+            postgresql_ops={"author": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_comments_video_id_author_trgm", table_name="comments", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_comments_video_id_search", table_name="comments", postgresql_concurrently=True, if_exists=True)
+    op.drop_column("comments", "search_vector")
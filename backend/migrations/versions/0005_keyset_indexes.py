@@ -0,0 +1,46 @@
+"""Indexes for keyset pagination of comments and videos
+
+Keyset pages continue after the (sort key, id) of the previous page's last row. Indexes that
+end in id let Postgres seek straight to that row, even through long runs of equal sort values
+(most comments have 0 likes). They supersede the (video_id, published_at) and
+(video_id, like_count) indexes from 0003.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_comments_video_id_published_at_id": ("comments", ["video_id", "published_at", "id"]),
+    "ix_comments_video_id_like_count_id": ("comments", ["video_id", "like_count", "id"]),
+    "ix_comments_video_id_sentiment_score_id": ("comments", ["video_id", "sentiment_score", "id"]),
+    "ix_videos_fetched_at_id": ("videos", ["fetched_at", "id"]),
+}
+SUPERSEDED = {
+    "ix_comments_video_id_published_at": ["video_id", "published_at"],
+    "ix_comments_video_id_like_count": ["video_id", "like_count"],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name in SUPERSEDED:
+            op.drop_index(name, table_name="comments", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in SUPERSEDED.items():
+            op.create_index(name, "comments", columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, (table, _) in INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,56 @@
+"""Sentiment rollups per video, granularity and time bucket
+
+Charts read per-bucket sentiment counts from this table instead of aggregating the comments on
+every view. Rows are kept up to date by the comment batch writes; this migration backfills them
+for the comments already stored.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLModel stores str enums by member name
+GRANULARITIES = ["HOUR", "DAY", "WEEK", "MONTH"]
+chart_granularity = sa.Enum(*GRANULARITIES, name="chartgranularity")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sentiment_rollups",
+        sa.Column("video_id", sa.String(), sa.ForeignKey("videos.id"), primary_key=True),
+        sa.Column("granularity", chart_granularity, primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(), primary_key=True),
+        sa.Column("positive_count", sa.Integer(), nullable=False),
+        sa.Column("neutral_count", sa.Integer(), nullable=False),
+        sa.Column("negative_count", sa.Integer(), nullable=False),
+        sa.Column("ambiguous_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+    )
+
+    for granularity in GRANULARITIES:
+        op.execute(f"""
+            INSERT INTO sentiment_rollups
+            SELECT video_id, '{granularity}'::chartgranularity, date_trunc('{granularity.lower()}', published_at) AS bucket_start,
+                   count(*) FILTER (WHERE sentiment_label = 'POSITIVE'),
+                   count(*) FILTER (WHERE sentiment_label = 'NEUTRAL'),
+                   count(*) FILTER (WHERE sentiment_label = 'NEGATIVE'),
+                   count(*) FILTER (WHERE sentiment_label = 'AMBIGUOUS'),
+                   coalesce(sum(sentiment_score), 0), count(*)
+            FROM comments
+            GROUP BY video_id, bucket_start
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("sentiment_rollups")
+    chart_granularity.drop(op.get_bind(), checkfirst=True)
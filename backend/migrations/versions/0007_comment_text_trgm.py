@@ -0,0 +1,36 @@
+"""Trigram index on comment text for substring phrase matches
+
+The 'simple' full-text search only matches whole words, so partial words and text written
+without spaces (Chinese, Japanese) never match. Phrase search also matches comment text with
+ILIKE, which this index serves the same way the author index does.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comments_video_id_text_trgm",
+            "comments",
+            ["video_id", "text"],
+            postgresql_using="gin",
+            postgresql_ops={"text": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_comments_video_id_text_trgm", table_name="comments", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,32 @@
+"""YouTube quota spend per API key and quota day
+
+The API process and every analysis worker spend quota on the same keys. Each process adds its
+spend here, so key selection and /health/quota account for all of them.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "youtube_quota_usage",
+        sa.Column("key_id", sa.String(), primary_key=True),
+        sa.Column("quota_day", sa.String(), primary_key=True),
+        sa.Column("spent", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("youtube_quota_usage")
@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+os.environ.setdefault("YOUTUBE_API_KEY", "test-key")
+
+from tests.fake_youtube import FakeYouTubeServer  # noqa: E402
+
+
+@pytest.fixture
+def fake_youtube():
+    server = FakeYouTubeServer()
+    server.start()
+    yield server
+    server.stop()
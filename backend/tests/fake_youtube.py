@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_comment_thread(index: int, video_id: str) -> dict:
+    return {
+        "snippet": {
+            "topLevelComment": {
+                "id": f"{video_id}-c{index}",
+                "snippet": {
+                    "textDisplay": f"comment {index}",
+                    "authorDisplayName": f"author {index % 7}",
+                    "likeCount": index % 5,
+                    "publishedAt": f"2025-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}Z",
+                    "authorChannelId": {"value": f"channel-{index % 7}"},
+                },
+            }
+        }
+    }
+
+
+class FakeYouTubeServer:
+    """
+    Minimal local stand-in for the YouTube Data API v3 videos and commentThreads
+    endpoints, serving `comments_per_video` generated comments per video.
+
+    A video is in flight from its first comment page request until its last page is served;
+    `peak_videos_in_flight` records the most videos paged through at the same time.
+    """
+
+    def __init__(self, comments_per_video: int = 25, page_delay: float = 0.0):
+        self.comments_per_video = comments_per_video
+        self.page_delay = page_delay
+        self.requests = []
+        self.fail_with = None
+        self.undated = set()  # Indices of comments served without a publishedAt
+        self.peak_videos_in_flight = 0
+        self._videos_in_flight = set()
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                server.requests.append((url.path, params))
+
+                if server.fail_with:
+                    status, body = server.fail_with, {
+                        "error": {"message": "quota exceeded", "errors": [{"reason": "quotaExceeded"}]}
+                    }
+                elif url.path.endswith("/videos"):
+                    status, body = 200, server.videos(params)
+                elif url.path.endswith("/commentThreads"):
+                    status, body = 200, server.comment_threads(params)
+                else:
+                    status, body = 404, {"error": {"message": "not found"}}
+
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}/youtube/v3"
+
+    def videos(self, params: dict) -> dict:
+        if params["id"] == "missing":
+            return {"items": []}
+        return {
+            "items": [{
+                "id": params["id"],
+                "snippet": {"title": f"Video {params['id']}", "publishedAt": "2025-01-01T00:00:00Z"},
+                "statistics": {"viewCount": "1000", "commentCount": str(self.comments_per_video)},
+            }]
+        }
+
+    def comment_threads(self, params: dict) -> dict:
+        start = int(params.get("pageToken", 0))
+        end = min(start + int(params.get("maxResults", 20)), self.comments_per_video)
+        indices = range(start, end)
+        if params.get("order") == "time":
+            # Newest first: later indices are published later
+            indices = [self.comments_per_video - 1 - i for i in indices]
+        body = {"items": [make_comment_thread(i, params["videoId"]) for i in indices]}
+        for index, item in zip(indices, body["items"]):
+            if index in self.undated:
+                del item["snippet"]["topLevelComment"]["snippet"]["publishedAt"]
+        with self._lock:
+            self._videos_in_flight.add(params["videoId"])
+            self.peak_videos_in_flight = max(self.peak_videos_in_flight, len(self._videos_in_flight))
+
+        time.sleep(self.page_delay)  # Keeps pages of concurrent videos overlapping
+
+        if end < self.comments_per_video:
+            body["nextPageToken"] = str(end)
+        else:
+            with self._lock:
+                self._videos_in_flight.discard(params["videoId"])
+        return body
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.logic.chart import MAX_CHART_BUCKETS, pick_granularity
+from app.crud.aggregate import bucket_start
+from app.models.enums import ChartGranularity
+
+PUBLISHED = datetime(2024, 5, 16, 13, 45, 12, 500)  # A Thursday
+
+
+@pytest.mark.parametrize("granularity, expected", [
+    (ChartGranularity.HOUR, datetime(2024, 5, 16, 13)),
+    (ChartGranularity.DAY, datetime(2024, 5, 16)),
+    (ChartGranularity.WEEK, datetime(2024, 5, 13)),
+    (ChartGranularity.MONTH, datetime(2024, 5, 1)),
+])
+def test_bucket_start_matches_date_trunc(granularity, expected):
+    assert bucket_start(PUBLISHED, granularity) == expected
+
+
+@pytest.mark.parametrize("span, expected", [
+    (None, ChartGranularity.HOUR),
+    (timedelta(hours=MAX_CHART_BUCKETS - 1), ChartGranularity.HOUR),
+    (timedelta(hours=MAX_CHART_BUCKETS), ChartGranularity.DAY),
+    (timedelta(days=3 * 365), ChartGranularity.WEEK),
+    (timedelta(days=20 * 365), ChartGranularity.MONTH),
+])
+def test_pick_granularity_keeps_charts_under_the_bucket_limit(span, expected):
+    last = PUBLISHED + span if span else None
+    assert pick_granularity(PUBLISHED, last) == expected
@@ -0,0 +1,196 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.logic import comment as logic_comment
+from app.models.enums import AnalysisState
+
+
+def fake_executor(failing_texts):
+    """Stands in for analyze_batch_async: a batch fails when it holds a failing text"""
+    calls = []
+
+    async def analyze(texts):
+        calls.append(list(texts))
+        if any(text in failing_texts for text in texts):
+            raise RuntimeError("Sentiment Analysis Error: bad comment")
+        return [{"label": "positive", "score": 0.9} for _ in texts]
+
+    return analyze, calls
+
+
+def test_failed_page_is_scored_one_comment_at_a_time(monkeypatch):
+    analyze, calls = fake_executor({"bad"})
+    monkeypatch.setattr(logic_comment, "analyze_batch_async", analyze)
+    comments = [{"text": "good"}, {"text": "bad"}, {"text": "fine"}]
+
+    scored = asyncio.run(logic_comment._score_comments("video", comments))
+
+    assert [comment["text"] for comment, _ in scored] == ["good", "fine"]
+    assert calls == [["good", "bad", "fine"], ["good"], ["bad"], ["fine"]]
+
+
+def test_page_without_any_scored_comment_aborts(monkeypatch):
+    analyze, _ = fake_executor({"bad", "worse"})
+    monkeypatch.setattr(logic_comment, "analyze_batch_async", analyze)
+
+    with pytest.raises(logic_comment.AnalysisAborted):
+        asyncio.run(logic_comment._score_comments("video", [{"text": "bad"}, {"text": "worse"}]))
+
+
+class FakeYouTube:
+    """Serves pages of comments keyed by page token; None is the first page"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.started_at = []
+
+    async def iter_comment_pages(self, video_id, page_token=None, max_pages=None):
+        self.started_at.append(page_token)
+        fetched = 0
+        while True:
+            comments, next_page = self.pages[page_token]
+            yield comments, next_page
+            fetched += 1
+            if not next_page or (max_pages and fetched >= max_pages):
+                return
+            page_token = next_page
+
+
+class FakeStore:
+    """In-memory stand-in for the checkpoint, comment and video crud used by the pipeline"""
+
+    def __init__(self, checkpoint=None, fail_saves_after=None):
+        self.checkpoint = checkpoint
+        self.staged = None
+        self.comments = {}
+        self.states = []
+        self.events = []
+        self.aggregate_totals = {"positive": 0}
+        self.fail_saves_after = fail_saves_after
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(logic_comment.crud_checkpoint, "get_checkpoint", self.get_checkpoint)
+        monkeypatch.setattr(logic_comment.crud_checkpoint, "stage_checkpoint", self.stage_checkpoint)
+        monkeypatch.setattr(logic_comment.crud_checkpoint, "clear_checkpoint", self.clear_checkpoint)
+        monkeypatch.setattr(logic_comment.crud_comment, "bulk_upsert_comments", self.bulk_upsert_comments)
+        monkeypatch.setattr(logic_comment.crud_video, "update_video_analysis_state", self.update_state)
+        monkeypatch.setattr(logic_comment.crud_aggregate, "get_aggregate", self.get_aggregate)
+
+    async def get_checkpoint(self, db, video_id):
+        return self.checkpoint
+
+    async def stage_checkpoint(self, db, video_id, next_page_token, total_analyzed, sentiment_totals):
+        self.staged = SimpleNamespace(
+            next_page_token=next_page_token, total_analyzed=total_analyzed, sentiment_totals=sentiment_totals
+        )
+
+    async def clear_checkpoint(self, db, video_id):
+        self.checkpoint = None
+
+    async def bulk_upsert_comments(self, db, video_id, rows):
+        if self.fail_saves_after is not None and len(self.comments) >= self.fail_saves_after:
+            raise RuntimeError("database went away")
+        inserted = sum(comment["id"] not in self.comments for comment, _ in rows)
+        self.comments.update((comment["id"], sentiment) for comment, sentiment in rows)
+        self.checkpoint, self.staged = self.staged or self.checkpoint, None  # The batch's commit
+        return inserted, len(rows) - inserted
+
+    async def update_state(self, db, video_id, state, total_analyzed=None, sentiment_totals=None):
+        self.states.append((state, total_analyzed))
+        if sentiment_totals is not None:
+            self.events.append(sentiment_totals)
+
+    async def get_aggregate(self, db, video_id):
+        return SimpleNamespace(sentiment_totals=lambda: dict(self.aggregate_totals))
+
+
+class FakeSession:
+    async def rollback(self):
+        pass
+
+
+def make_pages(count, per_page=2):
+    """Pages None -> "1" -> "2" ... with `per_page` comments each, the last page without a next token"""
+    tokens = [None] + [str(i) for i in range(1, count)]
+    return {
+        token: (
+            [{"id": f"c{page}-{i}", "text": f"comment {page}-{i}"} for i in range(per_page)],
+            tokens[page + 1] if page + 1 < count else None,
+        )
+        for page, token in enumerate(tokens)
+    }
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    monkeypatch.setattr(logic_comment.settings, "ANALYSIS_FLUSH_SIZE", 2)
+    monkeypatch.setattr(logic_comment, "analyze_batch_async", fake_executor(set())[0])
+
+    def build(pages, store):
+        youtube = FakeYouTube(pages)
+        monkeypatch.setattr(logic_comment, "youtube_client", youtube)
+        store.install(monkeypatch)
+        return youtube
+
+    return build
+
+
+def test_full_analysis_stores_every_page_and_clears_the_checkpoint(pipeline):
+    store = FakeStore()
+    pipeline(make_pages(3), store)
+
+    state = asyncio.run(logic_comment.analyze_all_comments(FakeSession(), "video"))
+
+    assert state == AnalysisState.COMPLETED
+    assert len(store.comments) == 6
+    assert store.checkpoint is None
+    assert store.states[-1] == (AnalysisState.COMPLETED, 6)
+
+
+def test_slice_stops_after_max_pages_with_the_checkpoint_in_place(pipeline):
+    store = FakeStore()
+    pipeline(make_pages(3), store)
+
+    state = asyncio.run(logic_comment.analyze_all_comments(FakeSession(), "video", max_pages=2))
+
+    assert state == AnalysisState.IN_PROGRESS
+    assert len(store.comments) == 4
+    assert (store.checkpoint.next_page_token, store.checkpoint.total_analyzed) == ("2", 4)
+
+
+def test_resumed_analysis_continues_from_the_checkpoint(pipeline):
+    checkpoint = SimpleNamespace(next_page_token="2", total_analyzed=4, sentiment_totals={"positive": 4})
+    store = FakeStore(checkpoint=checkpoint)
+    youtube = pipeline(make_pages(3), store)
+
+    state = asyncio.run(logic_comment.analyze_all_comments(FakeSession(), "video"))
+
+    assert state == AnalysisState.COMPLETED
+    assert youtube.started_at == ["2"]
+    assert set(store.comments) == {"c2-0", "c2-1"}
+    assert store.states[-1] == (AnalysisState.COMPLETED, 6)
+
+
+def test_failed_save_fails_the_run_without_moving_the_checkpoint(pipeline):
+    store = FakeStore(fail_saves_after=2)
+    pipeline(make_pages(3), store)
+
+    state = asyncio.run(logic_comment.analyze_all_comments(FakeSession(), "video"))
+
+    assert state == AnalysisState.FAILED
+    assert len(store.comments) == 2
+    assert store.checkpoint.next_page_token == "1"
+    assert store.states[-1] == (AnalysisState.FAILED, None)
+
+
+def test_progress_events_carry_the_stored_totals_on_a_rerun(pipeline):
+    # A from-scratch rerun: every comment is stored already, so the video's totals stay put
+    store = FakeStore()
+    store.aggregate_totals = {"positive": 6}
+    pipeline(make_pages(3), store)
+
+    asyncio.run(logic_comment.analyze_all_comments(FakeSession(), "video"))
+
+    assert store.events == [{"positive": 6}] * 3
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+import pytest
+
+from app.utils.cursor import InvalidCursor, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_sort_key_and_id():
+    key = [datetime(2024, 5, 1, 12, 30, 15, 250), "Ugx123"]
+    token = encode_cursor("published_at:desc", key)
+
+    assert "=" not in token
+    assert decode_cursor(token, "published_at:desc") == key
+    assert decode_cursor(encode_cursor("sentiment_score:asc", [0.1 + 0.2, "a"]), "sentiment_score:asc") == [0.1 + 0.2, "a"]
+
+
+def test_cursor_is_bound_to_its_ordering():
+    token = encode_cursor("like_count:desc", [3, "Ugx123"])
+
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, "like_count:asc")
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "W10"])
+def test_malformed_cursor_is_rejected(token):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, "published_at:desc")
@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.integrations.youtube.quota import QuotaExceeded, QuotaTracker, TokenBucket
+
+
+def test_token_bucket_allows_a_burst_then_paces_requests():
+    async def scenario():
+        bucket = TokenBucket(rate=20, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst = time.monotonic() - start
+        for _ in range(2):
+            await bucket.acquire()
+        return burst, time.monotonic() - start
+
+    burst, total = asyncio.run(scenario())
+
+    assert burst < 0.05
+    assert total >= 2 / 20 * 0.9
+
+
+def test_quota_tracker_spends_the_key_with_most_budget_left():
+    tracker = QuotaTracker(["key-aaaa", "key-bbbb"], daily_limit=3)
+
+    assert [tracker.reserve(1) for _ in range(4)] == ["key-aaaa", "key-bbbb", "key-aaaa", "key-bbbb"]
+    assert tracker.report()["remaining"] == 2
+
+    tracker.exhaust("key-aaaa")
+    assert tracker.reserve(1) == "key-bbbb"
+    with pytest.raises(QuotaExceeded):
+        tracker.reserve(1)
+
+
+def test_quota_tracker_starts_over_on_a_new_quota_day(monkeypatch):
+    tracker = QuotaTracker(["key-aaaa"], daily_limit=2)
+    tracker.reserve(2)
+
+    monkeypatch.setattr(QuotaTracker, "_today", staticmethod(lambda: "2999-01-01"))
+
+    assert tracker.remaining("key-aaaa") == 2
+    assert tracker.report()["quota_day"] == "2999-01-01"
+
+
+def test_quota_trackers_share_spend_through_take_and_merge():
+    api, worker = QuotaTracker(["key-aaaa"], daily_limit=100), QuotaTracker(["key-aaaa"], daily_limit=100)
+    shared = {}
+
+    def sync(tracker):
+        day, spent, exhausted = tracker.take_unsynced()
+        for key_id, units in spent.items():
+            shared[key_id] = shared.get(key_id, 0) + units
+        tracker.merge_shared(day, shared)
+
+    for _ in range(30):
+        worker.reserve(1)
+    api.reserve(1)
+    sync(worker)
+    sync(api)
+    api.reserve(1)  # Spent after the exchange, not yet shared
+
+    assert api.remaining("key-aaaa") == 100 - 32
+    assert api.take_unsynced()[1] == {QuotaTracker.key_id("key-aaaa"): 1}
+    assert "key-aaaa" not in str(shared)
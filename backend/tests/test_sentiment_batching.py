@@ -0,0 +1,38 @@
+import pytest
+
+from app.core.sentiment.sentiment import _combine, _pack_batches
+from app.utils.text_utils import chunk_tokens
+
+ID2LABEL = {0: "LABEL_0", 1: "LABEL_1", 2: "LABEL_2"}
+
+
+def test_batches_respect_size_and_token_budget():
+    lengths = [5, 40, 7, 38, 6, 41, 8]
+    batches = list(_pack_batches(lengths, max_batch_size=3, max_batch_tokens=90))
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) <= 3
+        assert len(batch) * max(lengths[i] for i in batch) <= 90
+    # Texts of similar length share a batch, so short ones are not padded to a long neighbour
+    assert batches[0] == [0, 4, 2]
+
+
+def test_text_over_the_token_budget_gets_its_own_batch():
+    assert list(_pack_batches([10, 500, 12], max_batch_size=8, max_batch_tokens=100)) == [[0, 2], [1]]
+
+
+def test_single_segment_prediction_is_kept_as_is():
+    assert _combine([(12, [0.1, 0.2, 0.7])], ID2LABEL) == {"label": "LABEL_2", "score": 0.7}
+
+
+def test_segments_are_weighted_by_length():
+    combined = _combine([(300, [0.8, 0.1, 0.1]), (100, [0.0, 0.2, 0.8])], ID2LABEL)
+
+    assert combined["label"] == "LABEL_0"
+    assert combined["score"] == pytest.approx(0.6)
+
+
+def test_chunk_tokens_splits_into_full_windows():
+    assert chunk_tokens(list(range(7)), max_length=3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert chunk_tokens([], max_length=3) == []
@@ -0,0 +1,30 @@
+from app.core.sentiment.cache import SentimentCache, normalize_text
+
+
+def test_normalized_repeats_share_a_key():
+    cache = SentimentCache("model", max_entries=10)
+    assert normalize_text("  first \n") == "first"
+    assert cache.key("first") == cache.key("  first  ")
+    assert cache.key("first") != SentimentCache("other-model", max_entries=10).key("first")
+
+
+def test_lru_eviction_and_counters():
+    cache = SentimentCache("model", max_entries=2)
+    cache.put_many({"a": {"label": "positive", "score": 0.9}, "b": {"label": "neutral", "score": 0.7}})
+    assert cache.get("a") == {"label": "positive", "score": 0.9}
+
+    cache.put_many({"c": {"label": "negative", "score": 0.8}})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 2)
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    SentimentCache("model", max_entries=1, path=path).put_many({"k": {"label": "positive", "score": 0.95}})
+
+    cache = SentimentCache("model", max_entries=1, path=path)
+    assert cache.get("k") == {"label": "positive", "score": 0.95}
+    assert cache.stats()["disk_hits"] == 1
@@ -0,0 +1,53 @@
+import asyncio
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.sentiment import executor, sentiment
+
+
+class UnpicklableError(Exception):
+    def __init__(self, status_code, detail):
+        super().__init__()
+        self.status_code = status_code
+        self.detail = detail
+
+
+def test_worker_errors_survive_the_trip_back_to_the_parent(monkeypatch):
+    def fail(texts):
+        raise UnpicklableError(500, "bad comment")
+
+    monkeypatch.setattr(sentiment, "analyze_batch", fail)
+
+    with pytest.raises(RuntimeError) as raised:
+        executor._analyze_in_worker(["text"])
+
+    restored = pickle.loads(pickle.dumps(raised.value))
+    assert isinstance(restored, RuntimeError)
+    assert "UnpicklableError" in str(restored)
+
+
+def test_worker_counters_come_back_with_every_batch(monkeypatch):
+    monkeypatch.setattr(sentiment, "analyze_batch", lambda texts: [{"label": "positive", "score": 0.9} for _ in texts])
+    monkeypatch.setattr(executor, "get_executor", lambda: ThreadPoolExecutor(max_workers=1))
+    monkeypatch.setattr(executor, "_worker_stats", {})
+
+    results = asyncio.run(executor.analyze_batch_async(["a", "b"]))
+
+    assert results == [{"label": "positive", "score": 0.9}] * 2
+    [stats] = executor.worker_stats().values()
+    assert set(stats["cache"]) >= {"hits", "misses", "hit_rate"}
+    assert 0 < stats["padding_efficiency"] <= 1
+
+
+def test_successful_batch_clears_a_failed_warm_up(monkeypatch):
+    monkeypatch.setattr(sentiment, "analyze_batch", lambda texts: [{"label": "neutral", "score": 0.7} for _ in texts])
+    monkeypatch.setattr(executor, "get_executor", lambda: ThreadPoolExecutor(max_workers=1))
+    monkeypatch.setattr(executor, "_warmup_error", "OSError('model not found')")
+    monkeypatch.setattr(executor, "_ready", False)
+
+    asyncio.run(executor.analyze_batch_async(["a"]))
+
+    assert executor.is_ready()
+    assert executor.warmup_error() is None
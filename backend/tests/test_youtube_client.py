@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from app.core.integrations.youtube.async_youtube_client import AsyncYouTubeClient, YouTubeAPIError
+
+
+def make_client(server, **kwargs):
+    options = {"max_concurrent_videos": 2, "page_prefetch": 2}
+    options.update(kwargs)
+    return AsyncYouTubeClient(api_keys=["test-key"], base_url=server.base_url, **options)
+
+
+def test_fetch_video_data(fake_youtube):
+    async def scenario():
+        client = make_client(fake_youtube)
+        try:
+            video = await client.fetch_video_data("abc")
+            assert video["snippet"]["title"] == "Video abc"
+            with pytest.raises(ValueError):
+                await client.fetch_video_data("missing")
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    assert fake_youtube.requests[0][1]["key"] == "test-key"
+
+
+def test_iter_comment_pages_walks_every_page(fake_youtube):
+    async def scenario():
+        client = make_client(fake_youtube)
+        try:
+            pages = [page async for page in client.iter_comment_pages("abc", max_results=10)]
+        finally:
+            await client.close()
+        return pages
+
+    pages = asyncio.run(scenario())
+    comments = [comment for page, _ in pages for comment in page]
+
+    assert [token for _, token in pages] == ["10", "20", None]
+    assert len({comment["id"] for comment in comments}) == fake_youtube.comments_per_video
+    assert comments[0]["text"] == "comment 0"
+    assert comments[0]["authorChannelId"] == "channel-0"
+
+
+def test_iter_comment_pages_does_not_prefetch_past_max_pages(fake_youtube):
+    async def scenario():
+        client = make_client(fake_youtube, page_prefetch=2)
+        try:
+            pages = [page async for page in client.iter_comment_pages("abc", max_results=5, max_pages=2)]
+            await asyncio.sleep(0.1)  # Give a runaway prefetch the chance to show up
+        finally:
+            await client.close()
+        return pages
+
+    pages = asyncio.run(scenario())
+
+    assert [token for _, token in pages] == ["5", "10"]
+    assert len([path for path, _ in fake_youtube.requests if path.endswith("/commentThreads")]) == 2
+
+
+def test_concurrent_videos(fake_youtube):
+    async def collect(client, video_id):
+        return [c for page, _ in [p async for p in client.iter_comment_pages(video_id, max_results=10)] for c in page]
+
+    async def scenario():
+        client = make_client(fake_youtube, max_concurrent_videos=2)
+        try:
+            return await asyncio.gather(*(collect(client, f"video{i}") for i in range(4)))
+        finally:
+            await client.close()
+
+    fake_youtube.page_delay = 0.05
+    results = asyncio.run(scenario())
+    assert [len(comments) for comments in results] == [fake_youtube.comments_per_video] * 4
+    assert 1 < fake_youtube.peak_videos_in_flight <= 2
+
+
+def test_quota_is_tracked_per_key(fake_youtube):
+    async def scenario():
+        client = AsyncYouTubeClient(
+            api_keys=["key-aaaa", "key-bbbb"],
+            base_url=fake_youtube.base_url,
+            max_concurrent_videos=1,
+            page_prefetch=1,
+            daily_quota=2,
+        )
+        try:
+            async for _ in client.iter_comment_pages("abc", max_results=10):
+                pass
+            return client.quota.report()
+        finally:
+            await client.close()
+
+    report = asyncio.run(scenario())
+    assert [params["key"] for _, params in fake_youtube.requests] == ["key-aaaa", "key-bbbb", "key-aaaa"]
+    assert report["remaining"] == 1
+
+
+def test_api_errors_are_raised(fake_youtube):
+    fake_youtube.fail_with = 403
+
+    async def scenario():
+        client = make_client(fake_youtube)
+        try:
+            async for _ in client.iter_comment_pages("abc"):
+                pass
+        finally:
+            await client.close()
+
+    with pytest.raises(YouTubeAPIError) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 403
+    assert error.value.reason == "quotaExceeded"
+
+
+def test_iter_new_comment_pages_stops_at_watermark(fake_youtube):
+    from datetime import datetime
+
+    async def scenario():
+        client = make_client(fake_youtube, page_prefetch=1)
+        try:
+            watermark = datetime(2025, 1, 1, 0, 0, 12)
+            return [page async for page in client.iter_new_comment_pages("abc", watermark, max_results=5)]
+        finally:
+            await client.close()
+
+    pages = asyncio.run(scenario())
+    comments = [comment for page in pages for comment in page]
+
+    assert [comment["id"] for comment in comments] == [f"abc-c{i}" for i in range(24, 11, -1)]
+    assert all(params.get("order") == "time" for path, params in fake_youtube.requests)
+
+
+def test_iter_new_comment_pages_skips_comments_without_a_date(fake_youtube):
+    from datetime import datetime
+
+    async def scenario():
+        client = make_client(fake_youtube, page_prefetch=1)
+        try:
+            watermark = datetime(2025, 1, 1, 0, 0, 12)
+            return [page async for page in client.iter_new_comment_pages("abc", watermark, max_results=5)]
+        finally:
+            await client.close()
+
+    fake_youtube.undated = {20, 9}
+    pages = asyncio.run(scenario())
+    comments = [comment for page in pages for comment in page]
+
+    assert [comment["id"] for comment in comments] == [f"abc-c{i}" for i in range(24, 11, -1) if i != 20]
@@ -9,7 +9,8 @@ import {
 import { VideoSummary } from "./VideoSummary";
 import { useAnalyzedVideos } from "@/hooks/useAnalyzedVideos";
 import { useNavigate } from "@tanstack/react-router";
-import { useState } from "react";
+import { useEffect, useState } from "react";
+import { usePageCursors } from "@/hooks/usePageCursors";
 
 const VIDEOS_PER_PAGE = 2;
 
@@ -55,9 +56,18 @@ const VideoPagination = ({
 export function AnalyzedVideoList() {
   const [page, setPage] = useState(1);
   const offset = (page - 1) * VIDEOS_PER_PAGE;
-  const { data, isLoading, error } = useAnalyzedVideos(offset, VIDEOS_PER_PAGE);
+  const { cursorFor, remember } = usePageCursors();
+  const { data, isLoading, error } = useAnalyzedVideos(
+    offset,
+    VIDEOS_PER_PAGE,
+    cursorFor(page)
+  );
   const navigate = useNavigate();
 
+  useEffect(() => {
+    remember(page + 1, data?.next_cursor);
+  }, [page, data?.next_cursor, remember]);
+
   if (isLoading) return <p>Loading...</p>;
   if (error) return <p className="text-red-500">Error: {error.message}</p>;
   if (!data?.videos.length) return <p>No analyzed videos found.</p>;
@@ -23,16 +23,53 @@ import {
   SelectValue,
 } from "@/components/ui/select";
 
-import { useChartData } from "@/hooks/useChartData"; // New hook we'll define
+import { useChartData } from "@/hooks/useChartData";
+import type { ChartGranularity } from "@/types/ChartDataResponse";
 
 interface CommentChartsProps {
   url: string;
 }
 
+const TIME_RANGE_DAYS: Record<string, number | undefined> = {
+  all: undefined,
+  "90d": 90,
+  "30d": 30,
+  "7d": 7,
+};
+
+function formatBucket(value: string, granularity: ChartGranularity) {
+  const date = new Date(value);
+  switch (granularity) {
+    case "hour":
+      return date.toLocaleString("en-US", {
+        month: "short",
+        day: "numeric",
+        hour: "numeric",
+      });
+    case "month":
+      return date.toLocaleDateString("en-US", {
+        month: "short",
+        year: "numeric",
+      });
+    default:
+      return date.toLocaleDateString("en-US", {
+        month: "short",
+        day: "numeric",
+      });
+  }
+}
+
 export default function CommentCharts({ url }: CommentChartsProps) {
   const [timeRange, setTimeRange] = React.useState("all");
+  const [bucket, setBucket] = React.useState<ChartGranularity | "auto">(
+    "auto"
+  );
 
-  const { data: chartResponse, isLoading, error } = useChartData(url); // Uses the chart-data?url= endpoint
+  // Buckets are counted server-side, so the response size depends on the range and bucket size only
+  const { data: chartResponse, isLoading, error } = useChartData(url, {
+    bucket: bucket === "auto" ? undefined : bucket,
+    days: TIME_RANGE_DAYS[timeRange],
+  });
 
   if (isLoading)
     return <div className="mt-8">Loading comment analytics...</div>;
@@ -42,70 +79,15 @@ export default function CommentCharts({ url }: CommentChartsProps) {
         Failed to load comment analytics: {error.message}
       </div>
     );
-  if (!chartResponse || chartResponse.comments.length === 0) return null;
+  // Hide the card for videos without comments, but keep it (and its selectors) for empty ranges
+  if (!chartResponse || (chartResponse.buckets.length === 0 && timeRange === "all"))
+    return null;
 
-  const commentsByDate = chartResponse.comments.reduce(
-    (acc, comment) => {
-      const date = comment.published_at.split("T")[0];
-      if (!acc[date]) {
-        acc[date] = {
-          date,
-          positive: 0,
-          negative: 0,
-          neutral: 0,
-          ambiguous: 0,
-        };
-      }
-
-      switch (comment.sentiment_label?.toLowerCase()) {
-        case "positive":
-          acc[date].positive += 1;
-          break;
-        case "negative":
-          acc[date].negative += 1;
-          break;
-        case "neutral":
-          acc[date].neutral += 1;
-          break;
-        default:
-          acc[date].ambiguous += 1;
-      }
-
-      return acc;
-    },
-    {} as Record<
-      string,
-      {
-        date: string;
-        positive: number;
-        negative: number;
-        neutral: number;
-        ambiguous: number;
-      }
-    >
-  );
-
-  let chartData = Object.values(commentsByDate).sort(
-    (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime()
-  );
-
-  if (timeRange !== "all") {
-    const today = new Date();
-    const startDate = new Date();
-    switch (timeRange) {
-      case "7d":
-        startDate.setDate(today.getDate() - 7);
-        break;
-      case "30d":
-        startDate.setDate(today.getDate() - 30);
-        break;
-      case "90d":
-        startDate.setDate(today.getDate() - 90);
-        break;
-    }
-
-    chartData = chartData.filter((item) => new Date(item.date) >= startDate);
-  }
+  const granularity = chartResponse.granularity;
+  const chartData = chartResponse.buckets.map(({ bucket_start, ...counts }) => ({
+    date: bucket_start,
+    ...counts,
+  }));
 
   const chartConfig = {
     sentiment: { label: "Sentiment" },
@@ -125,9 +107,29 @@ export default function CommentCharts({ url }: CommentChartsProps) {
               Sentiment analysis of comments over time
             </CardDescription>
           </div>
+          <Select
+            value={bucket}
+            onValueChange={(value) =>
+              setBucket(value as ChartGranularity | "auto")
+            }
+          >
+            <SelectTrigger
+              className="w-[140px] rounded-lg sm:ml-auto"
+              aria-label="Select bucket size"
+            >
+              <SelectValue placeholder="Auto" />
+            </SelectTrigger>
+            <SelectContent className="rounded-xl">
+              <SelectItem value="auto">Auto</SelectItem>
+              <SelectItem value="hour">Hourly</SelectItem>
+              <SelectItem value="day">Daily</SelectItem>
+              <SelectItem value="week">Weekly</SelectItem>
+              <SelectItem value="month">Monthly</SelectItem>
+            </SelectContent>
+          </Select>
           <Select value={timeRange} onValueChange={setTimeRange}>
             <SelectTrigger
-              className="w-[160px] rounded-lg sm:ml-auto"
+              className="w-[160px] rounded-lg"
               aria-label="Select time range"
             >
               <SelectValue placeholder="All time" />
@@ -211,23 +213,14 @@ export default function CommentCharts({ url }: CommentChartsProps) {
                   axisLine={false}
                   tickMargin={8}
                   minTickGap={32}
-                  tickFormatter={(value) => {
-                    const date = new Date(value);
-                    return date.toLocaleDateString("en-US", {
-                      month: "short",
-                      day: "numeric",
-                    });
-                  }}
+                  tickFormatter={(value) => formatBucket(value, granularity)}
                 />
                 <ChartTooltip
                   cursor={false}
                   content={
                     <ChartTooltipContent
                       labelFormatter={(value: string) =>
-                        new Date(value).toLocaleDateString("en-US", {
-                          month: "short",
-                          day: "numeric",
-                        })
+                        formatBucket(value, granularity)
                       }
                       indicator="dot"
                     />
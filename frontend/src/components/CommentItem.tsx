@@ -2,9 +2,24 @@ import { Card, CardContent } from "@/components/ui/card";
 
 import { useState } from "react";
 
+/**
+ * Renders backend search highlights as <mark> elements without injecting HTML:
+ * the text is split on the marker tags and every part is rendered as plain text.
+ */
+function renderHighlighted(highlighted: string) {
+  return highlighted.split(/(<mark>.*?<\/mark>)/g).map((part, index) =>
+    part.startsWith("<mark>") && part.endsWith("</mark>") ? (
+      <mark key={index}>{part.slice(6, -7)}</mark>
+    ) : (
+      part
+    )
+  );
+}
+
 interface CommentItemProps {
   author: string;
   text: string;
+  highlight?: string | null; // Text with search matches wrapped in <mark> by the backend
   likeCount: number;
   sentiment: string;
   publishedAt: string;
@@ -13,6 +28,7 @@ interface CommentItemProps {
 export function CommentItem({
   author,
   text,
+  highlight,
   likeCount,
   sentiment,
   publishedAt,
@@ -23,17 +39,19 @@ export function CommentItem({
   const shouldTruncate = text.length > previewLimit;
   const displayText =
     !expanded && shouldTruncate ? text.slice(0, previewLimit) + "..." : text;
+  // Search results show every match, so highlighted comments are not truncated
+  const content = highlight ? renderHighlighted(highlight) : displayText;
 
   return (
     <Card
-      className={`overflow-hidden transition-all duration-200 ${expanded ? "h-auto" : "h-32"}`}
+      className={`overflow-hidden transition-all duration-200 ${expanded || highlight ? "h-auto" : "h-32"}`}
     >
       <CardContent className="p-3 flex flex-col justify-between h-full">
         <div>
           <h3 className="font-semibold text-sm">{author}</h3>
           <p className="text-sm text-gray-700 dark:text-gray-300">
-            {displayText}
-            {shouldTruncate && (
+            {content}
+            {shouldTruncate && !highlight && (
               <span
                 onClick={() => setExpanded((prev) => !prev)}
                 className="ml-1 text-blue-500 hover:underline text-xs cursor-pointer"
@@ -14,6 +14,7 @@ import { Label } from "@/components/ui/label";
 import type { SentimentTotals } from "@/types/CommentsResponse"; // <--- FIX 1: Add 'type' keyword
 import { SlidersHorizontal } from "lucide-react";
 import { useComments } from "@/hooks/useComments";
+import { usePageCursors } from "@/hooks/usePageCursors";
 
 const COMMENTS_PER_PAGE = 5;
 
@@ -24,7 +25,7 @@ interface CommentSectionProps {
 export default function CommentSection({ url }: CommentSectionProps) {
   const [page, setPage] = useState(1);
   const [sortBy, setSortBy] = useState<
-    "published_at" | "like_count" | "sentiment"
+    "published_at" | "like_count" | "sentiment" | "relevance"
   >("published_at");
   const [sortOrder, setSortOrder] = useState<"desc" | "asc">("desc");
   const [keyword, setKeyword] = useState(""); // For author
@@ -33,6 +34,10 @@ export default function CommentSection({ url }: CommentSectionProps) {
     "" | "positive" | "negative" | "neutral" | "ambiguous"
   >("");
   const [minLikes, setMinLikes] = useState<number | null>(null);
+  // Cursors belong to one ordering and filter set; a new set starts without any
+  const { cursorFor, remember } = usePageCursors(
+    JSON.stringify([url, sortBy, sortOrder, keyword, phrase, sentimentFilter, minLikes])
+  );
 
   // Reset filters and page when URL changes
   useEffect(() => {
@@ -53,6 +58,7 @@ export default function CommentSection({ url }: CommentSectionProps) {
   } = useComments(url, {
     offset: (page - 1) * COMMENTS_PER_PAGE,
     limit: COMMENTS_PER_PAGE,
+    cursor: cursorFor(page), // Keyset paging when the page was reached with "next"
     sortBy,
     sortOrder,
     sentiment: sentimentFilter || undefined,
@@ -61,6 +67,10 @@ export default function CommentSection({ url }: CommentSectionProps) {
     phrase: phrase || undefined, // Pass the new phrase filter
   });
 
+  useEffect(() => {
+    remember(page + 1, commentsResponse?.next_cursor);
+  }, [page, commentsResponse?.next_cursor, remember]);
+
   // Populate sentimentCounts from sentiment_totals if available, otherwise fallback to page-level counts
   const sentimentCounts: SentimentTotals =
     commentsResponse?.sentiment_totals || {
@@ -121,6 +131,9 @@ export default function CommentSection({ url }: CommentSectionProps) {
                   <option value="published_at">Date</option>
                   <option value="like_count">Likes</option>
                   <option value="sentiment">Sentiment</option>
+                  <option value="relevance" disabled={!phrase}>
+                    Relevance (phrase search)
+                  </option>
                 </select>
                 <Label htmlFor="sortOrder">Order</Label>
                 <select
@@ -198,6 +211,7 @@ export default function CommentSection({ url }: CommentSectionProps) {
             key={comment.id}
             author={comment.author}
             text={comment.text}
+            highlight={comment.highlight}
             likeCount={comment.like_count}
             sentiment={comment.sentiment_label}
             publishedAt={comment.published_at.toISOString()}
@@ -0,0 +1,60 @@
+import type { AnalysisProgress } from "@/types/AnalysisProgress";
+import type { VideoResponse } from "@/types/VideoResponse";
+import { subscribeToProgress } from "@/services/videosApi";
+import { useQueryClient } from "@tanstack/react-query";
+import { useEffect } from "react";
+
+const LIST_REFRESH_INTERVAL = 1000 * 5; // Refresh comments and charts at most every 5 seconds
+
+/**
+ * Follows a running analysis over server-sent events instead of polling:
+ * progress is merged into the cached video analysis, and the comment and chart
+ * queries of the video are refreshed (throttled) as new comments are saved.
+ */
+export function useAnalysisProgress(
+  videoUrl: string,
+  video: VideoResponse | undefined
+) {
+  const queryClient = useQueryClient();
+  const videoId = video?.id;
+  const inProgress = video?.analysis_state === "in_progress";
+
+  useEffect(() => {
+    if (!videoId || !inProgress) return;
+
+    let lastRefresh = 0;
+    const refreshLists = () => {
+      lastRefresh = Date.now();
+      queryClient.invalidateQueries({ queryKey: ["comments", videoUrl] });
+      queryClient.invalidateQueries({ queryKey: ["chartData", videoUrl] });
+    };
+
+    return subscribeToProgress(videoId, (progress: AnalysisProgress) => {
+      if (progress.state === "completed" || progress.state === "failed") {
+        // Final totals, headline and averages are computed server-side
+        queryClient.invalidateQueries({ queryKey: ["videoAnalysis", videoUrl] });
+        refreshLists();
+        return;
+      }
+
+      queryClient.setQueryData<VideoResponse>(["videoAnalysis", videoUrl], (current) =>
+        current
+          ? {
+              ...current,
+              ...(progress.state && { analysis_state: progress.state }),
+              ...(progress.total_analyzed !== undefined && {
+                total_analyzed: progress.total_analyzed,
+              }),
+              ...(progress.sentiment_totals && {
+                sentiment_totals: progress.sentiment_totals,
+              }),
+            }
+          : current
+      );
+
+      if (Date.now() - lastRefresh > LIST_REFRESH_INTERVAL) {
+        refreshLists();
+      }
+    });
+  }, [videoId, videoUrl, inProgress, queryClient]);
+}
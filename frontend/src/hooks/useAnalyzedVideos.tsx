@@ -2,10 +2,14 @@ import type { AnalyzedVideoList } from "@/types/AnalyzedVideoList";
 import { fetchAnalyzedVideos } from "@/services/videosApi"; // Updated import path
 import { useQuery } from "@tanstack/react-query";
 
-export function useAnalyzedVideos(offset: number, limit: number) {
+export function useAnalyzedVideos(
+  offset: number,
+  limit: number,
+  cursor?: string
+) {
   return useQuery<AnalyzedVideoList, Error>({
-    queryKey: ["analyzedVideos", offset, limit],
-    queryFn: () => fetchAnalyzedVideos(offset, limit),
+    queryKey: ["analyzedVideos", offset, limit, cursor],
+    queryFn: () => fetchAnalyzedVideos(offset, limit, cursor),
     placeholderData: undefined,
     staleTime: 1000 * 60 * 3,
     refetchInterval: 1000 * 3, // Refetch every 2 second
@@ -1,13 +1,13 @@
-import type { ChartCommentsResponse } from "@/types/ChartCommentsResponse";
-import { fetchChartData } from "@/services/commentsApi"; // Updated import path
-import { useQuery } from "@tanstack/react-query";
+import type { ChartDataResponse } from "@/types/ChartDataResponse";
+import { fetchChartData, type FetchChartDataOptions } from "@/services/commentsApi"; // Updated import path
+import { keepPreviousData, useQuery } from "@tanstack/react-query";
 
-export function useChartData(url: string) {
-  return useQuery<ChartCommentsResponse, Error>({
-    queryKey: ["chartData", url],
-    queryFn: () => fetchChartData(url),
+export function useChartData(url: string, options: FetchChartDataOptions = {}) {
+  return useQuery<ChartDataResponse, Error>({
+    queryKey: ["chartData", url, options.bucket, options.days],
+    queryFn: () => fetchChartData(url, options),
     enabled: !!url,
+    placeholderData: keepPreviousData, // Keep the chart on screen while switching range or bucket
     refetchOnWindowFocus: false,
-    refetchInterval: 1000 * 3, // Refetch every 2 second
   });
 }
@@ -13,6 +13,5 @@ export function useComments(
     queryKey: ["comments", videoUrl, params],
     queryFn: () => fetchComments(videoUrl, params),
     enabled: !!videoUrl,
-    refetchInterval: 1000 * 3, // Refetch every 3 second
   });
 }
@@ -0,0 +1,33 @@
+import { useCallback, useState } from "react";
+
+type ScopedCursors = { scope: string; pages: Record<number, string> };
+
+/**
+ * Remembers the keyset cursor that starts each page, so paging forward asks the API for
+ * the rows after the last one seen instead of skipping rows with an offset.
+ * Pages reached without a cursor (e.g. a typed page number) fall back to the offset.
+ *
+ * Cursors only hold for the ordering and filters they were issued under: `scope` identifies
+ * those, and cursors stored under another scope are ignored from the very render that
+ * changes it, so a request never pairs new filters with an old cursor.
+ */
+export function usePageCursors(scope = "") {
+  const [cursors, setCursors] = useState<ScopedCursors>({ scope, pages: {} });
+
+  const remember = useCallback(
+    (page: number, cursor: string | null | undefined) => {
+      if (!cursor) return;
+      setCursors((current) => {
+        const pages = current.scope === scope ? current.pages : {};
+        if (current.scope === scope && pages[page] === cursor) return current;
+        return { scope, pages: { ...pages, [page]: cursor } };
+      });
+    },
+    [scope]
+  );
+
+  const cursorFor = (page: number) =>
+    cursors.scope === scope ? cursors.pages[page] : undefined;
+
+  return { cursorFor, remember };
+}
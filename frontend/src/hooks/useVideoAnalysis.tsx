@@ -1,12 +1,17 @@
 import type { VideoResponse } from "@/types/VideoResponse";
 import { analyzeVideo } from "@/services/videosApi"; // Updated import path
+import { useAnalysisProgress } from "@/hooks/useAnalysisProgress";
 import { useQuery } from "@tanstack/react-query";
 
 export function useVideoAnalysis(videoUrl: string) {
-  return useQuery<VideoResponse, Error>({
+  const query = useQuery<VideoResponse, Error>({
     queryKey: ["videoAnalysis", videoUrl],
     queryFn: () => analyzeVideo(videoUrl),
     enabled: !!videoUrl,
-    refetchInterval: 1000 * 3, // Refetch every 2 second
   });
+
+  // Progress of a running analysis is pushed over SSE instead of polled
+  useAnalysisProgress(videoUrl, query.data);
+
+  return query;
 }
@@ -101,6 +101,19 @@ export class ApiService {
       throw error;
     }
   }
+
+  /**
+   * Opens a server-sent event stream to the API.
+   * @param path The API endpoint path.
+   * @param params Optional query parameters.
+   * @returns An EventSource the caller must close when done.
+   */
+  public eventSource(
+    path: string,
+    params?: Record<string, string | number | boolean | undefined>
+  ): EventSource {
+    return new EventSource(this.buildUrl(path, params));
+  }
 }
 
 export const apiService = new ApiService(BACKEND_URL);
@@ -1,6 +1,6 @@
 // src/api/commentsApi.ts
 
-import type { ChartCommentsResponse } from "@/types/ChartCommentsResponse";
+import type { ChartDataResponse, ChartGranularity } from "@/types/ChartDataResponse";
 import type { Comment } from "@/types/Comment"; // Import the Comment type for transformation
 import type { CommentsResponse } from "@/types/CommentsResponse";
 import type { SentimentLabel } from "@/types/types"; // Assuming this is correct
@@ -15,9 +15,10 @@ export interface FetchCommentsOptions {
   sentiment?: SentimentLabel;
   author?: string;
   minLikes?: number;
-  sortBy?: "published_at" | "like_count" | "sentiment";
+  sortBy?: "published_at" | "like_count" | "sentiment" | "relevance";
   sortOrder?: "asc" | "desc";
-  phrase?: string;
+  phrase?: string; // Full-text search: words, "quoted phrases", OR, -excluded
+  cursor?: string; // next_cursor of the previous page; takes precedence over offset
 }
 
 /**
@@ -42,6 +43,7 @@ export async function fetchComments(
       phrase: options.phrase, // Pass phrase to backend
       sort_by: options.sortBy, // Backend expects sort_by
       sort_order: options.sortOrder, // Backend expects sort_order
+      cursor: options.cursor,
     },
   });
 
@@ -57,17 +59,23 @@ export async function fetchComments(
   };
 }
 
+export interface FetchChartDataOptions {
+  bucket?: ChartGranularity; // Omit to let the server pick one from the time span
+  days?: number; // Only comments from the last N days
+}
+
 /**
- * Fetches chart-compatible comment data for sentiment trends for a given video URL.
+ * Fetches sentiment counts per time bucket for a given video URL, aggregated server-side.
  *
  * @param url The URL of the video to fetch chart data for.
- * @returns A Promise that resolves to ChartCommentsResponse.
+ * @param options Bucket size and time range.
+ * @returns A Promise that resolves to ChartDataResponse.
  */
 export async function fetchChartData(
-  url: string
-): Promise<ChartCommentsResponse> {
-  // Assuming ChartCommentSchema.published_at is string on frontend too, no date conversion needed here.
-  return apiService.get<ChartCommentsResponse>("/chart-data", {
-    params: { url: url },
+  url: string,
+  options: FetchChartDataOptions = {}
+): Promise<ChartDataResponse> {
+  return apiService.get<ChartDataResponse>("/chart-data", {
+    params: { url: url, bucket: options.bucket, days: options.days },
   });
 }
@@ -1,5 +1,6 @@
 // src/api/videosApi.ts
 
+import type { AnalysisProgress } from "@/types/AnalysisProgress";
 import type { AnalyzedVideoList } from "@/types/AnalyzedVideoList";
 import type { VideoResponse } from "@/types/VideoResponse";
 import { apiService } from "./apiService";
@@ -20,15 +21,44 @@ export async function analyzeVideo(url: string): Promise<VideoResponse> {
 
 /**
  * Fetches a paginated list of previously analyzed videos.
+ * Pass the previous page's next_cursor to page by keyset instead of offset.
  */
 export async function fetchAnalyzedVideos(
   offset = 0,
-  limit = 25
+  limit = 25,
+  cursor?: string
 ): Promise<AnalyzedVideoList> {
   return apiService.get<AnalyzedVideoList>("/videos", {
     params: {
       offset: offset,
       limit: limit,
+      cursor: cursor, // Takes precedence over offset when set
     },
   });
 }
+
+/**
+ * Subscribes to the analysis progress of a video over server-sent events.
+ * The first event is a full snapshot; later events only carry the fields that changed.
+ * @returns A function that closes the stream.
+ */
+export function subscribeToProgress(
+  videoId: string,
+  onProgress: (progress: AnalysisProgress) => void
+): () => void {
+  const source = apiService.eventSource(
+    `/videos/${encodeURIComponent(videoId)}/progress`
+  );
+  source.addEventListener("progress", (event) => {
+    const progress: AnalysisProgress = JSON.parse((event as MessageEvent).data);
+    onProgress(progress);
+    if (
+      progress.state === "completed" ||
+      progress.state === "failed" ||
+      progress.state === null
+    ) {
+      source.close(); // The server ends the stream; stop EventSource from reconnecting
+    }
+  });
+  return () => source.close();
+}
@@ -0,0 +1,10 @@
+import type { AnalysisState, SentimentLabel } from "./types";
+
+export interface AnalysisProgress {
+  video_id: string; // Video ID
+  state?: AnalysisState | null; // Analysis state (null when the video does not exist)
+  total_analyzed?: number; // Comments analyzed so far
+  comment_count?: number; // Comments reported by YouTube (snapshot only)
+  sentiment_totals?: { [key in SentimentLabel]?: number }; // Running counts of each sentiment label
+  error?: string; // Set when the stream could not be opened for this video
+}
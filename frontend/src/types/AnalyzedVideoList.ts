@@ -19,4 +19,5 @@ export interface AnalyzedVideoList {
   limit: number;
   total: number;
   has_more: boolean;
+  next_cursor?: string | null; // Keyset cursor for the next page
 }
@@ -0,0 +1,16 @@
+export type ChartGranularity = "hour" | "day" | "week" | "month";
+
+export interface ChartBucket {
+  bucket_start: string; // UTC start of the bucket (ISO 8601)
+  positive: number;
+  neutral: number;
+  negative: number;
+  ambiguous: number;
+  average_score: number; // Mean sentiment score of the bucket's comments
+}
+
+export interface ChartDataResponse {
+  video_id: string;
+  granularity: ChartGranularity; // The one requested, or the one picked by the server
+  buckets: ChartBucket[];
+}
@@ -6,4 +6,5 @@ export interface Comment {
   sentiment_score: number; // Matches backend's 'sentiment_score'
   like_count: number;
   published_at: Date; // Use Date object for better handling in TS/JS
+  highlight?: string | null; // Text with phrase matches wrapped in <mark>, when searching
 }
@@ -16,5 +16,6 @@ export interface CommentsResponse {
   offset: number;
   limit: number;
   has_more: boolean;
+  next_cursor?: string | null; // Keyset cursor for the next page
   analysis_state: string;
 }
@@ -28,6 +28,7 @@ export interface VideoResponse {
 
   // Analysis state
   analysis_state: AnalysisState; // Current state of analysis
+  analysis_job_id?: number | null; // Queued or running analysis job shared by all viewers
   fetched_at: string; // When the video was fetched (using string for datetime)
   meta_last_update: string; // Last metadata update timestamp (using string for datetime)
   sentiment_last_update: string; // Last sentiment data update timestamp (using string for datetime)